@@ -18,7 +18,8 @@ CREATE TABLE subjects (
     name VARCHAR(100) NOT NULL,
     credits INT NOT NULL,
     professor_id VARCHAR(10),
-    FOREIGN KEY (professor_id) REFERENCES users(id)
+    FOREIGN KEY (professor_id) REFERENCES users(id),
+    INDEX ix_subjects_name (name)
 );
 
 -- 성적 테이블 생성
@@ -30,7 +31,10 @@ CREATE TABLE grades (
     score FLOAT,
     grade CHAR(2),
     FOREIGN KEY (student_id) REFERENCES users(id),
-    FOREIGN KEY (subject_code) REFERENCES subjects(code)
+    FOREIGN KEY (subject_code) REFERENCES subjects(code),
+    INDEX ix_grades_semester (semester),
+    INDEX ix_grades_subject_semester (subject_code, semester),
+    UNIQUE INDEX uq_grades_student_subject_semester (student_id, subject_code, semester)
 );
 
 -- 사용자 데이터 삽입 (비밀번호는 전부 1234로 설정, SHA-256 해싱)
@@ -2,9 +2,13 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_restx import Api
-from .config import Config
+import os
+from .config import config_by_name
+from .pool_stats import instrument_engine
+from .db_routing import RoutingSession, record_write
+from .serialization import output_json
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 jwt = JWTManager()
 
 authorizations = {
@@ -26,12 +30,22 @@ api = Api(
     authorizations=authorizations,
     security='BearerAuth'
 )
+api.representation('application/json')(output_json)
 
-def create_app():
+def create_app(config_class=None):
+    '''config_class: 설정 클래스 또는 프로필 이름 (생략 시 APP_CONFIG 환경 변수, 기본 production)'''
+    if config_class is None or isinstance(config_class, str):
+        config_class = config_by_name[config_class or os.getenv('APP_CONFIG', 'production')]
     app = Flask(__name__)
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     db.init_app(app)
+    with app.app_context():
+        pool_name = app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}).get('pool_logging_name')
+        app.extensions['pool_stats'] = instrument_engine(db.engine, pool_name)
+        if 'replica' in db.engines:
+            instrument_engine(db.engines['replica'], 'replica')
+    app.after_request(record_write)
     jwt.init_app(app)
     api.init_app(app)
 
@@ -39,14 +53,44 @@ def create_app():
     from .routes.user import ns_users
     from .routes.subject import ns_subjects
     from .routes.grade import ns_grades
+    from .routes.system import ns_system
+    from .routes.search import ns_search
+    from .routes import grade_bulk, grade_batch, grade_summary, grade_statistics, grade_policy, grade_rank  # ns_grades에 추가 라우트 등록
 
     api.add_namespace(ns_auth)
     api.add_namespace(ns_users)
     api.add_namespace(ns_subjects)
     api.add_namespace(ns_grades)
+    api.add_namespace(ns_system)
+    api.add_namespace(ns_search)
+
+    from . import token_blocklist  # JWT 폐기 목록 확인 콜백 등록
+
+    if app.config['PROFILING_ENABLED']:
+        from .profiling import init_profiling
+        with app.app_context():
+            init_profiling(app, api, db.engines.values())
+
+    if app.config['METRICS_ENABLED']:
+        from .metrics import init_metrics
+        with app.app_context():
+            init_metrics(app, api, db.engines)
+
+    from .cli import db_cli, summary_cli, tokens_cli, idempotency_cli, seed_cli
+    app.cli.add_command(db_cli)
+    app.cli.add_command(summary_cli)
+    app.cli.add_command(tokens_cli)
+    app.cli.add_command(idempotency_cli)
+    app.cli.add_command(seed_cli)
+
+    # 스키마 변경은 배포 시 `flask db upgrade`로 한 번만 적용 (앱 생성 시 DB에 연결하지 않음)
+    # 내장 SQLite 프로필(testing, benchmark)만 앱 생성 시 스키마와 초기 데이터를 준비
+    if app.config['FIXTURE_SQL_PATH']:
+        from .migrations import upgrade
+        from .fixtures import load_sql_fixtures
+        with app.app_context():
+            upgrade(db.engine)
+            load_sql_fixtures(app.config['FIXTURE_SQL_PATH'])
 
-    with app.app_context():
-        db.create_all()
-    
     return app
 
@@ -0,0 +1,87 @@
+import time
+import click
+from flask.cli import AppGroup
+from . import db
+
+# 데이터베이스 관리 명령어 (flask db ...)
+db_cli = AppGroup('db', help='데이터베이스 스키마 관리')
+
+@db_cli.command('upgrade')
+@click.option('--target', type=int, default=None, help='적용할 마지막 버전 (기본값: 최신)')
+def upgrade_command(target):
+    '''미적용 마이그레이션 적용'''
+    from .migrations import upgrade, MigrationError
+    try:
+        applied = upgrade(db.engine, target)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+    if applied:
+        click.echo(f"적용된 마이그레이션: {', '.join(str(version) for version in applied)}")
+    else:
+        click.echo("적용할 마이그레이션이 없습니다.")
+
+@db_cli.command('current')
+def current_command():
+    '''현재 스키마 버전 확인'''
+    from .migrations import current_version
+    with db.engine.connect() as conn:
+        click.echo(f"현재 스키마 버전: {current_version(conn)}")
+
+# 성적 요약 관리 명령어 (flask summary ...)
+summary_cli = AppGroup('summary', help='학생별 성적 요약 관리')
+
+@summary_cli.command('rebuild')
+@click.option('--student', 'student_ids', multiple=True, help='다시 계산할 학번 (기본값: 전체)')
+def rebuild_command(student_ids):
+    '''성적 테이블에서 학생별 학기/누적 요약을 다시 계산'''
+    from .summary import rebuild
+    rebuild(student_ids or None)
+    db.session.commit()
+    click.echo("성적 요약을 다시 계산했습니다.")
+
+# 토큰 폐기 목록 관리 명령어 (flask tokens ...)
+tokens_cli = AppGroup('tokens', help='JWT 폐기 목록 관리')
+
+@tokens_cli.command('prune')
+def prune_command():
+    '''만료된 폐기 토큰 삭제'''
+    from .token_blocklist import token_blocklist
+    token_blocklist().prune()
+    db.session.commit()
+    click.echo("만료된 폐기 토큰을 삭제했습니다.")
+
+# Idempotency-Key 응답 관리 명령어 (flask idempotency ...)
+idempotency_cli = AppGroup('idempotency', help='Idempotency-Key 응답 관리')
+
+@idempotency_cli.command('prune')
+def idempotency_prune_command():
+    '''보관 시간이 지난 응답 삭제'''
+    from .idempotency import prune
+    deleted = prune()
+    db.session.commit()
+    click.echo(f"만료된 응답 {deleted}건을 삭제했습니다.")
+
+# 합성 데이터 관리 명령어 (flask seed ...)
+seed_cli = AppGroup('seed', help='성능 측정용 합성 데이터 생성')
+
+@seed_cli.command('generate')
+@click.option('--students', type=int, default=100000, show_default=True, help='학생 수')
+@click.option('--professors', type=int, default=2000, show_default=True, help='교수 수')
+@click.option('--subjects', type=int, default=5000, show_default=True, help='과목 수')
+@click.option('--grades', type=int, default=10000000, show_default=True, help='성적 수 (학생별 수강 과목 수 평균으로 사용)')
+@click.option('--semesters', type=int, default=20, show_default=True, help='학기 수')
+@click.option('--first-year', type=int, default=2016, show_default=True, help='첫 학기의 연도')
+@click.option('--skew', type=float, default=1.1, show_default=True, help='과목 인기 분포(Zipf) 지수 (0이면 균등)')
+@click.option('--seed', type=int, default=42, show_default=True, help='난수 seed (같은 값이면 같은 데이터)')
+@click.option('--batch-size', type=int, default=5000, show_default=True, help='INSERT 배치 크기')
+def generate_command(batch_size, **options):
+    '''합성 사용자, 과목, 성적 데이터를 생성하여 입력 (flask db upgrade 이후 실행)'''
+    from .seed import generate
+    start = time.perf_counter()
+
+    def progress(counts):
+        click.echo(f"\r{', '.join(f'{table} {count}' for table, count in counts.items())}", nl=False)
+
+    counts = generate(batch_size=batch_size, progress=progress, **options)
+    click.echo(f"\n입력 완료 ({time.perf_counter() - start:.1f}s): "
+               f"{', '.join(f'{table} {count}건' for table, count in counts.items())}")
@@ -1,8 +1,12 @@
 import os
 from dotenv import load_dotenv
+from .pool_stats import InstrumentedQueuePool
 
 load_dotenv()
 
+# 저장소에 포함된 스키마/초기 데이터 스크립트
+FIXTURE_SQL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'academic_records.sql')
+
 class Config:
     DB_USERNAME = os.getenv('DB_USERNAME')
     DB_PASSWORD = os.getenv('DB_PASSWORD')
@@ -14,4 +18,120 @@ class Config:
         f"mysql+pymysql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # 커넥션 풀 설정
+    # pool_pre_ping: 대여 전 연결 확인 (유휴 후 "MySQL server has gone away" 방지)
+    # pool_recycle: MySQL wait_timeout보다 짧게 설정하여 오래된 연결 교체
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_logging_name': 'primary',
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    }
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
+
+    # 읽기 전용 복제본 (설정 시 GET 요청의 조회를 복제본에서 실행)
+    DB_REPLICA_URI = os.getenv('DB_REPLICA_URI')
+    SQLALCHEMY_BINDS = {
+        'replica': {
+            'url': DB_REPLICA_URI,
+            **SQLALCHEMY_ENGINE_OPTIONS,
+            'pool_logging_name': 'replica'
+        }
+    } if DB_REPLICA_URI else {}
+
+    # 쓰기 후 같은 사용자의 조회를 primary에서 실행하는 시간(초)
+    READ_YOUR_WRITES_WINDOW = int(os.getenv('READ_YOUR_WRITES_WINDOW', 10))
+
+    # 목록 조회 페이지 크기 (MAX_PAGE_SIZE를 넘는 limit은 잘라냄)
+    DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', 100))
+    MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', 1000))
+
+    # 여러 학생 성적 일괄 조회 최대 학생 수
+    BATCH_MAX_STUDENTS = int(os.getenv('BATCH_MAX_STUDENTS', 500))
+
+    # 성적 일괄 입력 최대 행 수, INSERT 배치 크기
+    BULK_MAX_ROWS = int(os.getenv('BULK_MAX_ROWS', 10000))
+    BULK_INSERT_BATCH_SIZE = int(os.getenv('BULK_INSERT_BATCH_SIZE', 1000))
+
+    # 과목별 성적 통계 캐시 유지 시간(초)
+    STATS_CACHE_TTL = int(os.getenv('STATS_CACHE_TTL', 60))
+
+    # 순위 조회 방식 (auto: 창 함수를 지원하는 DB면 window, 아니면 index / window / index)
+    # index는 워커별 순위 인덱스를 RANK_INDEX_TTL(초)마다 다시 만들어 다른 워커의 변경을 반영
+    RANKING_BACKEND = os.getenv('RANKING_BACKEND', 'auto').lower()
+    RANK_INDEX_TTL = int(os.getenv('RANK_INDEX_TTL', 60))
+
+    # 과목 카탈로그 캐시: 다른 워커의 과목 변경을 확인하는 주기(초)
+    SUBJECT_CATALOG_SYNC_INTERVAL = int(os.getenv('SUBJECT_CATALOG_SYNC_INTERVAL', 5))
+
+    # 사용자/과목 검색: 다른 워커의 변경을 확인하는 주기(초), 최대 결과 수
+    SEARCH_SYNC_INTERVAL = int(os.getenv('SEARCH_SYNC_INTERVAL', 5))
+    SEARCH_MAX_RESULTS = int(os.getenv('SEARCH_MAX_RESULTS', 100))
+
+    # Idempotency-Key 응답 보관 시간(초), 처리 중 표시의 유효 시간(초, 응답 저장 전에 중단된 요청을 다시 실행할 수 있게 되는 시간)
+    IDEMPOTENCY_TTL = int(os.getenv('IDEMPOTENCY_TTL', 86400))
+    IDEMPOTENCY_PENDING_TIMEOUT = int(os.getenv('IDEMPOTENCY_PENDING_TIMEOUT', 60))
+
+    # 토큰 폐기 목록을 DB와 동기화하는 주기(초)
+    BLOCKLIST_SYNC_INTERVAL = int(os.getenv('BLOCKLIST_SYNC_INTERVAL', 5))
+
+    # 조회 응답 캐시 (memory: 워커별 LRU, redis: 워커 간 공유, none: 사용 안 함)
+    # 기본값은 RESPONSE_CACHE_REDIS_URL이 설정되어 있으면 redis, 아니면 none (다중 워커에서 워커별 캐시가 따로 쌓이지 않도록)
+    RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND',
+                                       'redis' if os.getenv('RESPONSE_CACHE_REDIS_URL') else 'none').lower()
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', 30))
+    RESPONSE_CACHE_REDIS_URL = os.getenv('RESPONSE_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+    # 요청별 성능 측정 (Server-Timing 헤더, 느린 요청의 cProfile/SQL 저장)
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+    # cProfile은 요청 처리를 크게 느리게 하므로 기본은 끄고, 켜면 PROFILING_CAPTURE_SAMPLE개 요청 중 1개만 실행
+    PROFILING_CAPTURE = os.getenv('PROFILING_CAPTURE', 'false').lower() == 'true'
+    PROFILING_CAPTURE_SAMPLE = int(os.getenv('PROFILING_CAPTURE_SAMPLE', 100))
+    PROFILING_SLOW_MS = float(os.getenv('PROFILING_SLOW_MS', 1000))
+    PROFILING_DIR = os.getenv('PROFILING_DIR', 'profiles')
+    PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', 50))
+
+    # Prometheus 지표 (/metrics, prometheus_client 필요)
+    # 다중 워커에서는 PROMETHEUS_MULTIPROC_DIR 환경 변수로 워커 간 합산 디렉토리를 지정
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
+    METRICS_PATH = os.getenv('METRICS_PATH', '/metrics')
+
+    # 앱 생성 시 스키마를 만들고 입력할 초기 데이터 SQL (내장 SQLite 프로필 전용, 운영에서는 사용하지 않음)
+    FIXTURE_SQL_PATH = None
+
+# 운영: MySQL
+class ProductionConfig(Config):
+    pass
+
+# 테스트: 앱마다 새로 만드는 메모리 SQLite + academic_records.sql 데이터
+# TESTING은 켜지 않음 (예외 전파 방식이 바뀌어 운영과 다른 오류 응답이 나오므로)
+class TestingConfig(Config):
+    SQLALCHEMY_DATABASE_URI = os.getenv('TEST_DATABASE_URI', 'sqlite://')
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    SQLALCHEMY_BINDS = {}
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY') or 'testing-secret-key-do-not-use-in-production'
+    FIXTURE_SQL_PATH = FIXTURE_SQL
+    # 테스트 중 토큰 폐기 목록 동기화 쿼리가 쿼리 수 측정에 섞이지 않도록 주기를 늘림
+    BLOCKLIST_SYNC_INTERVAL = 3600
+    # 테스트는 단일 프로세스이므로 워커별 캐시를 사용
+    RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory').lower()
+
+# 벤치마크: 여러 요청이 공유하는 SQLite 파일 + academic_records.sql 데이터
+# 상대 경로는 Flask 인스턴스 폴더(instance/, .gitignore에 포함) 기준
+class BenchmarkConfig(Config):
+    SQLALCHEMY_DATABASE_URI = os.getenv('BENCHMARK_DATABASE_URI', 'sqlite:///benchmark.db')
+    SQLALCHEMY_BINDS = {}
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY') or 'benchmark-secret-key-do-not-use-in-production'
+    FIXTURE_SQL_PATH = FIXTURE_SQL
+
+# APP_CONFIG 환경 변수로 선택
+config_by_name = {
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+    'benchmark': BenchmarkConfig
+}
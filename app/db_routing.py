@@ -0,0 +1,92 @@
+import threading
+import time
+from flask import current_app, g, has_request_context, request
+from flask_jwt_extended import get_jwt_identity
+from flask_sqlalchemy.session import Session
+
+# 읽기/쓰기 분리
+# SQLALCHEMY_BINDS에 'replica'가 설정되어 있으면 GET/HEAD 요청의 조회는 복제본에서, 나머지는 기본(primary) DB에서 실행한다.
+# 쓰기 요청을 보낸 사용자는 READ_YOUR_WRITES_WINDOW 초 동안 조회도 primary에서 실행하여 복제 지연으로
+# 자신이 방금 쓴 데이터가 보이지 않는 일이 없도록 한다. 같은 워커는 메모리 기록으로, 다른 워커는 쿠키로 판단한다.
+# 인증 전 조회는 primary에서 실행하고, 복제 지연이 있으면 안 되는 조회(토큰 폐기 목록 동기화 등)는
+# bind_arguments=PRIMARY로 항상 primary에서 실행한다.
+REPLICA_BIND = 'replica'
+PRIMARY = {'use_primary': True}
+READ_METHODS = ('GET', 'HEAD')
+PRIMARY_COOKIE = 'read_primary_until'
+
+class RecentWriters:
+    '''사용자별 마지막 쓰기 시각 (워커 프로세스 내)'''
+    def __init__(self):
+        self._writes = {}
+        self._lock = threading.Lock()
+
+    def record(self, user_id, window):
+        now = time.time()
+        with self._lock:
+            self._writes[user_id] = now + window
+            # 만료된 기록 정리
+            if len(self._writes) > 10000:
+                self._writes = {key: until for key, until in self._writes.items() if until > now}
+
+    def wrote_recently(self, user_id):
+        with self._lock:
+            return self._writes.get(user_id, 0) > time.time()
+
+recent_writers = RecentWriters()
+
+def _current_user_id():
+    '''JWT 검증이 끝난 요청이면 사용자 ID, 아니면 None'''
+    try:
+        identity = get_jwt_identity()
+    except RuntimeError:
+        return None
+    return identity.split(':')[0] if identity else None
+
+def _read_from_replica():
+    if not has_request_context() or request.method not in READ_METHODS:
+        return False
+    if 'db_use_replica' in g:
+        return g.db_use_replica
+
+    try:
+        read_primary_until = float(request.cookies.get(PRIMARY_COOKIE, 0))
+    except ValueError:
+        read_primary_until = 0
+    if read_primary_until > time.time():
+        g.db_use_replica = False
+        return False
+
+    user_id = _current_user_id()
+    if user_id is None:
+        # 인증 전 조회는 primary에서 실행하되, 인증 후 조회를 위해 결정은 저장하지 않음
+        return False
+    g.db_use_replica = not recent_writers.wrote_recently(user_id)
+    return g.db_use_replica
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, use_primary=False, **kwargs):
+        if bind is None and not use_primary and not self._flushing and _read_from_replica():
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def commit(self):
+        super().commit()
+        if has_request_context():
+            g.db_committed = True
+
+def record_write(response):
+    '''커밋한 요청이 성공하면 해당 사용자를 일정 시간 primary에서 조회하도록 기록 (after_request)'''
+    if not g.get('db_committed') or response.status_code >= 400:
+        return response
+    if REPLICA_BIND not in current_app.config.get('SQLALCHEMY_BINDS', {}):
+        return response
+
+    window = current_app.config['READ_YOUR_WRITES_WINDOW']
+    user_id = _current_user_id()
+    if user_id is not None:
+        recent_writers.record(user_id, window)
+    response.set_cookie(PRIMARY_COOKIE, str(time.time() + window), max_age=window, httponly=True, samesite='Lax')
+    return response
@@ -0,0 +1,55 @@
+import hashlib
+import re
+from sqlalchemy import insert
+from .summary import rebuild as rebuild_summary
+from . import db
+
+# academic_records.sql 초기 데이터 입력
+# MySQL 없이 SQLite 등 다른 DB에서도 같은 데이터로 실행할 수 있도록, 스크립트의 INSERT 문만 읽어
+# 모델 테이블에 입력한다. 스키마는 마이그레이션으로 만들고, MySQL 전용 함수 SHA2()는 파이썬에서 계산한다.
+INSERT_PATTERN = re.compile(r"INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES(.*?);", re.S | re.I)
+VALUE_PATTERN = re.compile(
+    r"SHA2\('(?P<sha2>(?:[^']|'')*)',\s*256\)|'(?P<string>(?:[^']|'')*)'|(?P<null>NULL)|(?P<number>-?\d+(?:\.\d+)?)",
+    re.I
+)
+
+def _strip_comments(sql):
+    return '\n'.join(line for line in sql.splitlines() if not line.strip().startswith('--'))
+
+def _parse_value(match):
+    if match.group('sha2') is not None:
+        return hashlib.sha256(match.group('sha2').replace("''", "'").encode()).hexdigest()
+    if match.group('string') is not None:
+        return match.group('string').replace("''", "'")
+    if match.group('null'):
+        return None
+    number = match.group('number')
+    return float(number) if '.' in number else int(number)
+
+def parse_inserts(sql):
+    '''SQL 스크립트의 INSERT 문을 (테이블 이름, 행 dict 목록)으로 변환'''
+    for table, columns, body in INSERT_PATTERN.findall(_strip_comments(sql)):
+        columns = [column.strip() for column in columns.split(',')]
+        rows = re.findall(r"\((.*?)\)\s*(?:,|$)", body.strip(), re.S)
+        yield table, [dict(zip(columns, map(_parse_value, VALUE_PATTERN.finditer(row)))) for row in rows]
+
+def load_sql_fixtures(path):
+    '''
+    INSERT 문의 데이터를 입력하고 성적 요약을 다시 계산 (사용자가 이미 있으면 입력하지 않음)
+    입력한 행 수를 반환
+    '''
+    users = db.metadata.tables['users']
+    if db.session.execute(db.select(users.c.id).limit(1)).first():
+        return 0
+
+    with open(path, encoding='utf-8') as f:
+        sql = f.read()
+
+    count = 0
+    for table, rows in parse_inserts(sql):
+        if rows:
+            db.session.execute(insert(db.metadata.tables[table]), rows)
+            count += len(rows)
+    rebuild_summary()
+    db.session.commit()
+    return count
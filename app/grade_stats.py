@@ -0,0 +1,72 @@
+import threading
+import time
+from flask import current_app
+from sqlalchemy import select
+from .models import Grade
+from . import db
+
+# 과목/학기별 성적 통계
+# 점수 컬럼만 NumPy 배열로 읽어 한 번에 계산하고, (과목 코드, 학기)별로 캐시한다.
+# 같은 프로세스의 성적 입력/수정 시 즉시 무효화되며, 다른 워커의 변경은 STATS_CACHE_TTL 이내에 반영된다.
+# NumPy는 앱 시작 시간을 줄이기 위해 통계를 처음 계산할 때 가져온다.
+PERCENTILES = [10, 25, 50, 75, 90]
+HISTOGRAM_EDGES = [0.5 * i for i in range(10)]   # 0.0 ~ 4.5, 0.5 간격
+
+_lock = threading.Lock()
+
+def _cache():
+    return current_app.extensions.setdefault('grade_statistics', {})
+
+def compute_statistics(scores):
+    '''점수 배열의 평균, 표준편차, 중앙값, 백분위수, 히스토그램 계산'''
+    import numpy as np
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return None
+
+    percentiles = np.percentile(scores, PERCENTILES)
+    counts, edges = np.histogram(scores, bins=HISTOGRAM_EDGES)
+    return {
+        'count': int(scores.size),
+        'mean': round(float(scores.mean()), 4),
+        'std': round(float(scores.std()), 4),
+        'min': float(scores.min()),
+        'max': float(scores.max()),
+        'median': float(percentiles[PERCENTILES.index(50)]),
+        'percentiles': {f'p{q}': float(value) for q, value in zip(PERCENTILES, percentiles)},
+        'histogram': [
+            {'lower': float(lower), 'upper': float(upper), 'count': int(count)}
+            for lower, upper, count in zip(edges[:-1], edges[1:], counts)
+        ]
+    }
+
+def load_scores(subject_code, semester):
+    import numpy as np
+    result = db.session.execute(
+        select(Grade.score).where(
+            Grade.subject_code == subject_code,
+            Grade.semester == semester,
+            Grade.score.isnot(None)
+        )
+    )
+    return np.fromiter((row[0] for row in result), dtype=np.float64)
+
+def subject_statistics(subject_code, semester):
+    '''캐시된 통계를 반환하고, 없거나 만료되었으면 다시 계산'''
+    key = (subject_code, semester)
+    ttl = current_app.config['STATS_CACHE_TTL']
+    now = time.monotonic()
+
+    with _lock:
+        cached = _cache().get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    statistics = compute_statistics(load_scores(subject_code, semester))
+    with _lock:
+        _cache()[key] = (now, statistics)
+    return statistics
+
+def invalidate(subject_code, semester):
+    with _lock:
+        _cache().pop((subject_code, semester), None)
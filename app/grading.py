@@ -0,0 +1,133 @@
+from collections import Counter
+from sqlalchemy import select, update
+from .models import Grade, GradingPolicy
+from .summary import rebuild as rebuild_summary
+from .versions import bump, STUDENT, SUBJECT, SEMESTER
+from . import db
+
+# 과목별 성적 산정 정책
+# 점수(score)는 교수가 입력한 값을 그대로 두고, 정책으로 학점(grade)만 계산한다.
+# - absolute: 점수 기준 (cutoffs: [[최저 점수, 학점], ...] 높은 기준부터)
+# - relative: 석차 비율 (quotas: [[학점, 비율], ...] 높은 학점부터, 동점자는 같은 학점)
+# - zscore: 표준 점수 기준 (cutoffs: [[최저 z, 학점], ...] 높은 기준부터)
+# 어느 기준에도 해당하지 않으면 else 학점(기본 F)을 준다.
+# 과목/학기의 성적 전체를 한 번에 읽어 NumPy로 학점을 계산하고, 바뀐 행만 한 번의 일괄 UPDATE로 저장한다.
+LETTERS = ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D+', 'D', 'F']
+METHODS = ('absolute', 'relative', 'zscore')
+
+DEFAULT_RULES = {
+    'absolute': {'cutoffs': [[4.5, 'A+'], [4.0, 'A'], [3.5, 'B+'], [3.0, 'B'], [2.5, 'C+'],
+                             [2.0, 'C'], [1.5, 'D+'], [1.0, 'D']], 'else': 'F'},
+    'relative': {'quotas': [['A+', 0.1], ['A', 0.2], ['B+', 0.2], ['B', 0.2], ['C+', 0.15], ['C', 0.15]],
+                 'else': 'F'},
+    'zscore': {'cutoffs': [[1.5, 'A+'], [1.0, 'A'], [0.5, 'B+'], [0.0, 'B'], [-0.5, 'C+'],
+                           [-1.0, 'C'], [-1.5, 'D+'], [-2.0, 'D']], 'else': 'F'}
+}
+
+def _letter(value):
+    if value not in LETTERS:
+        raise ValueError(f"알 수 없는 학점입니다: {value}")
+    return value
+
+def normalize_rules(method, rules=None):
+    '''정책 기준을 검증하여 저장할 형태로 반환 (rules가 없으면 기본 기준), 잘못되면 ValueError'''
+    if method not in METHODS:
+        raise ValueError(f"정책은 {', '.join(METHODS)} 중 하나여야 합니다.")
+    if not rules:
+        return DEFAULT_RULES[method]
+    if not isinstance(rules, dict):
+        raise ValueError("기준은 객체여야 합니다.")
+
+    try:
+        if method == 'relative':
+            pairs = [[letter, float(ratio)] for letter, ratio in rules['quotas']]
+        else:
+            pairs = [[float(minimum), letter] for minimum, letter in rules['cutoffs']]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("기준 형식이 올바르지 않습니다.") from e
+    fallback = _letter(rules.get('else', 'F'))
+
+    if method == 'relative':
+        for letter, ratio in pairs:
+            _letter(letter)
+        if any(ratio <= 0 for _, ratio in pairs) or sum(ratio for _, ratio in pairs) > 1 + 1e-9:
+            raise ValueError("비율은 0보다 크고 합계가 1 이하여야 합니다.")
+        return {'quotas': pairs, 'else': fallback}
+
+    for minimum, letter in pairs:
+        _letter(letter)
+    if any(a[0] <= b[0] for a, b in zip(pairs, pairs[1:])):
+        raise ValueError("기준은 높은 값부터 중복 없이 나열해야 합니다.")
+    return {'cutoffs': pairs, 'else': fallback}
+
+def compute_letters(scores, method, rules):
+    '''점수 배열 전체의 학점을 한 번에 계산하여 학점 목록 반환'''
+    import numpy as np
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return []
+
+    if method == 'relative':
+        # 자신보다 높은 점수의 비율로 구간을 찾음 (동점자는 같은 비율)
+        higher = np.searchsorted(np.sort(-scores), -scores, side='left')
+        thresholds = np.round(np.cumsum([ratio for _, ratio in rules['quotas']]), 9)
+        index = np.searchsorted(thresholds, higher / scores.size, side='right')
+        letters = [letter for letter, _ in rules['quotas']] + [rules['else']]
+    else:
+        values = scores
+        if method == 'zscore':
+            std = scores.std()
+            values = (scores - scores.mean()) / std if std > 0 else np.zeros_like(scores)
+        # 높은 기준부터 나열되어 있으므로, 값보다 높은 기준의 개수가 해당 기준의 위치
+        minimums = np.array([minimum for minimum, _ in rules['cutoffs']])
+        index = np.searchsorted(-minimums, -values, side='left')
+        letters = [letter for _, letter in rules['cutoffs']] + [rules['else']]
+
+    return np.array(letters, dtype=object)[index].tolist()
+
+def absolute_letter(subject_code, score):
+    '''과목에 점수 기준(absolute) 정책이 있으면 점수에 해당하는 학점, 없으면 None'''
+    policy = db.session.get(GradingPolicy, subject_code)
+    if policy is None or policy.method != 'absolute' or score is None:
+        return None
+    return compute_letters([score], policy.method, policy.rules)[0]
+
+def absolute_policies(subject_codes):
+    '''과목 중 점수 기준(absolute) 정책이 있는 과목의 {과목 코드: 기준}을 한 번의 쿼리로 조회'''
+    if not subject_codes:
+        return {}
+    return {policy.subject_code: policy.rules for policy in db.session.scalars(
+        select(GradingPolicy).where(GradingPolicy.subject_code.in_(subject_codes),
+                                    GradingPolicy.method == 'absolute'))}
+
+def apply_policy(subject_code, semester, method, rules, dry_run=False):
+    '''
+    과목/학기 성적 전체에 정책을 적용 (커밋은 호출한 쪽에서 수행)
+    학점이 바뀐 행만 일괄 UPDATE하고, F 여부가 바뀐 학생의 요약을 다시 계산한다.
+    반환: 성적 수, 바뀐 성적 수, 학점별 인원 (성적이 없으면 None)
+    '''
+    rows = db.session.execute(
+        select(Grade.id, Grade.student_id, Grade.score, Grade.grade)
+        .where(Grade.subject_code == subject_code, Grade.semester == semester, Grade.score.isnot(None))
+    ).all()
+    if not rows:
+        return None
+
+    grade_ids, student_ids, scores, current = zip(*rows)
+    letters = compute_letters(scores, method, rules)
+    changes = [(grade_id, student_id, old, new)
+               for grade_id, student_id, old, new in zip(grade_ids, student_ids, current, letters) if old != new]
+
+    if changes and not dry_run:
+        db.session.execute(update(Grade), [{'id': grade_id, 'grade': new} for grade_id, _, _, new in changes])
+        # 요약은 점수와 F 여부(취득 학점)만 사용하므로 F 여부가 바뀐 학생만 다시 계산
+        rebuild_summary({student_id for _, student_id, old, new in changes if (old == 'F') != (new == 'F')})
+        bump((SUBJECT, subject_code), (SEMESTER, semester),
+             *((STUDENT, student_id) for _, student_id, _, _ in changes))
+
+    distribution = Counter(letters)
+    return {
+        'count': len(rows),
+        'changed': len(changes),
+        'distribution': {letter: distribution[letter] for letter in LETTERS if distribution[letter]}
+    }
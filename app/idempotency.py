@@ -0,0 +1,116 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from functools import wraps
+from flask import current_app, request
+from flask_restx import abort
+from flask_restx.utils import unpack
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
+from .models import IdempotencyKey
+from .serialization import dumps
+from . import db
+
+# Idempotency-Key 헤더 처리
+# 쓰기 요청에 Idempotency-Key가 있으면 핸들러를 실행하기 전에 처리 중(PENDING) 행을 입력하고(이미 있으면 실패),
+# 이 행은 핸들러의 쓰기와 같은 트랜잭션에서 커밋된다. 핸들러가 성공 응답(상태 코드 400 미만)을 반환하면
+# 그 행에 응답을 IDEMPOTENCY_TTL 초 동안 저장하고, 실패하면 행을 지운다.
+# 같은 사용자가 같은 키로 같은 요청을 다시 보내면 핸들러를 실행하지 않고 그 행으로 응답한다.
+# - 저장된 응답이 있으면 그대로 반환
+# - 처리 중이면 409 (동시에 도착한 재시도는 먼저 입력한 요청이 커밋할 때까지 행 입력에서 기다린 뒤 판단)
+# - 같은 키로 본문이 다른 요청이면 422
+# 처리 중 행은 IDEMPOTENCY_PENDING_TIMEOUT 초가 지나면 만료되어, 응답을 저장하기 전에 워커가 종료된 요청도 다시 실행할 수 있다.
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+PENDING = 0  # 처리 중 행의 status_code
+
+def _sha256(value):
+    return hashlib.sha256(value).hexdigest()
+
+def idempotent(f):
+    '''jwt_required 안쪽에 적용 (키는 사용자별로 구분)'''
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return f(*args, **kwargs)
+        if not key.strip() or len(key) > MAX_KEY_LENGTH:
+            abort(400, message=f"{IDEMPOTENCY_HEADER}는 1~{MAX_KEY_LENGTH}자여야 합니다.")
+
+        user_id = get_jwt_identity().split(':')[0]
+        key_hash = _sha256(f'{user_id}:{key}'.encode())
+        request_hash = _sha256(request.method.encode() + request.full_path.encode() + b'\n' + request.get_data())
+
+        stored = db.session.get(IdempotencyKey, key_hash)
+        if stored is not None and stored.expires_at > datetime.now():
+            return _answer(stored, request_hash)
+        if not _claim(key_hash, request_hash, expired=stored is not None):
+            # 다른 요청이 먼저 입력(또는 만료된 행을 다시 사용)했으므로 그 행으로 응답
+            db.session.rollback()
+            stored = db.session.get(IdempotencyKey, key_hash, populate_existing=True)
+            if stored is None:
+                abort(409, message=f"같은 {IDEMPOTENCY_HEADER}의 요청을 처리하고 있습니다.")
+            return _answer(stored, request_hash)
+
+        try:
+            result = f(*args, **kwargs)
+        except Exception:
+            db.session.rollback()
+            _release(key_hash)
+            raise
+        data, code, headers = unpack(result)
+        if code < 400 and not hasattr(data, 'status_code'):  # 스트리밍 등 Response 객체는 저장하지 않음
+            _store(key_hash, code, data)
+        else:
+            _release(key_hash)
+        return result
+    return wrapper
+
+def _answer(stored, request_hash):
+    '''저장된 행으로 응답 (다른 요청이면 422, 처리 중이면 409)'''
+    if stored.request_hash != request_hash:
+        abort(422, message=f"같은 {IDEMPOTENCY_HEADER}로 다른 요청을 보낼 수 없습니다.")
+    if stored.status_code == PENDING:
+        abort(409, message=f"같은 {IDEMPOTENCY_HEADER}의 요청을 처리하고 있습니다.")
+    return json.loads(stored.response), stored.status_code, {REPLAYED_HEADER: 'true'}
+
+def _claim(key_hash, request_hash, expired):
+    '''처리 중 행 입력 (커밋은 핸들러의 쓰기와 함께), 다른 요청이 먼저 입력했으면 False'''
+    now = datetime.now()
+    values = {
+        'request_hash': request_hash,
+        'status_code': PENDING,
+        'response': '',
+        'expires_at': now + timedelta(seconds=current_app.config['IDEMPOTENCY_PENDING_TIMEOUT'])
+    }
+    if expired:
+        # 만료된 행은 아직 만료된 상태일 때만 다시 사용 (동시에 다시 사용하는 요청 중 하나만 성공)
+        return db.session.execute(update(IdempotencyKey).where(
+            IdempotencyKey.key == key_hash, IdempotencyKey.expires_at <= now
+        ).values(values)).rowcount == 1
+    try:
+        db.session.execute(insert(IdempotencyKey).values(key=key_hash, **values))
+    except IntegrityError:
+        return False
+    return True
+
+def _store(key_hash, code, data):
+    '''처리 중 행에 응답 저장'''
+    db.session.execute(update(IdempotencyKey).where(IdempotencyKey.key == key_hash).values(
+        status_code=code,
+        response=dumps(data).decode('utf-8'),
+        expires_at=datetime.now() + timedelta(seconds=current_app.config['IDEMPOTENCY_TTL'])
+    ))
+    db.session.commit()
+
+def _release(key_hash):
+    '''실패한 요청의 처리 중 행 삭제 (핸들러가 커밋하지 않았으면 이미 롤백되어 없음)'''
+    db.session.execute(delete(IdempotencyKey).where(IdempotencyKey.key == key_hash,
+                                                    IdempotencyKey.status_code == PENDING))
+    db.session.commit()
+
+def prune():
+    '''만료된 응답 삭제 (커밋은 호출한 쪽에서 수행), 삭제한 행 수 반환'''
+    return db.session.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now())).rowcount
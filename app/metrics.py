@@ -0,0 +1,115 @@
+import os
+import time
+from flask import Response, g, request
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram,
+                               REGISTRY, generate_latest, multiprocess)
+
+# Prometheus 지표 (METRICS_ENABLED일 때만 import, prometheus_client 필요)
+# 지표 객체는 프로세스에 하나씩만 만들 수 있으므로 모듈 전역으로 두고, 앱마다 라벨 값으로 구분한다.
+# gunicorn 등 다중 워커에서는 PROMETHEUS_MULTIPROC_DIR을 지정하면 워커별 값이 파일(mmap)로 기록되고,
+# /metrics 요청을 받은 워커가 모든 워커의 파일을 합산해 반환한다. (종료된 워커 정리는 gunicorn.conf.py 참고)
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'API 요청 처리 시간',
+    ['namespace', 'resource', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+REQUESTS = Counter(
+    'http_requests', 'API 요청 수 (응답 상태 코드별)',
+    ['namespace', 'resource', 'method', 'status'])
+DB_STATEMENTS = Counter(
+    'db_statements', '실행한 SQL 문 수',
+    ['engine'])
+DB_STATEMENT_LATENCY = Histogram(
+    'db_statement_duration_seconds', 'SQL 문 실행 시간',
+    ['engine'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0))
+# 풀 게이지는 워커별 값을 더해서 보고 (종료된 워커 값은 제외)
+POOL_SIZE = Gauge(
+    'db_pool_size', '커넥션 풀 크기 (워커 합계)',
+    ['engine'], multiprocess_mode='livesum')
+POOL_OPEN = Gauge(
+    'db_pool_connections_open', '열려 있는 DB 연결 수 (워커 합계)',
+    ['engine'], multiprocess_mode='livesum')
+POOL_CHECKED_OUT = Gauge(
+    'db_pool_connections_checked_out', '사용 중인 DB 연결 수 (워커 합계)',
+    ['engine'], multiprocess_mode='livesum')
+LOGINS = Counter(
+    'auth_logins', '로그인 시도 수 (결과별)',
+    ['result'])
+
+# 라벨이 붙은 자식 지표 캐시
+# labels()는 호출마다 지표의 잠금을 잡으므로, 한 번 만든 자식 지표는 dict 조회로 재사용한다.
+_children = {}
+
+def _child(metric, *labels):
+    key = (metric, labels)
+    child = _children.get(key)
+    if child is None:
+        child = _children.setdefault(key, metric.labels(*labels))
+    return child
+
+def record_login(result):
+    '''로그인 결과 기록 (success, unknown_user, bad_password, role_mismatch)'''
+    _child(LOGINS, result).inc()
+
+def _resource_labels(app):
+    '''요청을 처리한 (네임스페이스, 리소스) 이름, 라우트에 맞지 않은 요청은 (none, none)'''
+    view = app.view_functions.get(request.endpoint)
+    resource = getattr(view, 'view_class', None)
+    if resource is None:
+        return ('none', request.endpoint or 'none')
+    return (app.extensions['metrics_namespaces'].get(resource, 'none'), resource.__name__)
+
+def _instrument_engine(name, engine):
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_start = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _child(DB_STATEMENTS, name).inc()
+        _child(DB_STATEMENT_LATENCY, name).observe(time.perf_counter() - context._metrics_start)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+    open_connections = _child(POOL_OPEN, name)
+    checked_out = _child(POOL_CHECKED_OUT, name)
+    event.listen(engine, 'connect', lambda *args: open_connections.inc())
+    event.listen(engine, 'close', lambda *args: open_connections.dec())
+    event.listen(engine, 'checkout', lambda *args: checked_out.inc())
+    event.listen(engine, 'checkin', lambda *args: checked_out.dec())
+    if isinstance(engine.pool, QueuePool):
+        _child(POOL_SIZE, name).set(engine.pool.size())
+
+def metrics_view():
+    '''Prometheus 텍스트 형식 지표 (다중 워커 모드면 모든 워커의 값을 합산)'''
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+def init_metrics(app, api, engines):
+    '''engines: {바인드 키: 엔진} (기본 엔진의 키는 None)'''
+    app.extensions['metrics_namespaces'] = {
+        route.resource: namespace.name for namespace in api.namespaces for route in namespace.resources
+    }
+    for key, engine in engines.items():
+        _instrument_engine(key or 'default', engine)
+
+    app.add_url_rule(app.config['METRICS_PATH'], 'metrics', metrics_view)
+
+    @app.before_request
+    def start_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        start = g.pop('metrics_start', None)
+        if start is None or request.endpoint == 'metrics':
+            return response
+        namespace, resource = _resource_labels(app)
+        _child(REQUEST_LATENCY, namespace, resource, request.method).observe(time.perf_counter() - start)
+        _child(REQUESTS, namespace, resource, request.method, str(response.status_code)).inc()
+        return response
@@ -0,0 +1,54 @@
+import importlib
+import pkgutil
+from datetime import datetime
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, inspect, select
+
+# 버전 관리 마이그레이션
+# app/migrations/v0001_*.py 형태의 모듈을 버전 순서대로 적용하고, 적용된 버전은 schema_migrations 테이블에 기록한다.
+# 각 모듈은 version, description, upgrade(conn)을 정의한다.
+# 데이터 때문에 적용할 수 없으면 마이그레이션은 변경 전에 MigrationError로 중단한다.
+MIGRATION_TABLE = 'schema_migrations'
+
+class MigrationError(RuntimeError):
+    '''데이터 정리가 필요하여 마이그레이션을 적용할 수 없음'''
+
+_metadata = MetaData()
+schema_migrations = Table(
+    MIGRATION_TABLE, _metadata,
+    Column('version', Integer, primary_key=True),
+    Column('description', String(200), nullable=False),
+    Column('applied_at', DateTime, nullable=False)
+)
+
+def load_migrations():
+    migrations = []
+    for module_info in pkgutil.iter_modules(__path__):
+        if module_info.name.startswith('v'):
+            migrations.append(importlib.import_module(f'{__name__}.{module_info.name}'))
+    return sorted(migrations, key=lambda migration: migration.version)
+
+def current_version(conn):
+    if not inspect(conn).has_table(MIGRATION_TABLE):
+        return 0
+    versions = conn.execute(select(schema_migrations.c.version)).scalars().all()
+    return max(versions, default=0)
+
+def upgrade(engine, target=None):
+    '''아직 적용되지 않은 마이그레이션을 순서대로 적용하고 적용된 버전 목록을 반환'''
+    applied = []
+    with engine.begin() as conn:
+        schema_migrations.create(conn, checkfirst=True)
+        version = current_version(conn)
+
+    for migration in load_migrations():
+        if migration.version <= version or (target is not None and migration.version > target):
+            continue
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now()
+            ))
+        applied.append(migration.version)
+    return applied
@@ -0,0 +1,38 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, Float, Enum, ForeignKey
+
+# 초기 스키마 (academic_records.sql로 이미 생성된 테이블은 건너뜀)
+version = 1
+description = 'users, subjects, grades 테이블 생성'
+
+metadata = MetaData()
+
+Table(
+    'users', metadata,
+    Column('id', String(10), primary_key=True),
+    Column('role', Enum('student', 'professor', 'admin', name='role_enum'), nullable=False),
+    Column('name', String(50), nullable=False),
+    Column('department', String(50)),
+    Column('admission_year', Integer, nullable=False),
+    Column('password_hash', String(255), nullable=False)
+)
+
+Table(
+    'subjects', metadata,
+    Column('code', String(10), primary_key=True),
+    Column('name', String(100), nullable=False),
+    Column('credits', Integer, nullable=False),
+    Column('professor_id', String(10), ForeignKey('users.id'))
+)
+
+Table(
+    'grades', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=True),
+    Column('student_id', String(10), ForeignKey('users.id')),
+    Column('subject_code', String(10), ForeignKey('subjects.code')),
+    Column('semester', String(6)),
+    Column('score', Float),
+    Column('grade', String(2))
+)
+
+def upgrade(conn):
+    metadata.create_all(conn, checkfirst=True)
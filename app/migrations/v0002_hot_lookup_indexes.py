@@ -0,0 +1,52 @@
+from sqlalchemy import MetaData, Table, Index, inspect, select, func
+from . import MigrationError
+
+# 자주 조회되는 컬럼 인덱스
+# - subjects.name: 과목명으로 조회 (GradesBySubject, SubjectUpdateAndDelete)
+# - grades.semester: 학기별 성적 조회
+# - grades(subject_code, semester): 과목/학기별 성적 조회
+# - grades(student_id, subject_code, semester): 성적 입력/수정 시 중복 확인, 학생별 성적 조회
+# 이전 버전의 성적 입력은 확인 후 입력하여 같은 학생/과목/학기 성적이 중복 저장되었을 수 있다.
+# MySQL의 DDL은 트랜잭션으로 되돌릴 수 없으므로, 인덱스를 만들기 전에 중복을 확인하고 있으면 아무것도 만들지 않고 중단한다.
+version = 2
+description = '과목명, 학기, 과목/학기, 학생/과목/학기 인덱스 추가'
+
+INDEXES = [
+    ('subjects', 'ix_subjects_name', ['name'], False),
+    ('grades', 'ix_grades_semester', ['semester'], False),
+    ('grades', 'ix_grades_subject_semester', ['subject_code', 'semester'], False),
+    ('grades', 'uq_grades_student_subject_semester', ['student_id', 'subject_code', 'semester'], True),
+]
+
+MAX_REPORTED_DUPLICATES = 20
+
+def check_duplicates(conn, inspector, metadata):
+    '''아직 없는 고유 인덱스의 키가 중복된 행이 있으면 중복 키 목록과 함께 MigrationError'''
+    for table_name, index_name, columns, unique in INDEXES:
+        if not unique or index_name in {index['name'] for index in inspector.get_indexes(table_name)}:
+            continue
+        table = Table(table_name, metadata, autoload_with=conn)
+        key = [table.c[column] for column in columns]
+        duplicates = conn.execute(
+            select(*key, func.count()).group_by(*key).having(func.count() > 1)
+            .order_by(*key).limit(MAX_REPORTED_DUPLICATES + 1)
+        ).all()
+        if duplicates:
+            listed = '\n'.join(f"  ({', '.join(map(str, row[:-1]))}): {row[-1]}건"
+                               for row in duplicates[:MAX_REPORTED_DUPLICATES])
+            more = '\n  ...' if len(duplicates) > MAX_REPORTED_DUPLICATES else ''
+            raise MigrationError(
+                f"{table_name}({', '.join(columns)})에 중복된 행이 있어 {index_name}를 만들 수 없습니다. "
+                f"중복을 정리한 뒤 다시 실행하세요.\n{listed}{more}"
+            )
+
+def upgrade(conn):
+    inspector = inspect(conn)
+    metadata = MetaData()
+    check_duplicates(conn, inspector, metadata)
+    for table_name, index_name, columns, unique in INDEXES:
+        existing = {index['name'] for index in inspector.get_indexes(table_name)}
+        if index_name in existing:
+            continue
+        table = Table(table_name, metadata, autoload_with=conn)
+        Index(index_name, *[table.c[column] for column in columns], unique=unique).create(conn)
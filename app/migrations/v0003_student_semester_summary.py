@@ -0,0 +1,34 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, Float, ForeignKey, text
+
+# 학생별 학기/누적 성적 요약 테이블 생성 및 기존 성적으로 채우기
+version = 3
+description = 'student_semester_summary 테이블 추가'
+
+metadata = MetaData()
+
+student_semester_summary = Table(
+    'student_semester_summary', metadata,
+    Column('student_id', String(10), ForeignKey('users.id'), primary_key=True),
+    Column('semester', String(6), primary_key=True),
+    Column('credits_attempted', Integer, nullable=False, default=0),
+    Column('credits_earned', Integer, nullable=False, default=0),
+    Column('grade_points', Float, nullable=False, default=0.0)
+)
+
+AGGREGATE = """
+    SELECT g.student_id, {semester}, SUM(s.credits),
+           SUM(CASE WHEN g.grade = 'F' THEN 0 ELSE s.credits END),
+           SUM(g.score * s.credits)
+    FROM grades g JOIN subjects s ON g.subject_code = s.code
+    WHERE g.score IS NOT NULL
+    GROUP BY {group_by}
+"""
+
+def upgrade(conn):
+    Table('users', metadata, autoload_with=conn)
+    student_semester_summary.create(conn, checkfirst=True)
+    columns = "(student_id, semester, credits_attempted, credits_earned, grade_points)"
+    conn.execute(text(f"INSERT INTO student_semester_summary {columns}"
+                      + AGGREGATE.format(semester='g.semester', group_by='g.student_id, g.semester')))
+    conn.execute(text(f"INSERT INTO student_semester_summary {columns}"
+                      + AGGREGATE.format(semester="'TOTAL'", group_by='g.student_id')))
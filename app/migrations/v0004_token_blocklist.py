@@ -0,0 +1,29 @@
+from sqlalchemy import MetaData, Table, Column, String, DateTime, ForeignKey, Index
+
+# JWT 폐기 목록 테이블 생성
+version = 4
+description = 'revoked_tokens, user_token_revocations 테이블 추가'
+
+metadata = MetaData()
+
+revoked_tokens = Table(
+    'revoked_tokens', metadata,
+    Column('jti', String(36), primary_key=True),
+    Column('expires_at', DateTime, nullable=False),
+    Column('revoked_at', DateTime, nullable=False),
+    Index('ix_revoked_tokens_expires_at', 'expires_at'),
+    Index('ix_revoked_tokens_revoked_at', 'revoked_at')
+)
+
+user_token_revocations = Table(
+    'user_token_revocations', metadata,
+    Column('user_id', String(10), ForeignKey('users.id'), primary_key=True),
+    Column('revoked_before', DateTime, nullable=False),
+    Column('revoked_at', DateTime, nullable=False),
+    Index('ix_user_token_revocations_revoked_at', 'revoked_at')
+)
+
+def upgrade(conn):
+    Table('users', metadata, autoload_with=conn)
+    revoked_tokens.create(conn, checkfirst=True)
+    user_token_revocations.create(conn, checkfirst=True)
@@ -0,0 +1,17 @@
+from sqlalchemy import MetaData, Table, Column, String, BigInteger
+
+# 조건부 조회(ETag)용 변경 버전 테이블 생성
+version = 5
+description = 'data_versions 테이블 추가'
+
+metadata = MetaData()
+
+data_versions = Table(
+    'data_versions', metadata,
+    Column('scope', String(20), primary_key=True),
+    Column('name', String(100), primary_key=True),
+    Column('version', BigInteger, nullable=False, default=0)
+)
+
+def upgrade(conn):
+    data_versions.create(conn, checkfirst=True)
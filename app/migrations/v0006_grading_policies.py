@@ -0,0 +1,19 @@
+from sqlalchemy import MetaData, Table, Column, String, JSON, ForeignKey
+
+# 과목별 성적 산정 정책 테이블 생성
+version = 6
+description = 'grading_policies 테이블 추가'
+
+metadata = MetaData()
+
+grading_policies = Table(
+    'grading_policies', metadata,
+    Column('subject_code', String(10), ForeignKey('subjects.code', ondelete='CASCADE', onupdate='CASCADE'),
+           primary_key=True),
+    Column('method', String(20), nullable=False),
+    Column('rules', JSON, nullable=False)
+)
+
+def upgrade(conn):
+    Table('subjects', metadata, autoload_with=conn)
+    grading_policies.create(conn, checkfirst=True)
@@ -0,0 +1,21 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, Text, DateTime, Index
+
+# Idempotency-Key 응답 저장 테이블 생성
+# grades의 (student_id, subject_code, semester) 고유 인덱스는 v0002에서 추가되어 성적 upsert의 충돌 키로 사용한다.
+version = 7
+description = 'idempotency_keys 테이블 추가'
+
+metadata = MetaData()
+
+idempotency_keys = Table(
+    'idempotency_keys', metadata,
+    Column('key', String(64), primary_key=True),
+    Column('request_hash', String(64), nullable=False),
+    Column('status_code', Integer, nullable=False),
+    Column('response', Text, nullable=False),
+    Column('expires_at', DateTime, nullable=False),
+    Index('ix_idempotency_keys_expires_at', 'expires_at')
+)
+
+def upgrade(conn):
+    idempotency_keys.create(conn, checkfirst=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import inspect, text
+
+# 성적 upsert가 덮어쓴 점수/학점을 같은 문장의 결과로 돌려받기 위한 컬럼 추가
+# 성적 입력(POST /grades/)은 충돌 시 기존 점수/학점을 previous_score, previous_grade로 옮기고 새 값을 저장하므로,
+# 이전 값을 따로 잠가 읽지 않고 요약의 변경분을 계산한다. 새로 입력된 행은 NULL이다.
+# nullable 컬럼을 끝에 추가하므로 MySQL 8.0에서는 테이블을 다시 쓰지 않는다 (ALGORITHM=INSTANT).
+version = 8
+description = 'grades.previous_score, grades.previous_grade 컬럼 추가'
+
+COLUMNS = [
+    ('previous_score', 'FLOAT'),
+    ('previous_grade', 'VARCHAR(2)'),
+]
+
+def upgrade(conn):
+    existing = {column['name'] for column in inspect(conn).get_columns('grades')}
+    for name, type_ in COLUMNS:
+        if name not in existing:
+            conn.execute(text(f'ALTER TABLE grades ADD COLUMN {name} {type_} NULL'))
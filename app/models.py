@@ -29,6 +29,10 @@ class Subject(db.Model):
     professor_id = db.Column(db.String(10), db.ForeignKey('users.id')) 
 
     grades = db.relationship('Grade', backref='subject', lazy=True)
+
+    __table_args__ = (
+        db.Index('ix_subjects_name', 'name'),
+    )
     
 # 데이터베이스 grades 테이블
 class Grade(db.Model):
@@ -39,6 +43,15 @@ class Grade(db.Model):
     semester = db.Column(db.String(6)) 
     score = db.Column(db.Float) 
     grade = db.Column(db.String(2)) 
+    # 성적 입력 upsert가 덮어쓴 점수/학점 (새로 입력된 행은 NULL)
+    previous_score = db.Column(db.Float)
+    previous_grade = db.Column(db.String(2))
+
+    __table_args__ = (
+        db.Index('ix_grades_semester', 'semester'),
+        db.Index('ix_grades_subject_semester', 'subject_code', 'semester'),
+        db.Index('uq_grades_student_subject_semester', 'student_id', 'subject_code', 'semester', unique=True),
+    )
 
     def to_dict(self):
         return {
@@ -48,4 +61,76 @@ class Grade(db.Model):
             'semester': self.semester,
             'score': self.score,
             'grade': self.grade
-        }
\ No newline at end of file
+        }
+
+# 데이터베이스 student_semester_summary 테이블
+# 학생별 학기 성적 요약 (semester가 'TOTAL'인 행은 누적 요약)
+class StudentSemesterSummary(db.Model):
+    __tablename__ = 'student_semester_summary'
+    student_id = db.Column(db.String(10), db.ForeignKey('users.id'), primary_key=True)
+    semester = db.Column(db.String(6), primary_key=True)
+    credits_attempted = db.Column(db.Integer, nullable=False, default=0)
+    credits_earned = db.Column(db.Integer, nullable=False, default=0)
+    grade_points = db.Column(db.Float, nullable=False, default=0.0)
+
+    @property
+    def gpa(self):
+        if not self.credits_attempted:
+            return None
+        return round(self.grade_points / self.credits_attempted, 2)
+
+    def to_dict(self):
+        return {
+            'semester': self.semester,
+            'credits_attempted': self.credits_attempted,
+            'credits_earned': self.credits_earned,
+            'gpa': self.gpa
+        }
+
+# 데이터베이스 revoked_tokens 테이블 (로그아웃 등으로 폐기된 토큰)
+class RevokedToken(db.Model):
+    __tablename__ = 'revoked_tokens'
+    jti = db.Column(db.String(36), primary_key=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    revoked_at = db.Column(db.DateTime, nullable=False, index=True)
+
+# 데이터베이스 user_token_revocations 테이블 (revoked_before 이전에 발급된 사용자의 모든 토큰 폐기)
+class UserTokenRevocation(db.Model):
+    __tablename__ = 'user_token_revocations'
+    user_id = db.Column(db.String(10), db.ForeignKey('users.id'), primary_key=True)
+    revoked_before = db.Column(db.DateTime, nullable=False)
+    revoked_at = db.Column(db.DateTime, nullable=False, index=True)
+
+# 데이터베이스 data_versions 테이블
+# 데이터 변경 시 증가하는 버전 번호 (예: ('student', '2020001'), ('catalog', 'subjects'))
+class DataVersion(db.Model):
+    __tablename__ = 'data_versions'
+    scope = db.Column(db.String(20), primary_key=True)
+    name = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+# 데이터베이스 grading_policies 테이블
+# 과목별 성적 산정 정책 (method: absolute, relative, zscore / rules: 정책별 기준, app/grading.py 참고)
+class GradingPolicy(db.Model):
+    __tablename__ = 'grading_policies'
+    subject_code = db.Column(db.String(10), db.ForeignKey('subjects.code', ondelete='CASCADE', onupdate='CASCADE'),
+                             primary_key=True)
+    method = db.Column(db.String(20), nullable=False)
+    rules = db.Column(db.JSON, nullable=False)
+
+    def to_dict(self):
+        return {
+            'subject_code': self.subject_code,
+            'method': self.method,
+            'rules': self.rules
+        }
+
+# 데이터베이스 idempotency_keys 테이블
+# Idempotency-Key 헤더로 보낸 쓰기 요청의 응답 (key: 사용자 ID와 키의 SHA-256, request_hash: 요청 본문의 SHA-256)
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+    key = db.Column(db.String(64), primary_key=True)
+    request_hash = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer, nullable=False)
+    response = db.Column(db.Text, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
@@ -0,0 +1,39 @@
+from flask import current_app
+from flask_restx import reqparse, abort
+
+# 커서 기반 페이지네이션
+# ?limit=&after= 로 요청하며, after에는 이전 응답의 next 값을 그대로 전달한다.
+# 정렬 기준 컬럼(기본 키 등)보다 큰 값만 조회하므로 페이지 위치와 관계없이 일정한 비용으로 조회된다.
+pagination_parser = reqparse.RequestParser()
+pagination_parser.add_argument('limit', type=int, location='args', help='페이지 크기 (서버 최대값으로 제한)')
+pagination_parser.add_argument('after', type=str, location='args', help='이전 페이지의 next 커서')
+
+def page_args():
+    '''요청에서 (limit, after)를 읽고 limit을 서버 최대 페이지 크기로 제한'''
+    args = pagination_parser.parse_args()
+    limit = args['limit'] if args['limit'] is not None else current_app.config['DEFAULT_PAGE_SIZE']
+    if limit < 1:
+        abort(400, message="limit은 1 이상이어야 합니다.")
+    return min(limit, current_app.config['MAX_PAGE_SIZE']), args['after']
+
+def paginate(query, key_column, limit, after, key=None, cast=str):
+    '''
+    key_column 오름차순으로 after 다음부터 limit개를 조회하여 (rows, next_cursor)를 반환
+    key: 조회된 행에서 커서 값을 꺼내는 함수 (기본값: key_column과 같은 이름의 속성)
+    '''
+    if after is not None:
+        try:
+            after = cast(after)
+        except ValueError:
+            abort(400, message="잘못된 커서입니다.")
+        query = query.filter(key_column > after)
+
+    # 다음 페이지 존재 여부를 확인하기 위해 한 건 더 조회
+    rows = query.order_by(key_column).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    cursor = key(last) if key else getattr(last, key_column.key)
+    return rows, str(cursor)
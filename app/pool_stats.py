@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+# 커넥션 풀 상태 측정
+# 커넥션 생성/종료(교체 빈도), 대여/반납, 무효화 횟수와 풀에서 커넥션을 얻기까지 기다린 시간을 기록한다.
+# 값은 워커 프로세스별로 유지되므로 응답에 pid를 함께 포함한다.
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self, pool):
+        with self._lock:
+            data = {
+                'pid': os.getpid(),
+                'connects': self.connects,
+                'closes': self.closes,
+                'invalidations': self.invalidations,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'wait_count': self.wait_count,
+                'wait_total_ms': round(self.wait_total * 1000, 3),
+                'wait_avg_ms': round(self.wait_total * 1000 / self.wait_count, 3) if self.wait_count else 0.0,
+                'wait_max_ms': round(self.wait_max * 1000, 3)
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                'pool_size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': pool.overflow()
+            })
+        return data
+
+# 풀 이름(pool_logging_name)별 측정값
+_registry = {}
+_registry_lock = threading.Lock()
+
+def pool_stats(name='default'):
+    with _registry_lock:
+        return _registry.setdefault(name or 'default', PoolStats())
+
+# 커넥션 대여 대기 시간을 측정하는 QueuePool
+# 풀이 다시 만들어져도(dispose) 같은 pool_logging_name으로 같은 측정값에 기록된다.
+class InstrumentedQueuePool(QueuePool):
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_stats(self._orig_logging_name).record_wait(time.perf_counter() - start)
+
+def instrument_engine(engine, name='default'):
+    '''엔진의 풀 이벤트에 측정 콜백 연결'''
+    stats = pool_stats(name)
+    event.listen(engine, 'connect', lambda *args: stats.increment('connects'))
+    event.listen(engine, 'close', lambda *args: stats.increment('closes'))
+    event.listen(engine, 'invalidate', lambda *args: stats.increment('invalidations'))
+    event.listen(engine, 'checkout', lambda *args: stats.increment('checkouts'))
+    event.listen(engine, 'checkin', lambda *args: stats.increment('checkins'))
+    return stats
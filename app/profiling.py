@@ -0,0 +1,145 @@
+import cProfile
+import json
+import os
+import random
+import re
+import threading
+import time
+from functools import wraps
+from flask import g, request, has_app_context
+from sqlalchemy import event
+import flask_restx.marshalling
+
+# 요청별 성능 측정 (PROFILING_ENABLED일 때만 설치, 꺼져 있으면 어떤 훅도 등록하지 않음)
+# 요청마다 DB 시간/쿼리 수, 직렬화(marshal + JSON 인코딩) 시간, 핸들러 전체 시간을 기록하여
+# Server-Timing 헤더로 반환한다. PROFILING_SLOW_MS보다 오래 걸린 요청은 cProfile 결과(.prof)와
+# 실행한 SQL(.json)을 PROFILING_DIR에 저장하고, 가장 오래된 것부터 지워 PROFILING_MAX_FILES개만 유지한다.
+# cProfile은 PROFILING_CAPTURE일 때 PROFILING_CAPTURE_SAMPLE개 요청 중 1개에서만 실행하므로,
+# 나머지 느린 요청은 SQL(.json)만 저장된다.
+class RequestProfile:
+    def __init__(self, capture):
+        self.start = time.perf_counter()
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.statements = []
+        self.profiler = None
+        if capture:
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+            except ValueError:  # 다른 프로파일러가 이미 실행 중
+                self.profiler = None
+
+    def stop(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+        return (time.perf_counter() - self.start) * 1000
+
+def _current_profile():
+    return g.get('request_profile') if has_app_context() else None
+
+# 직렬화 시간 측정 (측정 중인 요청이 없으면 원래 함수를 그대로 호출)
+def _timed(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = _current_profile()
+        if profile is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.serialize_time += time.perf_counter() - start
+    wrapper.profiling_timed = True
+    return wrapper
+
+_patch_lock = threading.Lock()
+
+def _patch_serialization(api):
+    '''marshal_with가 사용하는 marshal()과 API의 JSON 출력 함수를 한 번만 감쌈'''
+    with _patch_lock:
+        if not getattr(flask_restx.marshalling.marshal, 'profiling_timed', False):
+            flask_restx.marshalling.marshal = _timed(flask_restx.marshalling.marshal)
+        output_json = api.representations.get('application/json')
+        if output_json is not None and not getattr(output_json, 'profiling_timed', False):
+            api.representations['application/json'] = _timed(output_json)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile() is not None:
+        context._profiling_start = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile()
+    start = getattr(context, '_profiling_start', None)
+    if profile is not None and start is not None:
+        elapsed = time.perf_counter() - start
+        profile.db_time += elapsed
+        profile.statements.append({'sql': statement, 'ms': round(elapsed * 1000, 3)})
+
+def _server_timing(profile, total_ms):
+    db_ms = profile.db_time * 1000
+    serialize_ms = profile.serialize_time * 1000
+    return ', '.join([
+        f'db;dur={db_ms:.2f};desc="{len(profile.statements)} queries"',
+        f'serialize;dur={serialize_ms:.2f}',
+        f'app;dur={max(0.0, total_ms - db_ms - serialize_ms):.2f}',
+        f'total;dur={total_ms:.2f}'
+    ])
+
+def _capture(app, profile, total_ms, response):
+    '''느린 요청의 cProfile 결과와 SQL 저장 후 오래된 파일 정리'''
+    directory = app.config['PROFILING_DIR']
+    os.makedirs(directory, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{os.getpid()}-" \
+           f"{request.method}-{re.sub(r'[^0-9A-Za-z]+', '_', request.path).strip('_')[:80]}"
+    base = os.path.join(directory, name)
+
+    if profile.profiler is not None:
+        profile.profiler.dump_stats(base + '.prof')
+    with open(base + '.json', 'w', encoding='utf-8') as f:
+        json.dump({
+            'method': request.method,
+            'path': request.full_path,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 3),
+            'db_ms': round(profile.db_time * 1000, 3),
+            'serialize_ms': round(profile.serialize_time * 1000, 3),
+            'statements': profile.statements
+        }, f, ensure_ascii=False, indent=2)
+
+    captures = sorted({os.path.splitext(entry)[0] for entry in os.listdir(directory)
+                       if entry.endswith(('.json', '.prof'))})
+    for old in captures[:max(0, len(captures) - app.config['PROFILING_MAX_FILES'])]:
+        for extension in ('.json', '.prof'):
+            path = os.path.join(directory, old + extension)
+            if os.path.exists(path):
+                os.remove(path)
+
+def init_profiling(app, api, engines):
+    _patch_serialization(api)
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+    @app.before_request
+    def start_profile():
+        sample = max(1, app.config['PROFILING_CAPTURE_SAMPLE'])
+        g.request_profile = RequestProfile(app.config['PROFILING_CAPTURE'] and random.randrange(sample) == 0)
+
+    @app.after_request
+    def finish_profile(response):
+        profile = g.pop('request_profile', None)
+        if profile is None:
+            return response
+        total_ms = profile.stop()
+        response.headers['Server-Timing'] = _server_timing(profile, total_ms)
+        if total_ms >= app.config['PROFILING_SLOW_MS']:
+            _capture(app, profile, total_ms, response)
+        return response
+
+    @app.teardown_request
+    def discard_profile(exc):
+        # 처리되지 않은 예외로 after_request가 실행되지 않은 경우 프로파일러 정지
+        profile = g.pop('request_profile', None)
+        if profile is not None:
+            profile.stop()
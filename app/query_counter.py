@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+
+# SQL 실행 횟수 측정
+# SQLAlchemy 엔진의 before_cursor_execute 이벤트에 연결하여 실제로 DB로 전송되는 문장을 기록한다.
+class QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def start(self):
+        event.listen(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+        return self
+
+    def stop(self):
+        if event.contains(self.engine, 'before_cursor_execute', self._before_cursor_execute):
+            event.remove(self.engine, 'before_cursor_execute', self._before_cursor_execute)
+
+# with count_queries(db.engine) as counter: ... 형태로 사용
+@contextmanager
+def count_queries(engine):
+    counter = QueryCounter(engine).start()
+    try:
+        yield counter
+    finally:
+        counter.stop()
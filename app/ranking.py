@@ -0,0 +1,152 @@
+import bisect
+import sqlite3
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import select, func, event
+from .models import Grade, User, StudentSemesterSummary
+from .summary import TOTAL
+from .db_routing import RoutingSession
+from .versions import STUDENT, SUBJECT, SEMESTER, SUBJECTS_CATALOG, USERS_CATALOG
+from . import db
+
+# 순위/백분위 조회
+# 그룹: ('course', 과목 코드, 학기) 과목 점수, ('department', 학과) / ('cohort', 입학년도) 누적 평점
+# 창 함수(RANK() OVER)를 지원하는 DB면 해당 그룹만 조회하여 DB에서 순위를 계산하고(RANKING_BACKEND=auto),
+# 지원하지 않으면 그룹별 정렬된 값 목록(순위 인덱스)을 워커 메모리에 만들어 bisect로 O(log n)에 순위를 찾는다.
+# 순위 인덱스는 같은 워커의 성적 변경 커밋 시 바뀐 학생만 표시해 두었다가 다음 조회 때 해당 학생 값만 다시 읽어 갱신하고,
+# 다른 워커의 변경은 RANK_INDEX_TTL 이내에 전체를 다시 만들어 반영한다.
+# 순위는 동점자가 같은 순위를 받는 RANK() 방식이며, 백분위는 자신보다 순위가 낮은 학생의 비율(%)이다.
+GPA_GROUPS = ('department', 'cohort')
+
+_lock = threading.Lock()
+
+def _gpa():
+    return StudentSemesterSummary.grade_points / StudentSemesterSummary.credits_attempted
+
+def _values_query(group, student_ids=None):
+    '''그룹의 (학생 ID, 값) 조회 (student_ids가 있으면 해당 학생만)'''
+    kind = group[0]
+    if kind == 'course':
+        _, subject_code, semester = group
+        student_column = Grade.student_id
+        query = select(Grade.student_id, Grade.score.label('value')).where(
+            Grade.subject_code == subject_code, Grade.semester == semester, Grade.score.isnot(None))
+    else:
+        group_column = User.department if kind == 'department' else User.admission_year
+        student_column = StudentSemesterSummary.student_id
+        query = select(StudentSemesterSummary.student_id, _gpa().label('value'))\
+            .join(User, User.id == StudentSemesterSummary.student_id)\
+            .where(StudentSemesterSummary.semester == TOTAL, StudentSemesterSummary.credits_attempted > 0,
+                   group_column == group[1])
+    if student_ids is not None:
+        query = query.where(student_column.in_(student_ids))
+    return query
+
+def _result(value, rank, total):
+    return {'value': value, 'rank': rank, 'total': total, 'percentile': round(100 * (total - rank) / total, 1)}
+
+def supports_window_functions(dialect):
+    if dialect.name == 'sqlite':
+        return sqlite3.sqlite_version_info >= (3, 25)
+    if dialect.name == 'mysql':
+        version = dialect.server_version_info or ()
+        return version >= ((10, 2) if getattr(dialect, 'is_mariadb', False) else (8, 0))
+    return True
+
+def _use_window():
+    backend = current_app.config['RANKING_BACKEND']
+    if backend == 'auto':
+        return supports_window_functions(db.session.connection().dialect)
+    return backend == 'window'
+
+def window_rank(group, student_id):
+    '''창 함수로 그룹 내 순위 계산 (그룹에 값이 없는 학생이면 None)'''
+    values = _values_query(group).subquery()
+    ranked = select(
+        values.c.student_id, values.c.value,
+        func.rank().over(order_by=values.c.value.desc()).label('rank'),
+        func.count().over().label('total')
+    ).subquery()
+    row = db.session.execute(
+        select(ranked.c.value, ranked.c.rank, ranked.c.total).where(ranked.c.student_id == student_id)
+    ).first()
+    return _result(*row) if row else None
+
+class RankIndex:
+    '''그룹의 학생별 값과 내림차순 정렬된 값 목록 (부호를 바꿔 오름차순으로 저장)'''
+    def __init__(self, values):
+        self.values = dict(values)
+        self.ordered = sorted(-value for value in self.values.values())
+        self.built_at = time.monotonic()
+        self.dirty = set()
+
+    def set(self, student_id, value):
+        old = self.values.pop(student_id, None)
+        if old is not None:
+            del self.ordered[bisect.bisect_left(self.ordered, -old)]
+        if value is not None:
+            self.values[student_id] = value
+            bisect.insort(self.ordered, -value)
+
+    def rank(self, student_id):
+        value = self.values.get(student_id)
+        if value is None:
+            return None
+        return _result(value, bisect.bisect_left(self.ordered, -value) + 1, len(self.ordered))
+
+def _indexes():
+    return current_app.extensions.setdefault('rank_indexes', {})
+
+def index_rank(group, student_id):
+    '''순위 인덱스로 그룹 내 순위 조회 (없거나 만료되었으면 만들고, 바뀐 학생은 값만 다시 읽음)'''
+    with _lock:
+        index = _indexes().get(group)
+        if index is not None and time.monotonic() - index.built_at >= current_app.config['RANK_INDEX_TTL']:
+            index = None
+        dirty = set()
+        if index is not None:
+            dirty, index.dirty = index.dirty, set()
+
+    if index is None:
+        index = RankIndex(db.session.execute(_values_query(group)).all())
+        with _lock:
+            _indexes()[group] = index
+    elif dirty:
+        values = dict(db.session.execute(_values_query(group, dirty)).all())
+        with _lock:
+            for changed in dirty:
+                index.set(changed, values.get(changed))
+
+    with _lock:
+        return index.rank(student_id)
+
+def group_rank(group, student_id):
+    if _use_window():
+        return window_rank(group, student_id)
+    return index_rank(group, student_id)
+
+def mark_changed(markers):
+    '''커밋된 변경 버전으로 영향을 받는 순위 인덱스에 바뀐 학생 표시'''
+    indexes = current_app.extensions.get('rank_indexes')
+    if not indexes:
+        return
+    students = {name for scope, name in markers if scope == STUDENT}
+    catalog_changed = SUBJECTS_CATALOG in markers or USERS_CATALOG in markers
+    with _lock:
+        for group in list(indexes):
+            if group[0] == 'course':
+                if (SUBJECT, group[1]) in markers and (SEMESTER, group[2]) in markers:
+                    indexes[group].dirty |= students
+            elif catalog_changed:
+                # 과목 학점 변경, 사용자 학과 변경 등은 여러 학생의 평점/그룹이 바뀌므로 다시 만듦
+                del indexes[group]
+            else:
+                indexes[group].dirty |= students
+
+# 응답 캐시 무효화 리스너가 changed_markers를 꺼내기 전에 실행되도록 맨 앞에 등록
+@event.listens_for(RoutingSession, 'after_commit', insert=True)
+def refresh_changed(session):
+    markers = session.info.get('changed_markers')
+    if markers and has_app_context():
+        mark_changed(markers)
@@ -0,0 +1,221 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request, has_app_context
+from sqlalchemy import event
+from .db_routing import RoutingSession
+from .serialization import dumps
+from .versions import conditional_response, identity_scope, make_etag, not_modified
+
+# 조회 응답 캐시
+# GET 응답을 (사용자 범위, 경로+쿼리) 키로 저장하고, 응답에 사용된 버전 (scope, name)을 태그로 붙인다.
+# 쓰기 핸들러가 versions.bump()로 올린 버전은 커밋 직후 같은 태그의 항목만 무효화한다.
+# 항목에는 저장할 때의 ETag(버전으로 계산)를 함께 두고, 조회마다 현재 버전의 ETag와 같을 때만 사용한다.
+# 그래서 조회 도중 커밋된 쓰기로 오래된 응답이 저장되거나, 다른 워커의 쓰기로 memory 백엔드의 무효화가
+# 빠져도 오래된 응답을 반환하지 않는다 (캐시 적중 시에도 버전 조회 1회는 실행).
+def _tag(marker):
+    scope, name = marker
+    return f'{scope}:{name}'
+
+def _fresh(value, etag):
+    '''저장된 [data, code, headers]의 ETag가 현재 ETag와 같은지 (etag가 없으면 확인하지 않음)'''
+    return etag is None or value[2].get('ETag') == f'"{etag}"'
+
+class MemoryCacheBackend:
+    '''프로세스 내 LRU 캐시 (최대 항목 수와 TTL 제한)'''
+    def __init__(self, max_entries=1024, ttl=30):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()   # key -> (만료 시각, 값, 태그)
+        self._tags = {}                 # 태그 -> key 집합
+        self._lock = threading.Lock()
+
+    def get(self, key, etag=None):
+        '''etag가 주어지면 저장된 응답의 ETag가 다른 (버전이 바뀐) 항목은 없는 것으로 처리'''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic() or not _fresh(entry[1], etag):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, tags=()):
+        tags = [_tag(marker) for marker in tags]
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, markers):
+        with self._lock:
+            for tag in {_tag(marker) for marker in markers}:
+                for key in self._tags.pop(tag, ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def stats(self):
+        return {
+            'backend': 'memory',
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+
+class RedisCacheBackend:
+    '''Redis 프로토콜 캐시 (워커 간 공유, 태그별 key 집합은 Redis SET으로 관리)'''
+    def __init__(self, client, ttl=30, prefix='response:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key, etag=None):
+        '''etag가 주어지면 저장된 응답의 ETag가 다른 (버전이 바뀐) 항목은 없는 것으로 처리'''
+        value = self.client.get(self.prefix + key)
+        if value is not None:
+            value = json.loads(value)
+        if value is None or not _fresh(value, etag):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key, value, tags=()):
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, dumps(value), ex=self.ttl)  # 빠른 경로의 행 객체는 JSON 객체로 저장
+        for marker in tags:
+            tag_key = f'{self.prefix}tag:{_tag(marker)}'
+            pipe.sadd(tag_key, key)
+            pipe.expire(tag_key, self.ttl)
+        pipe.execute()
+
+    def invalidate(self, markers):
+        tag_keys = [f'{self.prefix}tag:{_tag(marker)}' for marker in set(markers)]
+        pipe = self.client.pipeline()
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        keys = {member.decode() if isinstance(member, bytes) else member
+                for members in pipe.execute() for member in members}
+        if keys:
+            self.invalidations += self.client.delete(*(self.prefix + key for key in keys))
+        if tag_keys:
+            self.client.delete(*tag_keys)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+    def stats(self):
+        # 용량 초과로 인한 제거는 Redis 서버(maxmemory-policy)가 담당하므로 서버 통계를 사용
+        from redis.exceptions import ResponseError
+        try:
+            evictions = self.client.info('stats').get('evicted_keys', 0)
+        except ResponseError:
+            evictions = None  # INFO를 지원하지 않는 Redis 호환 서버
+        return {
+            'backend': 'redis',
+            'size': None,
+            'max_entries': None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': evictions,
+            'invalidations': self.invalidations
+        }
+
+def create_backend(config):
+    backend = config['RESPONSE_CACHE_BACKEND']
+    if backend == 'memory':
+        return MemoryCacheBackend(config['RESPONSE_CACHE_MAX_ENTRIES'], config['RESPONSE_CACHE_TTL'])
+    if backend == 'redis':
+        import redis  # redis 백엔드를 사용할 때만 필요
+        client = redis.Redis.from_url(config['RESPONSE_CACHE_REDIS_URL'])
+        return RedisCacheBackend(client, config['RESPONSE_CACHE_TTL'])
+    return None
+
+def response_cache():
+    '''앱별 응답 캐시 백엔드 (RESPONSE_CACHE_BACKEND가 none이면 None)'''
+    if 'response_cache' not in current_app.extensions:
+        current_app.extensions['response_cache'] = create_backend(current_app.config)
+    return current_app.extensions['response_cache']
+
+def cached(markers):
+    '''
+    조회 핸들러의 응답 캐시 + ETag/If-None-Match 적용
+    markers: 핸들러 인자를 받아 응답에 영향을 주는 (scope, name) 목록을 반환하는 함수
+    @jwt_required() 아래, marshal 데코레이터 위에 둔다.
+    '''
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            cache = response_cache()
+            if cache is None:
+                return conditional_response(f, markers(**kwargs), args, kwargs)
+
+            # 핸들러가 행을 읽기 전에 버전을 읽으므로, 그 사이 커밋된 쓰기가 있으면 저장되는 ETag가 이미 오래되어
+            # 다음 조회에서 사용되지 않음
+            marker_list = markers(**kwargs)
+            etag = make_etag(marker_list)
+            if request.if_none_match.contains(etag):
+                return not_modified(etag)
+
+            key = f'{identity_scope()}|{request.full_path}'
+            entry = cache.get(key, etag)
+            if entry is not None:
+                data, code, headers = entry
+                return data, code, headers
+
+            result = conditional_response(f, marker_list, args, kwargs, etag=etag)
+            if isinstance(result, tuple) and result[1] == 200:
+                cache.set(key, list(result), tags=marker_list)
+            return result
+        return wrapper
+    return decorator
+
+# 커밋된 변경만 무효화하고, 롤백된 변경은 버림
+@event.listens_for(RoutingSession, 'after_commit')
+def invalidate_changed(session):
+    markers = session.info.pop('changed_markers', None)
+    if markers and has_app_context():
+        cache = response_cache()
+        if cache is not None:
+            cache.invalidate(markers)
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def discard_changed(session):
+    session.info.pop('changed_markers', None)
@@ -1,8 +1,11 @@
-from flask import request
+from flask import request, current_app
 from flask_restx import Namespace, Resource, fields, abort
-from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity, get_jwt, decode_token
+from jwt.exceptions import PyJWTError
 from datetime import timedelta
 from ..models import User
+from ..token_blocklist import token_blocklist
+from .. import db
 
 # 인증 네임스페이스
 ns_auth = Namespace('auth', description='사용자 인증 관련 작업')
@@ -30,6 +33,12 @@ login_response = ns_auth.model('Login_Response', {
     'user': fields.Nested(user_model)  
 })
 
+def record_login(result):
+    '''로그인 결과를 Prometheus 지표에 기록 (METRICS_ENABLED일 때만)'''
+    if current_app.config['METRICS_ENABLED']:
+        from .. import metrics
+        metrics.record_login(result)
+
 # 로그인 API
 @ns_auth.route('/login')
 class UserLogin(Resource):
@@ -42,14 +51,18 @@ class UserLogin(Resource):
         user = User.query.filter_by(id=data['id']).first()
 
         if not user:
+            record_login('unknown_user')
             abort(401, message="아이디가 존재하지 않습니다.")
 
         if not user.check_password(data['password']):
+            record_login('bad_password')
             abort(401, message="비밀번호가 올바르지 않습니다.")
 
         if user.role != data['role']:
+            record_login('role_mismatch')
             abort(401, message="구분이 일치하지 않습니다.")
 
+        record_login('success')
         identity = f"{user.id}:{user.role}"
         access_token = create_access_token(identity=identity, expires_delta=timedelta(minutes=15))
         refresh_token = create_refresh_token(identity=identity, expires_delta=timedelta(days=30))
@@ -79,4 +92,55 @@ class TokenRefresh(Resource):
 
         return {
             "access_token": access_token
-        }
\ No newline at end of file
+        }
+
+# 로그아웃 요청 모델
+logout_request = ns_auth.model('Logout_Request', {
+    'refresh_token': fields.String(description='함께 폐기할 refresh token')
+})
+
+# 로그아웃 API
+@ns_auth.route('/logout')
+class UserLogout(Resource):
+    @ns_auth.doc(description='현재 요청에 사용한 토큰(access 또는 refresh)을 폐기합니다. 본문에 refresh token을 함께 보내면 같이 폐기합니다.')
+    @ns_auth.expect(logout_request)
+    @jwt_required(verify_type=False)
+    def post(self):
+        '''로그아웃 (토큰 폐기)'''
+        current_token = get_jwt()
+        blocklist = token_blocklist()
+        blocklist.revoke_token(current_token)
+
+        data = request.get_json(silent=True) or {}
+        if data.get('refresh_token'):
+            try:
+                refresh_token = decode_token(data['refresh_token'])
+            except PyJWTError:
+                abort(400, message="유효하지 않은 refresh token입니다.")
+            if refresh_token['sub'] != current_token['sub']:
+                abort(403, message="다른 사용자의 토큰은 폐기할 수 없습니다.")
+            blocklist.revoke_token(refresh_token)
+
+        db.session.commit()
+        return {"message": "로그아웃되었습니다."}, 200
+
+# 사용자 토큰 전체 폐기 API
+@ns_auth.route('/revoke/<user_id>')
+@ns_auth.param('user_id', '학번(직번)')
+class UserTokenRevoke(Resource):
+    @ns_auth.doc(description='관리자가 계정 도용 등으로 특정 사용자에게 지금까지 발급된 모든 토큰을 폐기할 때 사용됩니다.')
+    @jwt_required()
+    def post(self, user_id):
+        '''사용자 토큰 전체 폐기'''
+        current_user = get_jwt_identity()
+        _, role = current_user.split(':')
+
+        if role != 'admin':
+            abort(403, message="관리자만 접근 가능합니다.")
+
+        if not db.session.get(User, user_id):
+            abort(404, message="사용자를 찾을 수 없습니다.")
+
+        token_blocklist().revoke_user(user_id)
+        db.session.commit()
+        return {"message": "사용자의 모든 토큰을 폐기했습니다."}, 200
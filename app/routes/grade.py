@@ -1,7 +1,21 @@
-from flask import request
-from flask_restx import Namespace, Resource, fields, abort
+import csv
+import io
+import json
+from flask import request, Response, stream_with_context
+from flask_restx import Namespace, Resource, fields, reqparse, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import func, select
 from ..models import User, Subject, Grade
+from ..pagination import pagination_parser, page_args, paginate
+from ..summary import apply_grade_change, subject_credits
+from ..subject_catalog import load_subject, find_subject
+from ..grade_stats import invalidate as invalidate_statistics
+from ..grading import absolute_letter
+from ..idempotency import idempotent
+from ..response_cache import cached
+from ..serialization import row_type
+from ..upsert import upsert
+from ..versions import bump, grade_markers, STUDENT, SUBJECT, SEMESTER, SUBJECTS_CATALOG, USERS_CATALOG
 from .. import db
 
 # 성적 관련 네임스페이스
@@ -18,13 +32,20 @@ grade_model = ns_grades.model('Grade', {
     'grade': fields.String(required=True, description='성적 학점')
 })
 
+# 목록 조회의 빠른 직렬화 경로: grade_model 필드 순서의 컬럼만 조회하여 행 객체로 반환
+GradeRow = row_type(grade_model)
+GRADE_COLUMNS = (Grade.id, Grade.student_id, Grade.subject_code,
+                 func.coalesce(Subject.name, '과목 이름 없음').label('subject_name'),
+                 Grade.semester, Grade.score, Grade.grade)
+
 # 학생별 전체 성적 조회
 @ns_grades.route('/student/<student_id>')
 @ns_grades.param('student_id', '학번')
 class GradesByStudent(Resource):
     @ns_grades.doc(description="학생이 자신의 성적을 조회할 시, 관리자나 교수가 특정 학생의 성적을 조회할 시 사용됩니다.")
-    @ns_grades.marshal_list_with(grade_model)
     @jwt_required()
+    @cached(lambda student_id: [(STUDENT, student_id), SUBJECTS_CATALOG])
+    @ns_grades.response(200, '성적 목록', [grade_model])
     def get(self, student_id):
         '''특정 학생의 성적 조회'''
         current_user = get_jwt_identity()
@@ -33,129 +54,216 @@ class GradesByStudent(Resource):
         if role == 'student' and user_id != student_id:
             abort(403, message="데이터에 접근 권한이 없습니다.")
 
-        grades = Grade.query.filter_by(student_id=student_id).all()
+        # 과목명을 함께 조인하여 한 번의 쿼리로 조회
+        grades = db.session.query(*GRADE_COLUMNS).outerjoin(Subject, Grade.subject_code == Subject.code)\
+                  .filter(Grade.student_id == student_id).all()
         if not grades:
             abort(404, message="학생의 성적을 찾을 수 없습니다.")
 
-        grade_data = []
-        for grade in grades:
-            subject = Subject.query.filter_by(code=grade.subject_code).first()
-            grade_data.append({
-                'id': grade.id,
-                'student_id': grade.student_id,
-                'subject_code': grade.subject_code,
-                'subject_name': subject.name if subject else '과목 이름 없음',  
-                'semester': grade.semester,
-                'score': grade.score,
-                'grade': grade.grade
-            })
-
-        return grade_data, 200
+        return [GradeRow(*grade) for grade in grades], 200
+
+# 성적 목록 페이지 모델
+grade_page_model = ns_grades.model('GradePage', {
+    'items': fields.List(fields.Nested(grade_model), description='성적 목록'),
+    'next': fields.String(description='다음 페이지 커서 (마지막 페이지면 null)')
+})
+
+# 과목별 성적 조회 ETag 기준 (과목 이름으로 과목 코드를 찾아 해당 과목의 성적 버전을 사용)
+def subject_grade_markers(subject_name):
+    subject = find_subject(subject_name)
+    if subject is None:
+        return [SUBJECTS_CATALOG]
+    return [(SUBJECT, subject.code), SUBJECTS_CATALOG]
 
 # 과목별 성적 조회
 @ns_grades.route('/subject/<subject_name>')
 @ns_grades.param('subject_name', '과목 이름')
 class GradesBySubject(Resource):
-    @ns_grades.doc(description="학생이 자신이 수강한 특정 과목의 성적을 조회할 시, 교수가 자신이 담담하는 과목의 성적을 조회할 시, 관리자가 특정과목의 성적을 모두 조회할 시 사용됩니다.")
-    @ns_grades.marshal_list_with(grade_model)
+    @ns_grades.doc(description="학생이 자신이 수강한 특정 과목의 성적을 조회할 시, 교수가 자신이 담담하는 과목의 성적을 조회할 시, 관리자가 특정과목의 성적을 모두 조회할 시 사용됩니다. 성적 ID 순으로 페이지 단위 조회합니다.")
+    @ns_grades.expect(pagination_parser)
     @jwt_required()
+    @cached(subject_grade_markers)
+    @ns_grades.response(200, '성적 목록 페이지', grade_page_model)
     def get(self, subject_name):
         '''특정 과목의 성적 조회'''
         current_user = get_jwt_identity()
         user_id, role = current_user.split(':')
 
-        subject = Subject.query.filter_by(name=subject_name).first()
+        subject = find_subject(subject_name)
         if not subject:
             abort(404, message="해당 과목을 찾을 수 없습니다.")
         
+        limit, after = page_args()
+        query = db.session.query(Grade.id, Grade.student_id, Grade.semester, Grade.score, Grade.grade)\
+                  .filter(Grade.subject_code == subject.code)
+
         if role == "student":
-            grades = Grade.query.filter_by(subject_code=subject.code, student_id=user_id).all()
-            if not grades:
-                abort(404, message="해당 과목의 성적이 없습니다.")
+            query = query.filter(Grade.student_id == user_id)
 
         elif role == "professor":
             if subject.professor_id != user_id:
                 abort(403, message="담당하지 않은 과목의 성적은 조회할 수 없습니다.")
-            grades = Grade.query.filter_by(subject_code=subject.code).all()
-            if not grades:
-                abort(404, message="해당 과목의 성적이 없습니다.")
-
-        elif role == "admin":
-            grades = Grade.query.filter_by(subject_code=subject.code).all()
-            if not grades:
-                abort(404, message="해당 과목의 성적이 없습니다.")
-        
-        else:
+
+        elif role != "admin":
             abort(403, message="접근 권한이 없습니다.")
+
+        grades, next_cursor = paginate(query, Grade.id, limit, after, cast=int)
+        if not grades and after is None:
+            abort(404, message="해당 과목의 성적이 없습니다.")
         
-        grade_data = []
-        for grade in grades:
-            grade_data.append({
-                'id': grade.id,
-                'student_id': grade.student_id,
-                'subject_code': grade.subject_code,
-                'subject_name': subject.name,
-                'semester': grade.semester,
-                'score': grade.score,
-                'grade': grade.grade
-            })
-
-        return grade_data, 200
+        grade_data = [GradeRow(grade_id, student_id, subject.code, subject.name, semester, score, grade)
+                      for grade_id, student_id, semester, score, grade in grades]
+
+        return {'items': grade_data, 'next': next_cursor}, 200
     
+# 학기별 성적 모델 (학생 이름 포함)
+semester_grade_model = ns_grades.clone('SemesterGrade', grade_model, {
+    'student_name': fields.String(description='학생 이름')
+})
+
+semester_grade_page_model = ns_grades.model('SemesterGradePage', {
+    'items': fields.List(fields.Nested(semester_grade_model), description='성적 목록'),
+    'next': fields.String(description='다음 페이지 커서 (마지막 페이지면 null)')
+})
+
+SemesterGradeRow = row_type(semester_grade_model)
+
+# 학기별 성적 조회 쿼리 (역할별 접근 범위 적용)
+# 학생 이름과 과목명을 함께 조인하여 한 번의 쿼리로 조회하며, (쿼리, 결과 없음 메시지)를 반환
+def semester_grades_query(query, user_id, role, semester):
+    query = query.join(User, Grade.student_id == User.id)\
+                 .join(Subject, Grade.subject_code == Subject.code)\
+                 .filter(Grade.semester == semester)
+
+    if role == "student":
+        return query.filter(Grade.student_id == user_id), f"{semester} 학기에 해당하는 성적이 없습니다."
+    elif role == "professor":
+        return query.filter(Subject.professor_id == user_id), "해당 학기에 담당하는 과목의 성적이 없습니다."
+    elif role == "admin":
+        return query, "해당 학기에 담당한 성적이 없습니다."
+    abort(403, message="접근 권한이 없습니다.")
+
 # 학기별 성적 조회
 @ns_grades.route('/semester/<semester>')
 @ns_grades.param('semester', '학기')
 class GradesBySemester(Resource):
-    @ns_grades.doc(description="학생이 특정 학기에서 자신이 수강한 성적을 조회할 시, 교수가 특정 학기에서 자신이 담당한 과목의 성적을 조회할 시, 관리자가 특정 학기의 성적을 모두 조회할 시 사용됩니다.")
+    @ns_grades.doc(description="학생이 특정 학기에서 자신이 수강한 성적을 조회할 시, 교수가 특정 학기에서 자신이 담당한 과목의 성적을 조회할 시, 관리자가 특정 학기의 성적을 모두 조회할 시 사용됩니다. 성적 ID 순으로 페이지 단위 조회합니다.")
+    @ns_grades.expect(pagination_parser)
     @jwt_required()
+    @cached(lambda semester: [(SEMESTER, semester), SUBJECTS_CATALOG, USERS_CATALOG])
+    @ns_grades.response(200, '성적 목록 페이지', semester_grade_page_model)
     def get(self, semester):
         '''특정 학기의 성적 조회'''
         current_user = get_jwt_identity()
         user_id, role = current_user.split(':')
 
-        if role == "student":
-            grades = db.session.query(Grade, User.name).join(User, Grade.student_id == User.id)\
-                      .filter(Grade.student_id == user_id, Grade.semester == semester).all()
-            if not grades:
-                abort(404, message=f"{semester} 학기에 해당하는 성적이 없습니다.")
+        limit, after = page_args()
+        query, not_found_message = semester_grades_query(
+            db.session.query(Grade.id, Grade.student_id, Grade.subject_code, Subject.name.label('subject_name'),
+                             Grade.semester, Grade.score, Grade.grade, User.name.label('student_name')),
+            user_id, role, semester
+        )
 
-        elif role == "professor":
-            subjects = Subject.query.filter_by(professor_id=user_id).all()
-            subject_codes = [subject.code for subject in subjects]
-            grades = db.session.query(Grade, User.name).join(User, Grade.student_id == User.id)\
-                        .filter(Grade.subject_code.in_(subject_codes), Grade.semester == semester)
-            if not grades:
-                abort(404, message="해당 학기에 담당하는 과목의 성적이 없습니다.")    
-        
-        elif role == "admin":
-            grades = db.session.query(Grade, User.name).join(User, Grade.student_id == User.id)\
-                      .filter(Grade.semester == semester).all()
-            if not grades:
-                abort(404, message="해당 학기에 담당한 성적이 없습니다.")
+        grades, next_cursor = paginate(query, Grade.id, limit, after, cast=int)
+        if not grades and after is None:
+            abort(404, message=not_found_message)
+
+        return {'items': [SemesterGradeRow(*grade) for grade in grades], 'next': next_cursor}, 200
+
+# 학기별 성적 내보내기
+EXPORT_COLUMNS = ['id', 'student_id', 'student_name', 'subject_code', 'subject_name', 'semester', 'score', 'grade']
+EXPORT_BATCH_SIZE = 1000
+
+export_parser = reqparse.RequestParser()
+export_parser.add_argument('format', type=str, location='args', choices=('ndjson', 'csv'), default='ndjson',
+                           help='내보내기 형식 (ndjson, csv)')
+
+@ns_grades.route('/semester/<semester>/export')
+@ns_grades.param('semester', '학기')
+class GradesBySemesterExport(Resource):
+    @ns_grades.doc(description="학기별 성적 전체를 NDJSON 또는 CSV로 스트리밍합니다. 접근 범위는 학기별 성적 조회와 같습니다.")
+    @ns_grades.expect(export_parser)
+    @jwt_required()
+    def get(self, semester):
+        '''특정 학기의 성적 내보내기'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        export_format = export_parser.parse_args()['format']
+        query, _ = semester_grades_query(
+            db.session.query(Grade.id, Grade.student_id, User.name, Grade.subject_code,
+                             Subject.name, Grade.semester, Grade.score, Grade.grade),
+            user_id, role, semester
+        )
+        rows = _stream_rows(query)
+
+        if export_format == 'csv':
+            body, mimetype = _export_csv(rows), 'text/csv'
         else:
-            abort(403, message="접근 권한이 없습니다.")
+            body, mimetype = _export_ndjson(rows), 'application/x-ndjson'
+
+        response = Response(stream_with_context(body), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename=grades_{semester}.{export_format}'
+        return response
+
+def _stream_rows(query):
+    '''
+    서버 측 커서로 일정 크기씩 가져와 전체 결과를 메모리에 올리지 않음
+    조회 세션은 요청 종료 시 이미 정리된 뒤 스트림에서 다시 사용되므로, 스트림이 끝나면 직접 닫아 연결을 반납
+    '''
+    try:
+        yield from query.order_by(Grade.id).yield_per(EXPORT_BATCH_SIZE)
+    finally:
+        query.session.close()
 
-        grade_data = []
-        for grade, student_name in grades:
-            grade_data.append({
-                'id': grade.id,
-                'student_id': grade.student_id,
-                'student_name': student_name,
-                'subject_code': grade.subject_code,
-                'subject_name': grade.subject.name,
-                'semester': grade.semester,
-                'score': grade.score,
-                'grade': grade.grade
-            })
-
-        return grade_data, 200
+def _export_ndjson(rows):
+    for row in rows:
+        yield json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + '\n'
+
+def _export_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
 
 # 성적 입력
+# 학생/과목/학기 고유 키로 upsert하므로 같은 성적을 다시 입력하면 점수와 학점을 수정하고, 동시에 같은 성적을
+# 입력하거나 시간 초과 후 재시도해도 한 행만 남는다. 충돌하면 기존 점수/학점을 previous_score, previous_grade로
+# 옮기므로 이전 값을 따로 잠가 읽지 않고 문장의 결과(RETURNING, MySQL은 잠긴 행의 기본 키 조회)로 받아 요약의 변경분만 반영한다.
+# upsert는 오류를 무시하지 않으므로, 외래 키와 컬럼 길이는 입력 전에 확인하여 404/400으로 응답한다.
+GRADE_KEY = ['student_id', 'subject_code', 'semester']
+
+def save_grade(values):
+    '''성적 입력 또는 수정 후 (성적 ID, 이전 (점수, 학점)) 반환 (새로 입력했으면 이전 값은 (None, None))'''
+    statement = upsert(Grade, values, GRADE_KEY, lambda new: {
+        'previous_score': Grade.score,
+        'previous_grade': Grade.grade,
+        'score': new.score,
+        'grade': new.grade
+    })
+    columns = (Grade.id, Grade.previous_score, Grade.previous_grade)
+    if db.session.get_bind().dialect.insert_returning:
+        grade_id, score, grade = db.session.execute(statement.returning(*columns)).one()
+    else:
+        db.session.execute(statement)
+        grade_id, score, grade = db.session.execute(
+            select(*columns).filter_by(**{column: values[column] for column in GRADE_KEY})
+        ).one()
+    return grade_id, (score, grade)
+
 @ns_grades.route('/')
 class GradeInput(Resource):
-    @ns_grades.doc(description="교수가 담당 과목에서 성적을 추가할 시, 관리자가 모든 과목에 성적을 추가할 시 사용됩니다.")
+    @ns_grades.doc(description="교수가 담당 과목에서 성적을 추가할 시, 관리자가 모든 과목에 성적을 추가할 시 사용됩니다. 같은 학생/과목/학기의 성적이 이미 있으면 점수와 학점을 수정합니다. Idempotency-Key 헤더를 보내면 같은 키의 재시도에 처음 응답을 그대로 반환합니다.")
     @ns_grades.expect(grade_model)
+    @ns_grades.doc(params={'Idempotency-Key': {'in': 'header', 'description': '재시도 식별 키 (선택)'}})
     @jwt_required()
+    @idempotent
     def post(self):
         '''성적 입력 (교수: 담당 과목만, 관리자: 모든 과목)'''
         current_user = get_jwt_identity()
@@ -165,7 +273,7 @@ class GradeInput(Resource):
             abort(403, message="접근 권한이 없습니다.")
         
         data = request.json
-        subject = Subject.query.filter_by(code=data['subject_code']).first()
+        subject = load_subject(data['subject_code'])
 
         if not subject:
             abort(404, message="해당 과목을 찾을 수 없습니다.")
@@ -173,26 +281,28 @@ class GradeInput(Resource):
         if role == "professor" and subject.professor_id != user_id:
             abort(403, message="담당하지 않은 과목에 성적을 입력할 수 없습니다.")
         
-        existing_grade = Grade.query.filter_by(
-            student_id=data['student_id'],
-            subject_code=data['subject_code'],
-            semester=data['semester']
-        ).first()
-        if existing_grade:
-            abort(400, message='해당 과목의 성적이 이미 존재합니다.')
-        
-        grade = Grade(
-            student_id=data['student_id'],
-            subject_code=data['subject_code'],
-            semester=data['semester'],
-            score=data['score'],
-            grade=data['grade']
-        )
+        if db.session.scalar(db.select(User.role).filter_by(id=data['student_id'])) != 'student':
+            abort(404, message="해당 학생을 찾을 수 없습니다.")
+
+        if len(data['semester']) > Grade.semester.type.length or len(data['grade']) > Grade.grade.type.length:
+            abort(400, message="학기 또는 학점 형식이 올바르지 않습니다.")
 
-        db.session.add(grade)
+        # 점수 기준 정책이 있는 과목은 요청의 학점 대신 점수로 학점을 계산
+        values = {
+            'student_id': data['student_id'],
+            'subject_code': data['subject_code'],
+            'semester': data['semester'],
+            'score': data['score'],
+            'grade': absolute_letter(subject.code, data['score']) or data['grade']
+        }
+        grade_id, old = save_grade(values)
+        apply_grade_change(values['student_id'], values['semester'], subject_credits(values['subject_code']),
+                           old=old, new=(values['score'], values['grade']))
+        bump(*grade_markers(values['student_id'], values['subject_code'], values['semester']))
         db.session.commit()
+        invalidate_statistics(values['subject_code'], values['semester'])
 
-        return grade.to_dict(), 201
+        return {'id': grade_id, **values}, 201
 
 # 성적 수정
 # 성적 수정 모델 정의
@@ -222,21 +332,30 @@ class GradeResource(Resource):
         if not grade:
             abort(404, message="해당 성적 정보를 찾을 수 없습니다.")
 
-        subject = Subject.query.filter_by(code=subject_code).first()
+        subject = load_subject(subject_code)
+        if not subject:
+            abort(404, message="해당 과목을 찾을 수 없습니다.")
         if role == 'professor' and subject.professor_id != user_id:
             abort(403, message="담당하지 않은 과목의 성적을 수정할 수 없습니다.")
 
         data = request.json
+        old = (grade.score, grade.grade)
         grade.score = data.get('score', grade.score)
-        grade.grade = data.get('grade', grade.grade)
+        grade.grade = absolute_letter(subject_code, grade.score) or data.get('grade', grade.grade)
+        apply_grade_change(grade.student_id, grade.semester, subject_credits(subject_code), old=old, new=(grade.score, grade.grade))
 
-        db.session.commit()
-        return {
+        # 커밋 후 만료된 객체를 다시 조회하지 않도록 응답을 먼저 구성
+        grade_data = {
             'id': grade.id,
             'student_id': grade.student_id,
             'subject_code': grade.subject_code,
-            'subject_name' : grade.subject.name,
+            'subject_name' : subject.name,
             'semester': grade.semester,
             'score': grade.score,
             'grade': grade.grade
-        }, 200
\ No newline at end of file
+        }
+
+        bump(*grade_markers(student_id, subject_code, semester))
+        db.session.commit()
+        invalidate_statistics(subject_code, semester)
+        return grade_data, 200
\ No newline at end of file
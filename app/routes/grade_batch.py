@@ -0,0 +1,63 @@
+from flask import current_app
+from flask_restx import Resource, fields, reqparse, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..models import Subject, Grade
+from ..response_cache import cached
+from ..versions import STUDENT, SUBJECTS_CATALOG
+from .. import db
+from .grade import ns_grades, grade_model, GradeRow, GRADE_COLUMNS
+
+# 여러 학생의 성적 일괄 조회
+# 지도 학생 목록처럼 여러 학생의 성적이 필요할 때 학생별 조회를 반복하지 않도록
+# 인증/권한 확인 1회, IN 조건의 조인 쿼리 1회로 조회하여 학생별로 묶어 반환한다.
+batch_parser = reqparse.RequestParser()
+batch_parser.add_argument('ids', type=str, location='args', required=True, help='학번 목록 (쉼표로 구분)')
+batch_parser.add_argument('semester', type=str, location='args', help='학기 (생략 시 전체 학기)')
+
+student_grades_model = ns_grades.model('StudentGrades', {
+    'student_id': fields.String(description='학생 ID'),
+    'grades': fields.List(fields.Nested(grade_model), description='성적 목록 (성적이 없으면 빈 목록)')
+})
+
+def batch_args():
+    '''요청에서 (중복을 제거한 학번 목록, 학기)를 읽음'''
+    args = batch_parser.parse_args()
+    student_ids = list(dict.fromkeys(student_id.strip() for student_id in args['ids'].split(',') if student_id.strip()))
+    if not student_ids:
+        abort(400, message="학번 목록이 필요합니다.")
+    if len(student_ids) > current_app.config['BATCH_MAX_STUDENTS']:
+        abort(400, message=f"한 번에 최대 {current_app.config['BATCH_MAX_STUDENTS']}명까지 조회할 수 있습니다.")
+    return student_ids, args['semester']
+
+# 조회한 학생들의 성적이 바뀌거나 과목 정보가 바뀌면 ETag와 캐시 갱신
+def batch_markers():
+    student_ids, semester = batch_args()
+    return [(STUDENT, student_id) for student_id in student_ids] + [SUBJECTS_CATALOG]
+
+@ns_grades.route('/students')
+class GradesByStudents(Resource):
+    @ns_grades.doc(description="교수나 관리자가 여러 학생의 성적을 한 번에 조회할 시 사용됩니다. 학생은 자신의 학번만 조회할 수 있습니다. 요청한 학번 순서대로 학생별 성적을 반환합니다.")
+    @ns_grades.expect(batch_parser)
+    @jwt_required()
+    @cached(batch_markers)
+    @ns_grades.response(200, '학생별 성적 목록', [student_grades_model])
+    def get(self):
+        '''여러 학생의 성적 일괄 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        student_ids, semester = batch_args()
+        if role == 'student' and any(student_id != user_id for student_id in student_ids):
+            abort(403, message="데이터에 접근 권한이 없습니다.")
+
+        # 과목명을 함께 조인하여 요청한 학생 전체를 한 번의 쿼리로 조회
+        query = db.session.query(*GRADE_COLUMNS).outerjoin(Subject, Grade.subject_code == Subject.code)\
+                  .filter(Grade.student_id.in_(student_ids))
+        if semester:
+            query = query.filter(Grade.semester == semester)
+
+        grades_by_student = {student_id: [] for student_id in student_ids}
+        for grade in query.order_by(Grade.student_id, Grade.id):
+            grades_by_student[grade.student_id].append(GradeRow(*grade))
+
+        return [{'student_id': student_id, 'grades': grades} for student_id, grades in grades_by_student.items()], 200
@@ -0,0 +1,186 @@
+import csv
+import io
+from flask import request, current_app
+from flask_restx import Resource, fields, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import tuple_
+from ..models import User, Subject, Grade
+from ..summary import rebuild as rebuild_summary
+from ..grade_stats import invalidate as invalidate_statistics
+from ..versions import bump, grade_markers
+from ..grading import absolute_policies, compute_letters
+from ..idempotency import idempotent
+from ..upsert import upsert
+from .. import db
+from .grade import ns_grades, GRADE_KEY
+
+# 성적 일괄 입력
+# JSON 배열 또는 CSV(student_id,subject_code,semester,score,grade)로 받은 성적을
+# 과목 권한 확인 1회, 학생 확인 1회, 배치 upsert로 한 트랜잭션에 저장한다.
+# 점수 기준(absolute) 정책이 있는 과목은 성적 입력(POST/PUT)과 같이 요청의 학점 대신 점수로 학점을 계산한다
+# (정책 조회 1회, 과목별 compute_letters 1회).
+# 성적 입력(POST /grades/)과 같이 이미 있는 성적은 점수와 학점을 수정하므로, 겹치는 업로드가 동시에 실행되어도
+# 고유 키 위반으로 전체가 실패하지 않는다. 배치마다 이미 있는 성적의 키를 한 번의 쿼리로 조회하여
+# 새로 입력된 행(created)과 수정된 행(updated)을 구분해 보고한다.
+BULK_FIELDS = ['student_id', 'subject_code', 'semester', 'score', 'grade']
+
+grade_bulk_model = ns_grades.model('GradeBulkRow', {
+    'student_id': fields.String(required=True, description='학생 ID'),
+    'subject_code': fields.String(required=True, description='과목 코드'),
+    'semester': fields.String(required=True, description='학기'),
+    'score': fields.Float(required=True, description='성적 점수'),
+    'grade': fields.String(required=True, description='성적 학점')
+})
+
+grade_bulk_result_model = ns_grades.model('GradeBulkResult', {
+    'row': fields.Integer(description='요청 내 행 번호 (1부터 시작)'),
+    'status': fields.String(description='created, updated 또는 error'),
+    'message': fields.String(description='오류 사유')
+})
+
+grade_bulk_report_model = ns_grades.model('GradeBulkReport', {
+    'created': fields.Integer(description='새로 입력된 성적 수'),
+    'updated': fields.Integer(description='이미 있어 수정된 성적 수'),
+    'failed': fields.Integer(description='실패한 행 수'),
+    'results': fields.List(fields.Nested(grade_bulk_result_model))
+})
+
+def _read_rows():
+    '''요청 본문(JSON 배열, text/csv 본문, multipart file)을 dict 목록으로 변환'''
+    if request.is_json:
+        rows = request.get_json()
+        if not isinstance(rows, list):
+            abort(400, message="성적 목록(JSON 배열)이 필요합니다.")
+        return rows
+
+    if 'file' in request.files:
+        text = request.files['file'].read().decode('utf-8-sig')
+    elif request.mimetype == 'text/csv':
+        text = request.get_data(as_text=True)
+    else:
+        abort(415, message="JSON 배열 또는 CSV 파일만 지원합니다.")
+    return list(csv.DictReader(io.StringIO(text)))
+
+def _validate_row(row):
+    '''행을 정규화하여 (값, 오류 메시지)를 반환'''
+    if not isinstance(row, dict):
+        return None, "잘못된 행 형식입니다."
+    missing = [field for field in BULK_FIELDS if row.get(field) in (None, '')]
+    if missing:
+        return None, f"필수 항목이 없습니다: {', '.join(missing)}"
+    try:
+        score = float(row['score'])
+    except (TypeError, ValueError):
+        return None, "점수는 숫자여야 합니다."
+    if not 0.0 <= score <= 4.5:
+        return None, "점수는 0.0 ~ 4.5 사이여야 합니다."
+    return {
+        'student_id': str(row['student_id']).strip(),
+        'subject_code': str(row['subject_code']).strip(),
+        'semester': str(row['semester']).strip(),
+        'score': score,
+        'grade': str(row['grade']).strip()
+    }, None
+
+def _grade_key(values):
+    return tuple(values[column] for column in GRADE_KEY)
+
+@ns_grades.route('/bulk')
+class GradeBulkInput(Resource):
+    @ns_grades.doc(description="교수(담당 과목만) 또는 관리자가 여러 성적을 한 번에 입력할 시 사용됩니다. JSON 배열 또는 CSV(text/csv 본문, multipart file)를 받으며, 같은 학생/과목/학기의 성적이 이미 있으면 점수와 학점을 수정하고 결과에 updated로 표시합니다.")
+    @ns_grades.expect([grade_bulk_model])
+    @ns_grades.response(201, '성적 입력 결과', grade_bulk_report_model)
+    @ns_grades.doc(params={'Idempotency-Key': {'in': 'header', 'description': '재시도 식별 키 (선택)'}})
+    @jwt_required()
+    @idempotent
+    def post(self):
+        '''성적 일괄 입력 (교수: 담당 과목만, 관리자: 모든 과목)'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role not in ['professor', 'admin']:
+            abort(403, message="접근 권한이 없습니다.")
+
+        rows = _read_rows()
+        if len(rows) > current_app.config['BULK_MAX_ROWS']:
+            abort(413, message=f"한 번에 최대 {current_app.config['BULK_MAX_ROWS']}건까지 입력할 수 있습니다.")
+
+        results = [None] * len(rows)
+        candidates = []
+        for index, row in enumerate(rows):
+            values, error = _validate_row(row)
+            if error:
+                results[index] = error
+            else:
+                candidates.append((index, values))
+
+        # 담당 교수 권한은 오래되었을 수 있는 과목 카탈로그 대신 DB에서 확인 (과목, 학생 각각 한 번의 쿼리)
+        subject_codes = {values['subject_code'] for _, values in candidates}
+        student_ids = {values['student_id'] for _, values in candidates}
+
+        subjects = {}
+        if subject_codes:
+            subjects = dict(db.session.execute(
+                db.select(Subject.code, Subject.professor_id).filter(Subject.code.in_(subject_codes))
+            ).all())
+        students = set()
+        if student_ids:
+            students = set(db.session.scalars(
+                db.select(User.id).filter(User.id.in_(student_ids), User.role == 'student')
+            ))
+
+        new_grades = []
+        rows_by_key = {}
+        for index, values in candidates:
+            key = _grade_key(values)
+            if values['subject_code'] not in subjects:
+                results[index] = "해당 과목을 찾을 수 없습니다."
+            elif role == 'professor' and subjects[values['subject_code']] != user_id:
+                results[index] = "담당하지 않은 과목에 성적을 입력할 수 없습니다."
+            elif values['student_id'] not in students:
+                results[index] = "해당 학생을 찾을 수 없습니다."
+            elif key in rows_by_key:
+                # 한 문장에서 같은 키를 두 번 수정할 수 없으므로 요청 안의 중복 행은 거부
+                results[index] = "같은 성적이 요청에 중복되어 있습니다."
+            else:
+                rows_by_key[key] = index
+                new_grades.append(values)
+
+        # 점수 기준 정책이 있는 과목은 요청의 학점 대신 점수로 학점을 계산
+        for subject_code, rules in absolute_policies({values['subject_code'] for values in new_grades}).items():
+            subject_grades = [values for values in new_grades if values['subject_code'] == subject_code]
+            letters = compute_letters([values['score'] for values in subject_grades], 'absolute', rules)
+            for values, letter in zip(subject_grades, letters):
+                values['grade'] = letter
+
+        # 겹치는 업로드끼리 교착되지 않도록 항상 고유 키 순서로 잠금
+        batch_size = current_app.config['BULK_INSERT_BATCH_SIZE']
+        new_grades.sort(key=_grade_key)
+        key_columns = [getattr(Grade, column) for column in GRADE_KEY]
+        existing = set()
+        for start in range(0, len(new_grades), batch_size):
+            batch = new_grades[start:start + batch_size]
+            existing.update(tuple(key) for key in db.session.execute(
+                db.select(*key_columns).filter(tuple_(*key_columns).in_([_grade_key(values) for values in batch]))
+            ))
+            db.session.execute(upsert(Grade, batch, GRADE_KEY, lambda new: {'score': new.score, 'grade': new.grade}))
+        rebuild_summary({values['student_id'] for values in new_grades})
+        bump(*(marker for values in new_grades
+               for marker in grade_markers(values['student_id'], values['subject_code'], values['semester'])))
+        db.session.commit()
+        for subject_code, semester in {(values['subject_code'], values['semester']) for values in new_grades}:
+            invalidate_statistics(subject_code, semester)
+
+        statuses = ['error' if error else 'created' for error in results]
+        for key in existing & rows_by_key.keys():
+            statuses[rows_by_key[key]] = 'updated'
+        report = {
+            'created': statuses.count('created'),
+            'updated': statuses.count('updated'),
+            'failed': statuses.count('error'),
+            'results': [
+                {'row': index + 1, 'status': status, 'message': error}
+                for index, (status, error) in enumerate(zip(statuses, results))
+            ]
+        }
+        return report, 201 if new_grades else 400
@@ -0,0 +1,121 @@
+from flask import request
+from flask_restx import Resource, fields, reqparse, inputs, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..models import GradingPolicy
+from ..subject_catalog import load_subject
+from ..grading import METHODS, normalize_rules, apply_policy
+from .. import db
+from .grade import ns_grades
+
+# 성적 산정 정책 모델
+grading_policy_model = ns_grades.model('GradingPolicy', {
+    'subject_code': fields.String(readOnly=True, description='과목 코드'),
+    'method': fields.String(required=True, enum=list(METHODS), description='정책 (absolute: 점수 기준, relative: 석차 비율, zscore: 표준 점수 기준)'),
+    'rules': fields.Raw(description='정책 기준 (생략 시 기본 기준) 예: {"cutoffs": [[4.0, "A"], [3.0, "B"]], "else": "C"}, {"quotas": [["A", 0.3], ["B", 0.4]], "else": "C"}')
+})
+
+grading_result_model = ns_grades.model('GradingResult', {
+    'subject_code': fields.String(description='과목 코드'),
+    'semester': fields.String(description='학기'),
+    'method': fields.String(description='적용한 정책'),
+    'dry_run': fields.Boolean(description='저장하지 않고 결과만 계산했는지 여부'),
+    'count': fields.Integer(description='성적 수'),
+    'changed': fields.Integer(description='학점이 바뀐 성적 수'),
+    'distribution': fields.Raw(description='학점별 인원')
+})
+
+apply_parser = reqparse.RequestParser()
+apply_parser.add_argument('dry_run', type=inputs.boolean, location='args', default=False,
+                          help='true면 저장하지 않고 결과만 계산')
+
+def managed_subject(subject_code):
+    '''교수는 담당 과목만, 관리자는 모든 과목의 정책을 관리'''
+    current_user = get_jwt_identity()
+    user_id, role = current_user.split(':')
+
+    if role not in ['professor', 'admin']:
+        abort(403, message="접근 권한이 없습니다.")
+
+    subject = load_subject(subject_code)
+    if not subject:
+        abort(404, message="해당 과목을 찾을 수 없습니다.")
+
+    if role == 'professor' and subject.professor_id != user_id:
+        abort(403, message="담당하지 않은 과목의 성적 정책은 관리할 수 없습니다.")
+    return subject
+
+# 과목별 성적 산정 정책 조회, 설정, 삭제
+@ns_grades.route('/policies/<string:subject_code>')
+@ns_grades.param('subject_code', '과목 코드')
+class GradingPolicyResource(Resource):
+    @ns_grades.doc(description="교수가 담당 과목의, 관리자가 모든 과목의 성적 산정 정책을 조회할 시 사용됩니다.")
+    @ns_grades.marshal_with(grading_policy_model)
+    @jwt_required()
+    def get(self, subject_code):
+        '''성적 산정 정책 조회'''
+        managed_subject(subject_code)
+        policy = db.session.get(GradingPolicy, subject_code)
+        if not policy:
+            abort(404, message="해당 과목의 성적 산정 정책이 없습니다.")
+        return policy.to_dict()
+
+    @ns_grades.doc(description="교수가 담당 과목의, 관리자가 모든 과목의 성적 산정 정책을 설정할 시 사용됩니다. 점수 기준(absolute) 정책이 있는 과목은 성적 입력/수정 시 학점을 점수로 계산합니다.")
+    @ns_grades.expect(grading_policy_model)
+    @ns_grades.marshal_with(grading_policy_model)
+    @jwt_required()
+    def put(self, subject_code):
+        '''성적 산정 정책 설정'''
+        managed_subject(subject_code)
+        data = request.json or {}
+        try:
+            rules = normalize_rules(data.get('method'), data.get('rules'))
+        except ValueError as e:
+            abort(400, message=str(e))
+
+        policy = db.session.get(GradingPolicy, subject_code)
+        if policy is None:
+            policy = GradingPolicy(subject_code=subject_code)
+            db.session.add(policy)
+        policy.method = data['method']
+        policy.rules = rules
+        result = policy.to_dict()
+        db.session.commit()
+        return result, 200
+
+    @ns_grades.doc(description="성적 산정 정책을 삭제합니다. 이미 계산된 학점은 바뀌지 않습니다.")
+    @jwt_required()
+    def delete(self, subject_code):
+        '''성적 산정 정책 삭제'''
+        managed_subject(subject_code)
+        policy = db.session.get(GradingPolicy, subject_code)
+        if not policy:
+            abort(404, message="해당 과목의 성적 산정 정책이 없습니다.")
+        db.session.delete(policy)
+        db.session.commit()
+        return "성적 산정 정책을 삭제했습니다.", 204
+
+# 과목/학기 성적 전체에 정책 적용
+@ns_grades.route('/policies/<string:subject_code>/semester/<string:semester>/apply')
+@ns_grades.param('subject_code', '과목 코드')
+@ns_grades.param('semester', '학기')
+class GradingPolicyApply(Resource):
+    @ns_grades.doc(description="과목의 성적 산정 정책으로 해당 학기 수강생 전체의 학점을 다시 계산합니다. 점수는 바뀌지 않으며, dry_run=true면 저장하지 않고 학점별 인원만 반환합니다.")
+    @ns_grades.expect(apply_parser)
+    @ns_grades.marshal_with(grading_result_model)
+    @jwt_required()
+    def post(self, subject_code, semester):
+        '''성적 산정 정책 적용'''
+        managed_subject(subject_code)
+        dry_run = apply_parser.parse_args()['dry_run']
+        policy = db.session.get(GradingPolicy, subject_code)
+        if not policy:
+            abort(404, message="해당 과목의 성적 산정 정책이 없습니다.")
+
+        result = apply_policy(subject_code, semester, policy.method, policy.rules, dry_run=dry_run)
+        if result is None:
+            abort(404, message="해당 과목의 성적이 없습니다.")
+        response = {'subject_code': subject_code, 'semester': semester, 'method': policy.method,
+                    'dry_run': dry_run, **result}
+        if not dry_run:
+            db.session.commit()
+        return response, 200
@@ -0,0 +1,85 @@
+from flask_restx import Resource, fields, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..models import User
+from ..subject_catalog import get_subject
+from ..ranking import group_rank
+from .. import db
+from .grade import ns_grades
+
+# 순위 모델 (동점자는 같은 순위, 백분위는 자신보다 순위가 낮은 학생의 비율)
+rank_model = ns_grades.model('Rank', {
+    'value': fields.Float(description='순위 기준 값 (과목 점수 또는 누적 평점)'),
+    'rank': fields.Integer(description='순위 (1부터)'),
+    'total': fields.Integer(description='그룹 인원'),
+    'percentile': fields.Float(description='백분위 (%)')
+})
+
+subject_rank_model = ns_grades.model('SubjectRank', {
+    'student_id': fields.String(description='학생 ID'),
+    'subject_code': fields.String(description='과목 코드'),
+    'semester': fields.String(description='학기'),
+    'rank': fields.Nested(rank_model, description='수강생 중 점수 순위')
+})
+
+student_rank_model = ns_grades.model('StudentRank', {
+    'student_id': fields.String(description='학생 ID'),
+    'department': fields.String(description='학과'),
+    'admission_year': fields.Integer(description='입학년도'),
+    'department_rank': fields.Nested(rank_model, allow_null=True, description='학과 내 누적 평점 순위'),
+    'cohort_rank': fields.Nested(rank_model, allow_null=True, description='같은 입학년도 학생 중 누적 평점 순위')
+})
+
+# 과목/학기 수강생 중 점수 순위
+@ns_grades.route('/rank/subject/<string:subject_code>/semester/<string:semester>/student/<string:student_id>')
+@ns_grades.param('subject_code', '과목 코드')
+@ns_grades.param('semester', '학기')
+@ns_grades.param('student_id', '학번')
+class SubjectRank(Resource):
+    @ns_grades.doc(description="과목/학기 수강생 중 학생의 점수 순위와 백분위를 조회합니다. 학생은 자신의 순위만, 교수는 담당 과목의 순위만 조회할 수 있습니다.")
+    @ns_grades.marshal_with(subject_rank_model)
+    @jwt_required()
+    def get(self, subject_code, semester, student_id):
+        '''과목 내 순위 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role == 'student' and user_id != student_id:
+            abort(403, message="데이터에 접근 권한이 없습니다.")
+        if role == 'professor':
+            subject = get_subject(subject_code)
+            if not subject:
+                abort(404, message="해당 과목을 찾을 수 없습니다.")
+            if subject.professor_id != user_id:
+                abort(403, message="담당하지 않은 과목의 순위는 조회할 수 없습니다.")
+
+        rank = group_rank(('course', subject_code, semester), student_id)
+        if rank is None:
+            abort(404, message="해당 학기에 학생의 과목 점수가 없습니다.")
+        return {'student_id': student_id, 'subject_code': subject_code, 'semester': semester, 'rank': rank}
+
+# 학과, 입학년도 내 누적 평점 순위
+@ns_grades.route('/rank/student/<string:student_id>')
+@ns_grades.param('student_id', '학번')
+class StudentRank(Resource):
+    @ns_grades.doc(description="학생의 누적 평점으로 학과 내 순위와 같은 입학년도 학생 중 순위를 조회합니다. 학생은 자신의 순위만 조회할 수 있습니다. 성적이 없는 학생은 순위가 null입니다.")
+    @ns_grades.marshal_with(student_rank_model)
+    @jwt_required()
+    def get(self, student_id):
+        '''학과/입학년도 내 순위 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role == 'student' and user_id != student_id:
+            abort(403, message="데이터에 접근 권한이 없습니다.")
+
+        student = db.session.get(User, student_id)
+        if not student or student.role != 'student':
+            abort(404, message="학생을 찾을 수 없습니다.")
+
+        return {
+            'student_id': student_id,
+            'department': student.department,
+            'admission_year': student.admission_year,
+            'department_rank': group_rank(('department', student.department), student_id) if student.department else None,
+            'cohort_rank': group_rank(('cohort', student.admission_year), student_id)
+        }
@@ -0,0 +1,54 @@
+from flask_restx import Resource, fields, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..subject_catalog import get_subject
+from ..grade_stats import subject_statistics
+from .grade import ns_grades
+
+# 성적 통계 모델
+histogram_bin_model = ns_grades.model('ScoreHistogramBin', {
+    'lower': fields.Float(description='구간 하한'),
+    'upper': fields.Float(description='구간 상한'),
+    'count': fields.Integer(description='구간 내 인원')
+})
+
+grade_statistics_model = ns_grades.model('GradeStatistics', {
+    'subject_code': fields.String(description='과목 코드'),
+    'semester': fields.String(description='학기'),
+    'count': fields.Integer(description='성적 수'),
+    'mean': fields.Float(description='평균'),
+    'std': fields.Float(description='표준편차'),
+    'min': fields.Float(description='최저점'),
+    'max': fields.Float(description='최고점'),
+    'median': fields.Float(description='중앙값'),
+    'percentiles': fields.Raw(description='백분위수 (p10, p25, p50, p75, p90)'),
+    'histogram': fields.List(fields.Nested(histogram_bin_model), description='점수 분포')
+})
+
+# 과목/학기별 성적 통계 조회
+@ns_grades.route('/statistics/subject/<string:subject_code>/semester/<string:semester>')
+@ns_grades.param('subject_code', '과목 코드')
+@ns_grades.param('semester', '학기')
+class GradeStatistics(Resource):
+    @ns_grades.doc(description="교수가 담당 과목의, 관리자가 모든 과목의 학기별 성적 통계(평균, 표준편차, 백분위수, 분포)를 조회할 시 사용됩니다.")
+    @ns_grades.marshal_with(grade_statistics_model)
+    @jwt_required()
+    def get(self, subject_code, semester):
+        '''과목/학기별 성적 통계 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role not in ['professor', 'admin']:
+            abort(403, message="접근 권한이 없습니다.")
+
+        subject = get_subject(subject_code)
+        if not subject:
+            abort(404, message="해당 과목을 찾을 수 없습니다.")
+
+        if role == 'professor' and subject.professor_id != user_id:
+            abort(403, message="담당하지 않은 과목의 통계는 조회할 수 없습니다.")
+
+        statistics = subject_statistics(subject_code, semester)
+        if statistics is None:
+            abort(404, message="해당 과목의 성적이 없습니다.")
+
+        return {'subject_code': subject_code, 'semester': semester, **statistics}
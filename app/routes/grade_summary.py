@@ -0,0 +1,49 @@
+from flask_restx import Resource, fields, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..models import StudentSemesterSummary
+from ..summary import TOTAL
+from ..response_cache import cached
+from ..versions import STUDENT, SUBJECTS_CATALOG
+from .grade import ns_grades
+
+# 학생별 성적 요약 모델
+semester_summary_model = ns_grades.model('SemesterSummary', {
+    'semester': fields.String(description='학기 (누적 요약은 TOTAL)'),
+    'credits_attempted': fields.Integer(description='신청 학점'),
+    'credits_earned': fields.Integer(description='취득 학점 (F 제외)'),
+    'gpa': fields.Float(description='학점 가중 평점')
+})
+
+student_summary_model = ns_grades.model('StudentSummary', {
+    'student_id': fields.String(description='학생 ID'),
+    'semesters': fields.List(fields.Nested(semester_summary_model), description='학기별 요약'),
+    'cumulative': fields.Nested(semester_summary_model, allow_null=True, description='누적 요약')
+})
+
+# 학생별 성적 요약 조회
+@ns_grades.route('/summary/<student_id>')
+@ns_grades.param('student_id', '학번')
+class GradeSummaryByStudent(Resource):
+    @ns_grades.doc(description="학생의 학기별/누적 신청 학점, 취득 학점, 평점을 조회합니다. 접근 권한은 학생별 성적 조회와 같습니다.")
+    @jwt_required()
+    @cached(lambda student_id: [(STUDENT, student_id), SUBJECTS_CATALOG])
+    @ns_grades.marshal_with(student_summary_model)
+    def get(self, student_id):
+        '''특정 학생의 성적 요약 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role == 'student' and user_id != student_id:
+            abort(403, message="데이터에 접근 권한이 없습니다.")
+
+        # 기본 키(student_id, semester) 범위 조회 한 번으로 학기별, 누적 요약을 함께 가져옴
+        summaries = StudentSemesterSummary.query.filter_by(student_id=student_id)\
+                      .order_by(StudentSemesterSummary.semester).all()
+        if not summaries:
+            abort(404, message="학생의 성적을 찾을 수 없습니다.")
+
+        return {
+            'student_id': student_id,
+            'semesters': [summary.to_dict() for summary in summaries if summary.semester != TOTAL],
+            'cumulative': next((summary.to_dict() for summary in summaries if summary.semester == TOTAL), None)
+        }
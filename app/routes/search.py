@@ -0,0 +1,46 @@
+from flask import current_app
+from flask_restx import Namespace, Resource, fields, reqparse, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..search import search, USERS, SUBJECTS
+from .user import user_model
+from .subject import subject_model
+
+# 사용자/과목 검색
+# 검색 관련 네임스페이스
+ns_search = Namespace('search', description='사용자/과목 검색')
+
+search_parser = reqparse.RequestParser()
+search_parser.add_argument('q', type=str, location='args', required=True, help='검색어 (앞부분 일치, 2글자 이상이면 부분 일치)')
+search_parser.add_argument('type', type=str, location='args', choices=(USERS, SUBJECTS),
+                           help='검색 대상 (생략 시 모두)')
+search_parser.add_argument('limit', type=int, location='args', help='종류별 최대 결과 수')
+
+search_result_model = ns_search.model('SearchResult', {
+    'users': fields.List(fields.Nested(user_model), description='학번(직번), 이름, 학과가 일치하는 사용자'),
+    'subjects': fields.List(fields.Nested(subject_model), description='과목 코드, 과목명이 일치하는 과목')
+})
+
+@ns_search.route('/')
+class Search(Resource):
+    @ns_search.doc(description="사용자(학번, 이름, 학과)와 과목(과목 코드, 과목명)을 검색합니다. 앞부분이 일치하는 항목을 먼저, 부분 일치 항목을 다음에 반환합니다. 사용자 검색은 관리자만 가능하며, 다른 역할은 과목만 검색됩니다.")
+    @ns_search.expect(search_parser)
+    @jwt_required()
+    @ns_search.response(200, '검색 결과', search_result_model)
+    def get(self):
+        '''사용자/과목 검색'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        args = search_parser.parse_args()
+        if args['type'] == USERS and role != 'admin':
+            abort(403, message="관리자만 사용자를 검색할 수 있습니다.")
+        limit = args['limit'] if args['limit'] is not None else current_app.config['SEARCH_MAX_RESULTS']
+        if limit < 1:
+            abort(400, message="limit은 1 이상이어야 합니다.")
+        limit = min(limit, current_app.config['SEARCH_MAX_RESULTS'])
+
+        kinds = [args['type']] if args['type'] else [USERS, SUBJECTS] if role == 'admin' else [SUBJECTS]
+        result = {USERS: [], SUBJECTS: []}
+        for kind in kinds:
+            result[kind] = search(kind, args['q'], limit)
+        return result, 200
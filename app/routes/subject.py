@@ -1,7 +1,13 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from ..models import Subject
+from ..models import Subject, Grade
+from ..pagination import pagination_parser, page_args, paginate
+from ..summary import rebuild as rebuild_summary
+from ..response_cache import cached
+from ..versions import bump, SUBJECT, SUBJECTS_CATALOG
+from ..subject_catalog import find_subject
+from ..search import record as record_search, SUBJECTS
 from .. import db
 
 # 과목 정보 CRUD
@@ -16,12 +22,20 @@ subject_model = ns_subjects.model('Subject', {
     'professor_id': fields.String(description='교수 ID')
 })
 
+# 과목 목록 페이지 모델
+subject_page_model = ns_subjects.model('SubjectPage', {
+    'items': fields.List(fields.Nested(subject_model), description='과목 목록'),
+    'next': fields.String(description='다음 페이지 커서 (마지막 페이지면 null)')
+})
+
 # Create, Read
 @ns_subjects.route('/')
 class SubjectCreateAndRead(Resource):
-    @ns_subjects.doc(description="관리자가 모든 과목을 조회할 때 사용됩니다.")
-    @ns_subjects.marshal_list_with(subject_model)
+    @ns_subjects.doc(description="관리자가 모든 과목을 과목 코드 순으로 페이지 단위 조회할 때 사용됩니다.")
+    @ns_subjects.expect(pagination_parser)
     @jwt_required()
+    @cached(lambda: [SUBJECTS_CATALOG])
+    @ns_subjects.marshal_with(subject_page_model)
     def get(self):
         '''모든 과목 조회'''
         current_user = get_jwt_identity()
@@ -30,8 +44,9 @@ class SubjectCreateAndRead(Resource):
         if role != 'admin':
             abort(403, message="관리자만 접근 가능합니다.")
         
-        subjects = Subject.query.all()
-        return subjects
+        limit, after = page_args()
+        subjects, next_cursor = paginate(Subject.query, Subject.code, limit, after)
+        return {'items': subjects, 'next': next_cursor}
 
     @ns_subjects.doc(description="관리자가 새로운 과목을 추가할 때 사용됩니다.")
     @ns_subjects.expect(subject_model)
@@ -54,6 +69,8 @@ class SubjectCreateAndRead(Resource):
         )
 
         db.session.add(subject)
+        bump(SUBJECTS_CATALOG)
+        record_search(SUBJECTS, subject.code, subject)
         db.session.commit()
 
         return subject, 201
@@ -63,8 +80,9 @@ class SubjectCreateAndRead(Resource):
 @ns_subjects.param('subject_name', '과목 이름')
 class SubjectUpdateAndDelete(Resource):
     @ns_subjects.doc(description="관리자가 특정 과목을 조회할 때 사용됩니다.")
-    @ns_subjects.marshal_with(subject_model)
     @jwt_required()
+    @cached(lambda subject_name: [SUBJECTS_CATALOG])
+    @ns_subjects.marshal_with(subject_model)
     def get(self, subject_name):
         '''특정 과목 조회'''
         current_user = get_jwt_identity()
@@ -73,11 +91,11 @@ class SubjectUpdateAndDelete(Resource):
         if role != 'admin':
             abort(403, message="관리자만 접근 가능합니다.")
 
-        subject = Subject.query.filter_by(name=subject_name).first()
+        subject = find_subject(subject_name)
         if not subject:
             abort(404, "과목을 찾을 수 없습니다.")
 
-        return subject
+        return subject._asdict()
     
     @ns_subjects.doc(desciption="관리자가 특정 과목을 삭제할 때 사용됩니다.")
     @jwt_required()
@@ -94,6 +112,8 @@ class SubjectUpdateAndDelete(Resource):
             abort(404, message="과목을 찾을 수 없습니다.")
 
         db.session.delete(subject)
+        bump(SUBJECTS_CATALOG, (SUBJECT, subject.code))
+        record_search(SUBJECTS, subject.code)
         db.session.commit()
 
         return "과목을 삭제했습니다.", 204
@@ -115,12 +135,24 @@ class SubjectUpdateAndDelete(Resource):
             abort(404, message="해당 과목을 찾을 수 없습니다.")
 
         data = request.json
+        credits_changed = subject.credits != data['credits']
+        old_code = subject.code
 
         subject.code = data['code']
         subject.name = data['name']
         subject.credits = data['credits']
         subject.professor_id = data['professor_id']
 
+        # 학점이 바뀌면 해당 과목을 수강한 학생들의 성적 요약을 다시 계산
+        if credits_changed:
+            db.session.flush()
+            student_ids = db.session.scalars(
+                db.select(Grade.student_id).filter(Grade.subject_code == subject.code).distinct()
+            ).all()
+            rebuild_summary(student_ids)
+
+        bump(SUBJECTS_CATALOG, (SUBJECT, old_code), (SUBJECT, subject.code))
+        record_search(SUBJECTS, old_code, subject)
         db.session.commit()
 
         return subject
\ No newline at end of file
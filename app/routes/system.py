@@ -0,0 +1,72 @@
+from flask import current_app
+from flask_restx import Namespace, Resource, fields, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from ..response_cache import response_cache
+from .. import db
+
+# 시스템 상태 네임스페이스
+ns_system = Namespace('system', description='시스템 상태 조회')
+
+# 커넥션 풀 상태 모델
+pool_status_model = ns_system.model('PoolStatus', {
+    'pid': fields.Integer(description='워커 프로세스 ID'),
+    'pool_size': fields.Integer(description='풀 크기'),
+    'checked_in': fields.Integer(description='풀에서 대기 중인 연결 수'),
+    'checked_out': fields.Integer(description='사용 중인 연결 수'),
+    'overflow': fields.Integer(description='풀 크기를 초과해 생성된 연결 수'),
+    'connects': fields.Integer(description='생성된 연결 수 (누적)'),
+    'closes': fields.Integer(description='종료된 연결 수 (누적)'),
+    'invalidations': fields.Integer(description='무효화된 연결 수 (누적)'),
+    'checkouts': fields.Integer(description='연결 대여 횟수 (누적)'),
+    'checkins': fields.Integer(description='연결 반납 횟수 (누적)'),
+    'wait_count': fields.Integer(description='대기 시간 측정 횟수'),
+    'wait_total_ms': fields.Float(description='연결 대여 대기 시간 합계(ms)'),
+    'wait_avg_ms': fields.Float(description='연결 대여 평균 대기 시간(ms)'),
+    'wait_max_ms': fields.Float(description='연결 대여 최대 대기 시간(ms)')
+})
+
+# 커넥션 풀 상태 조회
+@ns_system.route('/pool')
+class PoolStatus(Resource):
+    @ns_system.doc(description="관리자가 현재 워커의 DB 커넥션 풀 사용량과 대기 시간을 조회할 때 사용됩니다.")
+    @ns_system.marshal_with(pool_status_model)
+    @jwt_required()
+    def get(self):
+        '''커넥션 풀 상태 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role != 'admin':
+            abort(403, message="관리자만 접근 가능합니다.")
+
+        return current_app.extensions['pool_stats'].snapshot(db.engine.pool)
+
+# 응답 캐시 상태 모델
+cache_status_model = ns_system.model('CacheStatus', {
+    'backend': fields.String(description='캐시 백엔드 (memory, redis)'),
+    'size': fields.Integer(description='저장된 응답 수 (memory 백엔드)'),
+    'max_entries': fields.Integer(description='최대 저장 응답 수 (memory 백엔드)'),
+    'hits': fields.Integer(description='캐시 적중 횟수 (누적)'),
+    'misses': fields.Integer(description='캐시 미스 횟수 (누적)'),
+    'evictions': fields.Integer(description='용량 초과로 제거된 응답 수 (누적)'),
+    'invalidations': fields.Integer(description='쓰기로 무효화된 응답 수 (누적)')
+})
+
+# 응답 캐시 상태 조회
+@ns_system.route('/cache')
+class CacheStatus(Resource):
+    @ns_system.doc(description="관리자가 현재 워커의 조회 응답 캐시 적중률과 제거 횟수를 조회할 때 사용됩니다.")
+    @ns_system.marshal_with(cache_status_model)
+    @jwt_required()
+    def get(self):
+        '''응답 캐시 상태 조회'''
+        current_user = get_jwt_identity()
+        user_id, role = current_user.split(':')
+
+        if role != 'admin':
+            abort(403, message="관리자만 접근 가능합니다.")
+
+        cache = response_cache()
+        if cache is None:
+            abort(404, message="응답 캐시를 사용하지 않습니다.")
+        return cache.stats()
@@ -2,6 +2,10 @@ from flask import request
 from flask_restx import Namespace, Resource, fields, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from ..models import User
+from ..pagination import pagination_parser, page_args, paginate
+from ..response_cache import cached
+from ..versions import bump, USERS_CATALOG
+from ..search import record as record_search, USERS
 from .. import db
 
 # 사용자 정보 CRUD
@@ -26,12 +30,20 @@ register_model = ns_users.model('Register', {
     'admission_year': fields.Integer(required=True, description='입학년도(고용년도)')
 })
 
+# 사용자 목록 페이지 모델
+user_page_model = ns_users.model('UserPage', {
+    'items': fields.List(fields.Nested(user_model), description='사용자 목록'),
+    'next': fields.String(description='다음 페이지 커서 (마지막 페이지면 null)')
+})
+
 # Create, Read
 @ns_users.route('/')
 class UserCreateAndRead(Resource):
-    @ns_users.doc(description="관리자가 모든 시스템 사용자를 조회할 때 사용됩니다.")
-    @ns_users.marshal_list_with(user_model, code=200)
+    @ns_users.doc(description="관리자가 모든 시스템 사용자를 학번(직번) 순으로 페이지 단위 조회할 때 사용됩니다.")
+    @ns_users.expect(pagination_parser)
     @jwt_required()
+    @cached(lambda: [USERS_CATALOG])
+    @ns_users.marshal_with(user_page_model, code=200)
     def get(self):
         '''모든 사용자 조회'''
         current_user = get_jwt_identity()
@@ -40,11 +52,12 @@ class UserCreateAndRead(Resource):
         if role != 'admin':
             abort(403, message="관리자만 접근 가능합니다.")
         
-        users = User.query.all()
-        if not users:
+        limit, after = page_args()
+        users, next_cursor = paginate(User.query, User.id, limit, after)
+        if not users and after is None:
             return {'message': '사용자가 존재하지 않습니다'}, 204
         
-        return users
+        return {'items': users, 'next': next_cursor}
     
     @ns_users.doc(description="새로운 사용자를 생성합니다.")
     @ns_users.expect(register_model)
@@ -74,6 +87,8 @@ class UserCreateAndRead(Resource):
         new_user.set_password(data['password'])
         
         db.session.add(new_user)
+        bump(USERS_CATALOG)
+        record_search(USERS, new_user.id, new_user)
         db.session.commit()
 
         return new_user, 201
@@ -83,8 +98,9 @@ class UserCreateAndRead(Resource):
 @ns_users.param('id', '사용자 학번(직번)')
 class UserUpdateAndDelete(Resource):
     @ns_users.doc(description="관리자가 특정 사용자 정보를 조회할 때 사용됩니다.")
-    @ns_users.marshal_with(user_model)
     @jwt_required()
+    @cached(lambda id: [USERS_CATALOG])
+    @ns_users.marshal_with(user_model)
     def get(self, id):
         '''특정 사용자 조회'''
         current_user = get_jwt_identity()
@@ -114,6 +130,8 @@ class UserUpdateAndDelete(Resource):
             abort(404, message="사용자를 찾을 수 없습니다.")
         
         db.session.delete(user)
+        bump(USERS_CATALOG)
+        record_search(USERS, id)
         db.session.commit()
 
         return "데이터를 삭제했습니다.", 204
@@ -148,6 +166,8 @@ class UserUpdateAndDelete(Resource):
         if 'role' in data:
             user.role = data['role']
         
+        bump(USERS_CATALOG)
+        record_search(USERS, id, user)
         db.session.commit()
 
         response_data = {
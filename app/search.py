@@ -0,0 +1,215 @@
+import bisect
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import select, event
+from .models import User, Subject
+from .db_routing import RoutingSession
+from .versions import current_versions, USERS_CATALOG, SUBJECTS_CATALOG
+from . import db
+
+# 사용자/과목 메모리 검색 인덱스
+# 검색 필드(소문자, 공백 정리)를 정렬된 (텍스트, 키) 목록과 2-gram(한글은 음절 2개) → 키 집합으로 색인한다.
+# - 앞부분 일치: 정렬 목록에서 bisect로 찾아 텍스트 순으로 반환 (O(log n + 결과 수))
+# - 부분 일치(2글자 이상): 검색어의 2-gram 키 집합을 작은 것부터 교집합하고 실제로 포함하는지 확인
+# 워커별로 첫 검색 때 만들고, 같은 워커의 사용자/과목 쓰기는 커밋 후 해당 항목만 갱신한다.
+# 다른 워커의 변경은 SEARCH_SYNC_INTERVAL 초마다 카탈로그 버전을 확인하여 바뀌었으면 백그라운드 스레드에서
+# 다시 만들어 교체한다 (종류별로 한 번에 하나만 실행, 교체 전까지는 기존 인덱스로 응답하므로 요청이 전체 조회를
+# 기다리지 않음). 다시 만드는 동안 이 워커에서 커밋된 변경은 모아 두었다가 새 인덱스에도 적용한다.
+USERS = 'users'
+SUBJECTS = 'subjects'
+
+def normalize(text):
+    return ' '.join(str(text).lower().split())
+
+def ngrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+def user_doc(user):
+    '''(학번, 검색 결과 항목, 검색 텍스트)'''
+    doc = {'id': user.id, 'role': user.role, 'name': user.name,
+           'department': user.department, 'admission_year': user.admission_year}
+    return user.id, doc, (user.id, user.name, user.department)
+
+def subject_doc(subject):
+    doc = {'code': subject.code, 'name': subject.name, 'credits': subject.credits,
+           'professor_id': subject.professor_id}
+    return subject.code, doc, (subject.code, subject.name)
+
+# 종류별 (카탈로그 버전, 조회 컬럼, 항목 변환)
+SOURCES = {
+    USERS: (USERS_CATALOG, (User.id, User.role, User.name, User.department, User.admission_year), user_doc),
+    SUBJECTS: (SUBJECTS_CATALOG, (Subject.code, Subject.name, Subject.credits, Subject.professor_id), subject_doc)
+}
+
+class SearchIndex:
+    def __init__(self, entries=(), version=0):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self._docs = {}
+        self._prefix = []
+        self._grams = {}
+        for key, doc, texts in entries:
+            self._index(key, doc, texts)
+        self._prefix.sort()
+
+    def _index(self, key, doc, texts, place=list.append):
+        texts = tuple(dict.fromkeys(normalize(text) for text in texts if text))
+        self._docs[key] = (doc, texts)
+        for text in texts:
+            place(self._prefix, (text, key))
+        for gram in set().union(*map(ngrams, texts)):
+            self._grams.setdefault(gram, set()).add(key)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, key, doc, texts):
+        self.remove(key)
+        self._index(key, doc, texts, place=bisect.insort)
+
+    def remove(self, key):
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return
+        _, texts = entry
+        for text in texts:
+            del self._prefix[bisect.bisect_left(self._prefix, (text, key))]
+        for gram in set().union(*map(ngrams, texts)):
+            keys = self._grams[gram]
+            keys.discard(key)
+            if not keys:
+                del self._grams[gram]
+
+    def search(self, query, limit):
+        '''앞부분이 일치하는 항목(텍스트 순) 다음에 부분 일치 항목(키 순)을 최대 limit개 반환'''
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+
+        found = {}
+        position = bisect.bisect_left(self._prefix, (query,))
+        while position < len(self._prefix) and len(found) < limit:
+            text, key = self._prefix[position]
+            if not text.startswith(query):
+                break
+            found.setdefault(key, None)
+            position += 1
+
+        if len(found) < limit and len(query) >= 2:
+            postings = sorted((self._grams.get(gram, ()) for gram in ngrams(query)), key=len)
+            if postings and postings[0]:
+                contains = []
+                # 후보 전체를 정렬하지 않도록 limit개를 채우면 중단 (반환하는 항목만 정렬)
+                for key in postings[0]:
+                    if key in found or not all(key in keys for keys in postings[1:]):
+                        continue
+                    if any(query in text for text in self._docs[key][1]):
+                        contains.append(key)
+                        if len(found) + len(contains) >= limit:
+                            break
+                found.update(dict.fromkeys(sorted(contains)))
+
+        return [self._docs[key][0] for key in found]
+
+_lock = threading.Lock()
+
+def _indexes():
+    return current_app.extensions.setdefault('search_indexes', {})
+
+def _build(kind, version):
+    _, columns, to_doc = SOURCES[kind]
+    rows = db.session.execute(select(*columns)).all()
+    return SearchIndex((to_doc(row) for row in rows), version)
+
+def _rebuilds():
+    '''종류별 실행 중인 다시 만들기 (스레드, 그동안 이 워커에서 커밋된 변경 목록)'''
+    return current_app.extensions.setdefault('search_rebuilds', {})
+
+def _rebuild(app, kind, version):
+    with app.app_context():
+        try:
+            index = _build(kind, version)
+        except Exception:
+            app.logger.exception('검색 인덱스를 다시 만들지 못했습니다: %s', kind)
+            with _lock:
+                _rebuilds().pop(kind, None)
+            return
+        with _lock:
+            _, changes = _rebuilds().pop(kind)
+            for key, doc in changes:
+                index.remove(key)
+                if doc is not None:
+                    index.add(*doc)
+            _indexes()[kind] = index
+
+def get_index(kind):
+    '''
+    종류별 검색 인덱스 (없으면 만들고, 주기적으로 다른 워커의 변경 여부를 버전으로 확인)
+    버전이 바뀌었으면 백그라운드에서 다시 만들기를 시작하고 기존 인덱스를 반환
+    '''
+    now = time.monotonic()
+    with _lock:
+        index = _indexes().get(kind)
+        if index is not None:
+            if now - index.checked_at < current_app.config['SEARCH_SYNC_INTERVAL']:
+                return index
+            index.checked_at = now
+
+    version, = current_versions([SOURCES[kind][0]])
+    if index is None:
+        index = _build(kind, version)
+        with _lock:
+            return _indexes().setdefault(kind, index)
+
+    # 복제 지연으로 이 워커가 이미 반영한 버전보다 낮게 읽힐 수 있으므로 높아졌을 때만 다시 만듦
+    if version > index.version:
+        with _lock:
+            if kind not in _rebuilds():
+                thread = threading.Thread(target=_rebuild, args=(current_app._get_current_object(), kind, version),
+                                          name=f'search-rebuild-{kind}', daemon=True)
+                _rebuilds()[kind] = (thread, [])
+                thread.start()
+    return index
+
+def search(kind, query, limit):
+    index = get_index(kind)
+    with _lock:
+        return index.search(query, limit)
+
+def record(kind, key, obj=None):
+    '''
+    사용자/과목 쓰기 핸들러에서 커밋 전에 호출 (key: 변경 전 키, obj: 변경 후 객체, 삭제면 None)
+    커밋되면 이 워커의 인덱스에서 해당 항목만 갱신하고, 롤백되면 버림
+    '''
+    doc = SOURCES[kind][2](obj) if obj is not None else None
+    db.session.info.setdefault('search_changes', []).append((kind, key, doc))
+
+@event.listens_for(RoutingSession, 'after_commit')
+def apply_changes(session):
+    changes = session.info.pop('search_changes', None)
+    if not changes or not has_app_context():
+        return
+    indexes = current_app.extensions.get('search_indexes')
+    if not indexes:
+        return
+    with _lock:
+        for kind in {kind for kind, _, _ in changes}:
+            if kind in indexes:
+                # 쓰기 핸들러가 같은 트랜잭션에서 카탈로그 버전을 1 올렸으므로 인덱스 버전도 함께 올림
+                # (그 사이 다른 워커가 바꿨으면 다음 확인 때 버전이 달라 다시 만듦)
+                indexes[kind].version += 1
+        rebuilds = current_app.extensions.get('search_rebuilds', {})
+        for kind, key, doc in changes:
+            if kind in rebuilds:
+                rebuilds[kind][1].append((key, doc))
+            index = indexes.get(kind)
+            if index is None:
+                continue
+            index.remove(key)
+            if doc is not None:
+                index.add(*doc)
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def discard_changes(session):
+    session.info.pop('search_changes', None)
@@ -0,0 +1,105 @@
+import hashlib
+import itertools
+import random
+from sqlalchemy import insert
+from .models import User, Subject, Grade
+from .summary import rebuild as rebuild_summary
+from . import db
+
+# 대량 합성 데이터 생성
+# 같은 seed면 항상 같은 데이터를 만든다. 과목 수강 인원은 Zipf 분포(인기 과목에 수강생이 몰림)를,
+# 학생별 수강 과목 수는 재학 학기 수에 비례하는 평균 주변의 정규 분포를 따른다 (늦게 입학한 학생도 학기당
+# 수강 과목 수는 같음). 학생은 입학 학기부터만 수강하며, 한 학생이 같은 과목을 두 번 수강하지 않는다.
+# 생성한 행은 배치 단위로 executemany INSERT 한다.
+# academic_records.sql 데이터와 ID가 겹치지 않도록 학생 S, 교수 Q, 과목 G로 시작하는 ID를 사용한다.
+DEPARTMENTS = ['컴퓨터공학과', '전자공학과', '경영학과', '나노신소재공학과', '기계공학과',
+               '화학공학과', '경제학과', '국어국문학과', '수학과', '물리학과']
+SUBJECT_WORDS = ['자료구조', '알고리즘', '회로이론', '경영전략', '재료역학', '유기화학', '미시경제',
+                 '현대문학', '선형대수', '양자역학', '운영체제', '데이터베이스', '신호처리', '회계원리']
+GRADE_SCALE = [(4.5, 'A+'), (4.0, 'A'), (3.5, 'B+'), (3.0, 'B'), (2.5, 'C+'), (2.0, 'C'),
+               (1.5, 'D+'), (1.0, 'D'), (0.0, 'F')]
+GRADE_WEIGHTS = [12, 18, 20, 18, 12, 9, 5, 3, 3]
+PASSWORD_HASH = hashlib.sha256(b'1234').hexdigest()
+
+def semesters_from(first_year, count):
+    '''first_year-1 학기부터 count개 학기'''
+    return [f'{first_year + index // 2}-{index % 2 + 1}' for index in range(count)]
+
+def generate_rows(students=100000, professors=2000, subjects=5000, grades=10000000,
+                  semesters=20, first_year=2016, skew=1.1, seed=42):
+    '''(모델, 행 dict) 순서로 사용자, 과목, 성적 행을 생성'''
+    rng = random.Random(seed)
+    semester_list = semesters_from(first_year, semesters)
+
+    for index in range(professors):
+        yield User, {
+            'id': f'Q{index:06d}', 'role': 'professor', 'name': f'교수{index:06d}',
+            'department': DEPARTMENTS[index % len(DEPARTMENTS)],
+            'admission_year': first_year - rng.randint(0, 20), 'password_hash': PASSWORD_HASH
+        }
+
+    # 학생의 입학 학기 (앞쪽 학기에 더 많이 입학하지 않도록 균등 분포)
+    admissions = [rng.randrange(0, semesters, 2) for _ in range(students)]
+    for index, admission in enumerate(admissions):
+        yield User, {
+            'id': f'S{index:08d}', 'role': 'student', 'name': f'학생{index:08d}',
+            'department': DEPARTMENTS[rng.randrange(len(DEPARTMENTS))],
+            'admission_year': first_year + admission // 2, 'password_hash': PASSWORD_HASH
+        }
+
+    for index in range(subjects):
+        yield Subject, {
+            'code': f'G{index:06d}', 'name': f'{SUBJECT_WORDS[index % len(SUBJECT_WORDS)]}{index:06d}',
+            'credits': rng.choice([1, 2, 3, 3, 3, 4]), 'professor_id': f'Q{rng.randrange(professors):06d}'
+        }
+
+    # 순위가 높은 과목일수록 많이 선택되는 누적 가중치
+    subject_weights = list(itertools.accumulate(1 / (rank + 1) ** skew for rank in range(subjects)))
+    score_weights = list(itertools.accumulate(GRADE_WEIGHTS))
+    # 학기당 평균 수강 과목 수 (전체 성적 수 / 전체 재학 학기 수)
+    enrolled = sum(semesters - admission for admission in admissions)
+    per_semester = grades / enrolled if enrolled else 0
+
+    for index, admission in enumerate(admissions):
+        taken = semester_list[admission:]
+        mean = per_semester * len(taken)
+        count = min(max(0, round(rng.gauss(mean, mean / 4))), subjects)
+        codes = set()
+        while len(codes) < count:
+            code = rng.choices(range(subjects), cum_weights=subject_weights)[0]
+            if code in codes:
+                continue
+            codes.add(code)
+            score, grade = rng.choices(GRADE_SCALE, cum_weights=score_weights)[0]
+            yield Grade, {
+                'student_id': f'S{index:08d}', 'subject_code': f'G{code:06d}',
+                'semester': taken[rng.randrange(len(taken))], 'score': score, 'grade': grade
+            }
+
+def load(rows, batch_size=5000, progress=None):
+    '''생성한 행을 모델별 배치 INSERT로 입력하고, 모델별 입력 행 수를 반환'''
+    counts = {}
+    batch_model, batch = None, []
+
+    def flush():
+        if batch:
+            db.session.execute(insert(batch_model.__table__), batch)
+            db.session.commit()
+            counts[batch_model.__tablename__] = counts.get(batch_model.__tablename__, 0) + len(batch)
+            if progress:
+                progress(counts)
+
+    for model, row in rows:
+        if model is not batch_model or len(batch) >= batch_size:
+            flush()
+            batch_model, batch = model, []
+        batch.append(row)
+    flush()
+    return counts
+
+def generate(batch_size=5000, progress=None, **options):
+    '''합성 데이터를 입력하고 성적 요약을 다시 계산'''
+    counts = load(generate_rows(**options), batch_size, progress)
+    rebuild_summary()
+    db.session.commit()
+    return counts
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import namedtuple
+from flask import current_app, has_app_context
+from sqlalchemy import select, event
+from .models import Subject
+from .db_routing import RoutingSession
+from .versions import current_versions, SUBJECTS_CATALOG
+from . import db
+
+# 과목 카탈로그 캐시 (워커별)
+# 과목은 행 수가 적고 거의 바뀌지 않으므로, 성적 조회/입력마다 과목을 조회하지 않고 워커 메모리의
+# 카탈로그(코드 → 과목, 이름 → 코드)에서 찾는다.
+# 같은 워커의 과목 추가/수정/삭제는 커밋 직후 카탈로그를 버려 다음 조회 때 다시 읽고,
+# 다른 워커의 변경은 SUBJECT_CATALOG_SYNC_INTERVAL 초마다 과목 카탈로그 버전을 확인하여 반영한다.
+# 요약의 학점처럼 정확해야 하는 값은 카탈로그 대신 DB에서 함께 계산한다 (summary.subject_credits).
+# 카탈로그에 없는 과목(다른 워커가 방금 추가한 과목)은 DB에서 다시 찾고, 쓰기 권한 확인(담당 교수)은
+# 카탈로그 대신 기본 키로 조회한 현재 과목으로 한다 (load_subject).
+SubjectInfo = namedtuple('SubjectInfo', ['code', 'name', 'credits', 'professor_id'])
+
+class SubjectCatalog:
+    def __init__(self, subjects, version):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.by_code = {}
+        self.by_name = {}
+        # 이름이 같은 과목이 있으면 과목 코드가 가장 앞선 과목으로 찾음
+        for subject in sorted(subjects):
+            self.by_code[subject.code] = subject
+            self.by_name.setdefault(subject.name, subject.code)
+
+_lock = threading.Lock()
+
+def _load(version):
+    rows = db.session.execute(select(Subject.code, Subject.name, Subject.credits, Subject.professor_id)).all()
+    return SubjectCatalog([SubjectInfo(*row) for row in rows], version)
+
+def subject_catalog():
+    '''현재 과목 카탈로그 (없으면 읽고, 확인 주기가 지났으면 버전이 바뀐 경우에만 다시 읽음)'''
+    now = time.monotonic()
+    with _lock:
+        catalog = current_app.extensions.get('subject_catalog')
+        if catalog is not None:
+            if now - catalog.checked_at < current_app.config['SUBJECT_CATALOG_SYNC_INTERVAL']:
+                return catalog
+            catalog.checked_at = now
+
+    # 버전을 먼저 읽어야 그 사이의 변경이 다음 확인 때 반영됨
+    version, = current_versions([SUBJECTS_CATALOG])
+    if catalog is not None and version <= catalog.version:
+        return catalog
+    catalog = _load(version)
+    with _lock:
+        current_app.extensions['subject_catalog'] = catalog
+    return catalog
+
+def _info(subject):
+    return SubjectInfo(subject.code, subject.name, subject.credits, subject.professor_id) if subject else None
+
+def load_subject(code):
+    '''과목 코드로 DB에서 현재 과목 조회 (없으면 None), 담당 교수 권한 확인처럼 카탈로그가 오래되면 안 될 때 사용'''
+    return _info(db.session.get(Subject, code))
+
+def get_subject(code):
+    '''과목 코드로 과목 찾기 (카탈로그에 없으면 DB에서 찾고, 없으면 None)'''
+    subject = subject_catalog().by_code.get(code)
+    return subject if subject is not None else load_subject(code)
+
+def find_subject(name):
+    '''과목 이름으로 과목 찾기 (카탈로그에 없으면 DB에서 찾고, 없으면 None)'''
+    catalog = subject_catalog()
+    code = catalog.by_name.get(name)
+    if code is not None:
+        return catalog.by_code[code]
+    return _info(db.session.scalars(select(Subject).where(Subject.name == name).order_by(Subject.code).limit(1)).first())
+
+# 응답 캐시 무효화 리스너가 changed_markers를 꺼내기 전에 실행되도록 맨 앞에 등록
+@event.listens_for(RoutingSession, 'after_commit', insert=True)
+def discard_changed(session):
+    markers = session.info.get('changed_markers')
+    if markers and SUBJECTS_CATALOG in markers and has_app_context():
+        with _lock:
+            current_app.extensions.pop('subject_catalog', None)
@@ -0,0 +1,74 @@
+from sqlalchemy import select, insert, delete, func, case, literal
+from .models import Subject, Grade, StudentSemesterSummary
+from .upsert import upsert
+from . import db
+
+# 학생별 학기/누적 성적 요약 유지
+# 성적 입력/수정과 같은 트랜잭션 안에서 변경분만 반영하며,
+# 일괄 입력이나 과목 학점 변경처럼 여러 행이 바뀌면 해당 학생의 요약을 다시 계산한다.
+TOTAL = 'TOTAL'
+
+def subject_credits(subject_code):
+    '''과목 학점 (같은 SQL 문 안에서 조회되므로 캐시된 과목 정보가 오래되었어도 현재 학점을 사용)'''
+    return select(Subject.credits).where(Subject.code == subject_code).scalar_subquery()
+
+def _contribution(score, grade):
+    '''성적 한 건이 요약에 더하는 학점당 값 (이수 시도, 취득, 평점)'''
+    if score is None:
+        return 0, 0, 0.0
+    return 1, 0 if grade == 'F' else 1, score
+
+def apply_grade_change(student_id, semester, credits, old=None, new=None):
+    '''
+    성적 변경분을 학기 요약과 누적 요약에 반영 (커밋은 호출한 쪽에서 수행)
+    credits: 과목 학점 (숫자 또는 subject_credits(과목 코드))
+    old, new: 변경 전후의 (score, grade), 새로 입력된 성적이면 old는 None
+    '''
+    before = _contribution(*old) if old else (0, 0, 0.0)
+    after = _contribution(*new) if new else (0, 0, 0.0)
+    if before == after:
+        return
+    attempted = (after[0] - before[0]) * credits if after[0] != before[0] else 0
+    earned = (after[1] - before[1]) * credits if after[1] != before[1] else 0
+    points = after[2] * credits - before[2] * credits
+
+    # 처음 반영하는 학기/누적 요약은 입력하고, 있으면 더함 (동시에 첫 성적을 입력해도 기본 키 위반 없음)
+    # 학기 코드(숫자로 시작)가 TOTAL보다 앞서므로 항상 같은 순서로 잠김
+    rows = [{'student_id': student_id, 'semester': key, 'credits_attempted': attempted,
+             'credits_earned': earned, 'grade_points': points} for key in (semester, TOTAL)]
+    db.session.execute(upsert(StudentSemesterSummary, rows, ['student_id', 'semester'], lambda new: {
+        'credits_attempted': StudentSemesterSummary.credits_attempted + new.credits_attempted,
+        'credits_earned': StudentSemesterSummary.credits_earned + new.credits_earned,
+        'grade_points': StudentSemesterSummary.grade_points + new.grade_points
+    }))
+
+def _aggregate(semester_column, group_by, student_ids):
+    query = select(
+        Grade.student_id,
+        semester_column,
+        func.sum(Subject.credits),
+        func.sum(case((Grade.grade == 'F', 0), else_=Subject.credits)),
+        func.sum(Grade.score * Subject.credits)
+    ).join(Subject, Grade.subject_code == Subject.code).where(Grade.score.isnot(None))
+    if student_ids is not None:
+        query = query.where(Grade.student_id.in_(student_ids))
+    return query.group_by(*group_by)
+
+def rebuild(student_ids=None):
+    '''성적 테이블에서 요약을 다시 계산 (student_ids가 없으면 전체), 커밋은 호출한 쪽에서 수행'''
+    if student_ids is not None:
+        student_ids = list(student_ids)
+        if not student_ids:
+            return
+
+    columns = ['student_id', 'semester', 'credits_attempted', 'credits_earned', 'grade_points']
+    clear = delete(StudentSemesterSummary)
+    if student_ids is not None:
+        clear = clear.where(StudentSemesterSummary.student_id.in_(student_ids))
+    db.session.execute(clear)
+    db.session.execute(insert(StudentSemesterSummary).from_select(
+        columns, _aggregate(Grade.semester, [Grade.student_id, Grade.semester], student_ids)
+    ))
+    db.session.execute(insert(StudentSemesterSummary).from_select(
+        columns, _aggregate(literal(TOTAL), [Grade.student_id], student_ids)
+    ))
@@ -0,0 +1,92 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import delete, select
+from .models import RevokedToken, UserTokenRevocation
+from .db_routing import PRIMARY
+from . import db, jwt
+
+# JWT 폐기 목록
+# 폐기된 jti와 사용자별 폐기 시각은 DB에 저장하고, 워커마다 메모리의 해시 테이블에 복사해 두어
+# 요청마다 DB를 조회하지 않고 O(1)로 확인한다. BLOCKLIST_SYNC_INTERVAL 초마다 그 사이에 추가된
+# 항목만 가져와 다른 워커의 폐기를 반영하고, 만료된 토큰은 메모리와 DB에서 정리한다.
+# 동기화는 항상 primary에서 읽는다. 복제본에서 읽으면 복제 지연이 동기화 간격보다 길 때
+# 그 사이에 커밋된 폐기가 다음 동기화의 조회 범위에서도 빠져 영영 반영되지 않는다.
+class TokenBlocklist:
+    def __init__(self):
+        self._jtis = {}          # jti -> 만료 시각
+        self._users = {}         # user_id -> 이 시각 이전에 발급된 토큰은 폐기
+        self._synced_at = None   # 마지막 동기화 기준 시각 (DB의 revoked_at 기준)
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, payload):
+        self._maybe_sync()
+        if payload['jti'] in self._jtis:
+            return True
+        user_id = payload['sub'].split(':')[0]
+        revoked_before = self._users.get(user_id)
+        return revoked_before is not None and datetime.fromtimestamp(payload['iat']) < revoked_before
+
+    def revoke_token(self, payload):
+        '''토큰 한 개 폐기 (커밋은 호출한 쪽에서 수행)'''
+        expires_at = datetime.fromtimestamp(payload['exp'])
+        db.session.merge(RevokedToken(jti=payload['jti'], expires_at=expires_at, revoked_at=datetime.now()))
+        with self._lock:
+            self._jtis[payload['jti']] = expires_at
+
+    def revoke_user(self, user_id):
+        '''지금까지 발급된 사용자의 모든 토큰 폐기 (커밋은 호출한 쪽에서 수행)'''
+        # JWT의 iat는 초 단위이므로 같은 초에 발급된 토큰까지 폐기되도록 올림
+        now = datetime.now()
+        revoked_before = now.replace(microsecond=0) + timedelta(seconds=1)
+        db.session.merge(UserTokenRevocation(user_id=user_id, revoked_before=revoked_before, revoked_at=now))
+        with self._lock:
+            self._users[user_id] = revoked_before
+
+    def _maybe_sync(self):
+        if time.monotonic() < self._next_sync:
+            return
+        with self._lock:
+            if time.monotonic() < self._next_sync:
+                return
+            self._next_sync = time.monotonic() + current_app.config['BLOCKLIST_SYNC_INTERVAL']
+        self.sync()
+
+    def sync(self):
+        '''마지막 동기화 이후 추가된 폐기 항목을 가져오고 만료된 항목 정리'''
+        now = datetime.now()
+        tokens = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > now)
+        users = select(UserTokenRevocation.user_id, UserTokenRevocation.revoked_before)
+        if self._synced_at is not None:
+            # 다른 워커와의 시각 차이를 고려해 동기화 간격만큼 겹쳐서 조회
+            since = self._synced_at - timedelta(seconds=current_app.config['BLOCKLIST_SYNC_INTERVAL'])
+            tokens = tokens.where(RevokedToken.revoked_at >= since)
+            users = users.where(UserTokenRevocation.revoked_at >= since)
+        tokens = db.session.execute(tokens, bind_arguments=PRIMARY).all()
+        users = db.session.execute(users, bind_arguments=PRIMARY).all()
+
+        # 사용자 폐기 시각은 리프레시 토큰 만료 기간이 지나면 의미가 없으므로 함께 정리
+        user_expiry = now - current_app.config['JWT_REFRESH_TOKEN_EXPIRES']
+        with self._lock:
+            self._jtis.update(tokens)
+            self._users.update(users)
+            self._jtis = {jti: expires_at for jti, expires_at in self._jtis.items() if expires_at > now}
+            self._users = {user_id: before for user_id, before in self._users.items() if before > user_expiry}
+            self._synced_at = now
+
+    def prune(self):
+        '''만료된 폐기 항목을 DB에서 삭제 (커밋은 호출한 쪽에서 수행)'''
+        now = datetime.now()
+        db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        db.session.execute(delete(UserTokenRevocation).where(
+            UserTokenRevocation.revoked_before <= now - current_app.config['JWT_REFRESH_TOKEN_EXPIRES']
+        ))
+
+def token_blocklist():
+    return current_app.extensions.setdefault('token_blocklist', TokenBlocklist())
+
+@jwt.token_in_blocklist_loader
+def check_if_token_revoked(jwt_header, jwt_payload):
+    return token_blocklist().is_revoked(jwt_payload)
@@ -0,0 +1,24 @@
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from . import db
+
+# DB 기본 기능을 사용하는 입력/수정 (MySQL: INSERT ... ON DUPLICATE KEY UPDATE, SQLite/PostgreSQL: INSERT ... ON CONFLICT)
+# 존재 여부를 먼저 조회하지 않으므로 동시에 같은 키를 입력해도 고유 키 위반 없이 한 행만 남는다.
+_ON_CONFLICT_DIALECTS = {'sqlite': sqlite, 'postgresql': postgresql}
+
+def upsert(model, values, keys, changes):
+    '''
+    values: 입력할 행 dict (또는 dict 목록)
+    keys: 충돌을 판단하는 고유 키 컬럼 이름 (MySQL은 테이블의 고유 키를 사용)
+    changes: 입력하려던 행(new)을 받아 기존 행에 적용할 {컬럼 이름: 값 또는 SQL 식}을 반환하는 함수
+             예: lambda new: {'score': new.score}, lambda new: {'version': DataVersion.version + 1}
+             SQL 식의 컬럼은 수정 전 값이다 (MySQL은 SET을 왼쪽부터 적용하므로 dict 순서대로 전달).
+    '''
+    table = model.__table__
+    dialect = db.session.get_bind().dialect
+    if dialect.name == 'mysql':
+        statement = mysql.insert(table).values(values)
+        return statement.on_duplicate_key_update(list(changes(statement.inserted).items()))
+    if dialect.name in _ON_CONFLICT_DIALECTS:
+        statement = _ON_CONFLICT_DIALECTS[dialect.name].insert(table).values(values)
+        return statement.on_conflict_do_update(index_elements=keys, set_=changes(statement.excluded))
+    raise NotImplementedError(f'{dialect.name}에서는 upsert를 지원하지 않습니다.')
@@ -0,0 +1,104 @@
+import hashlib
+import random
+from flask import request, make_response
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import select, tuple_
+from .models import DataVersion
+from .upsert import upsert
+from . import db
+
+# 변경 버전과 조건부 조회(ETag)
+# 쓰기 핸들러는 바뀐 데이터의 버전을 같은 트랜잭션에서 올리고, 조회 핸들러는 응답에 영향을 주는 버전만
+# 읽어 ETag를 만든다. If-None-Match가 같으면 성적 행을 조회하지 않고 304를 반환한다.
+STUDENT = 'student'
+SUBJECT = 'subject'
+SEMESTER = 'semester'
+CATALOG = 'catalog'
+
+SUBJECTS_CATALOG = (CATALOG, 'subjects')
+USERS_CATALOG = (CATALOG, 'users')
+
+BUMP_BATCH_SIZE = 1000
+
+# 과목/학기 버전은 같은 과목, 같은 학기의 모든 성적 쓰기가 올리므로 한 행으로 두면 성적 입력이 몰릴 때
+# 모든 쓰기 트랜잭션이 그 행의 잠금을 기다린다. 그래서 VERSION_SHARDS개 행으로 나누어 쓰기마다 임의의 행 하나만
+# 올리고, 조회할 때는 모든 행의 합을 버전으로 사용한다 (합도 쓰기마다 증가함).
+# 0번 행은 나누기 전과 같은 이름을 사용하므로 기존 버전에서 이어서 증가한다.
+SHARDED_SCOPES = (SUBJECT, SEMESTER)
+VERSION_SHARDS = 16
+
+def _shard_name(name, shard):
+    return name if shard == 0 else f'{name}#{shard}'
+
+def _stored_keys(marker):
+    '''버전을 저장하는 (scope, name) 행 목록'''
+    scope, name = marker
+    if scope not in SHARDED_SCOPES:
+        return [marker]
+    return [(scope, _shard_name(name, shard)) for shard in range(VERSION_SHARDS)]
+
+def bump(*markers):
+    '''(scope, name) 버전 증가 (커밋은 호출한 쪽에서 수행)'''
+    markers = set(markers)
+    if not markers:
+        return
+    # 커밋 후 응답 캐시에서 해당 버전을 사용한 항목을 무효화하도록 기록
+    db.session.info.setdefault('changed_markers', set()).update(markers)
+    # 조회 없이 upsert로 올리고 처음 올리는 버전은 1로 입력 (여러 버전은 BUMP_BATCH_SIZE개씩 한 문장으로)
+    # 항상 정렬된 순서로 잠가 동시에 여러 버전을 올리는 트랜잭션끼리 교착되지 않도록 함
+    keys = [(scope, _shard_name(name, random.randrange(VERSION_SHARDS)) if scope in SHARDED_SCOPES else name)
+            for scope, name in markers]
+    rows = [{'scope': scope, 'name': name, 'version': 1} for scope, name in sorted(keys)]
+    for start in range(0, len(rows), BUMP_BATCH_SIZE):
+        db.session.execute(upsert(DataVersion, rows[start:start + BUMP_BATCH_SIZE], ['scope', 'name'],
+                                  lambda new: {'version': DataVersion.version + 1}))
+
+def grade_markers(student_id, subject_code, semester):
+    '''성적 한 건이 바뀔 때 올려야 하는 버전'''
+    return [(STUDENT, student_id), (SUBJECT, subject_code), (SEMESTER, semester)]
+
+def current_versions(markers):
+    stored = {marker: _stored_keys(marker) for marker in markers}
+    rows = db.session.execute(
+        select(DataVersion.scope, DataVersion.name, DataVersion.version)
+        .where(tuple_(DataVersion.scope, DataVersion.name).in_([key for keys in stored.values() for key in keys]))
+    ).all()
+    versions = {(scope, name): version for scope, name, version in rows}
+    return [sum(versions.get(key, 0) for key in stored[marker]) for marker in markers]
+
+def identity_scope():
+    '''응답이 달라지는 사용자 범위 (관리자는 모두 같은 응답을 받으므로 역할 단위로 묶음)'''
+    current_user = get_jwt_identity() or ''
+    return 'admin' if current_user.endswith(':admin') else current_user
+
+def make_etag(markers):
+    '''요청 경로, 사용자 범위, 버전으로 ETag 생성 (같은 응답이면 같은 값)'''
+    versions = current_versions(markers)
+    raw = '|'.join([request.full_path, identity_scope()] +
+                   [f'{scope}:{name}:{version}' for (scope, name), version in zip(markers, versions)])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+def not_modified(etag):
+    response = make_response('', 304)
+    response.set_etag(etag)
+    return response
+
+def conditional_response(f, markers, args, kwargs, etag=None):
+    '''
+    ETag가 If-None-Match와 같으면 304, 아니면 핸들러 결과에 ETag 헤더를 붙여 (data, code, headers)로 반환
+    etag: 이미 계산한 ETag (없으면 markers의 현재 버전으로 계산)
+    '''
+    if etag is None:
+        etag = make_etag(markers)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    result = f(*args, **kwargs)
+    if isinstance(result, tuple):
+        data, code, headers = (result + (None, None))[:3]
+    else:
+        data, code, headers = result, 200, None
+    headers = dict(headers or {})
+    if (code or 200) == 200:
+        headers['ETag'] = f'"{etag}"'
+    return data, code or 200, headers
@@ -0,0 +1,110 @@
+'''
+인덱스 적용 전후 조회 지연 시간 비교
+
+    python benchmarks/index_lookup.py --uri sqlite:///bench.db --grades 3000000
+
+마이그레이션 1번(테이블만 생성)을 적용한 뒤 성적 데이터를 채워 조회 시간을 측정하고,
+마이그레이션 2번(인덱스)을 적용한 뒤 같은 조회를 다시 측정한다.
+'''
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, text
+from app.migrations import upgrade
+
+SEMESTERS = [f'{year}-{term}' for year in range(2015, 2025) for term in (1, 2)]
+
+# 핫 패스에서 사용하는 조회 패턴
+LOOKUPS = {
+    'subject_by_name': "SELECT code FROM subjects WHERE name = :name",
+    'grades_by_semester': "SELECT COUNT(*) FROM grades WHERE semester = :semester",
+    'grades_by_subject_semester': "SELECT id, score FROM grades WHERE subject_code = :code AND semester = :semester",
+    'grade_by_student_subject_semester': "SELECT id FROM grades WHERE student_id = :student_id AND subject_code = :code AND semester = :semester",
+    'grades_by_student': "SELECT id FROM grades WHERE student_id = :student_id",
+}
+
+def seed(engine, students, subjects, grades, batch_size=50000):
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (id, role, name, admission_year, password_hash) VALUES (:id, 'professor', :id, 2010, '-')"),
+                     [{'id': 'P0001'}])
+        conn.execute(text("INSERT INTO users (id, role, name, admission_year, password_hash) VALUES (:id, 'student', :id, 2020, '-')"),
+                     [{'id': f'S{i:07d}'} for i in range(students)])
+        conn.execute(text("INSERT INTO subjects (code, name, credits, professor_id) VALUES (:code, :name, 3, 'P0001')"),
+                     [{'code': f'C{i:05d}', 'name': f'과목{i:05d}'} for i in range(subjects)])
+
+    # (학생, 과목, 학기) 조합이 겹치지 않도록 학생마다 서로 다른 과목을 배정
+    per_student = max(1, grades // students)
+    inserted = 0
+    batch = []
+    with engine.begin() as conn:
+        for student in range(students):
+            for offset, code in enumerate(rng.sample(range(subjects), min(per_student, subjects))):
+                batch.append({
+                    'student_id': f'S{student:07d}',
+                    'subject_code': f'C{code:05d}',
+                    'semester': SEMESTERS[offset % len(SEMESTERS)],
+                    'score': rng.choice([0.0, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5])
+                })
+                if len(batch) >= batch_size:
+                    conn.execute(text("INSERT INTO grades (student_id, subject_code, semester, score, grade) "
+                                      "VALUES (:student_id, :subject_code, :semester, :score, 'B')"), batch)
+                    inserted += len(batch)
+                    batch = []
+        if batch:
+            conn.execute(text("INSERT INTO grades (student_id, subject_code, semester, score, grade) "
+                              "VALUES (:student_id, :subject_code, :semester, :score, 'B')"), batch)
+            inserted += len(batch)
+    return inserted
+
+def measure(engine, students, subjects, repeat):
+    rng = random.Random(7)
+    results = {}
+    with engine.connect() as conn:
+        for name, sql in LOOKUPS.items():
+            timings = []
+            for _ in range(repeat):
+                params = {
+                    'name': f'과목{rng.randrange(subjects):05d}',
+                    'code': f'C{rng.randrange(subjects):05d}',
+                    'semester': rng.choice(SEMESTERS),
+                    'student_id': f'S{rng.randrange(students):07d}'
+                }
+                start = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = statistics.median(timings)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='인덱스 적용 전후 조회 지연 시간 비교')
+    parser.add_argument('--uri', default='sqlite:///index_benchmark.db', help='빈 데이터베이스 URI')
+    parser.add_argument('--grades', type=int, default=3000000)
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--subjects', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(args.uri)
+    upgrade(engine, target=1)
+
+    start = time.perf_counter()
+    inserted = seed(engine, args.students, args.subjects, args.grades)
+    print(f"성적 {inserted}건 입력 ({time.perf_counter() - start:.1f}s)")
+
+    before = measure(engine, args.students, args.subjects, args.repeat)
+    upgrade(engine, target=2)
+    after = measure(engine, args.students, args.subjects, args.repeat)
+
+    print(f"{'조회':<36}{'인덱스 전(ms)':>14}{'인덱스 후(ms)':>14}")
+    for name in LOOKUPS:
+        print(f"{name:<36}{before[name]:>14.3f}{after[name]:>14.3f}")
+
+if __name__ == '__main__':
+    main()
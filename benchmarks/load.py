@@ -0,0 +1,288 @@
+'''
+API 엔드포인트 부하 측정 (처리량, p50/p95/p99 지연 시간, 요청당 SQL 실행 수)
+
+    python benchmarks/load.py --requests 500 --concurrency 8 --output load.json
+    python benchmarks/load.py --baseline load.json --tolerance 0.2
+    python benchmarks/load.py --endpoints grades_semester,subjects_list --cache
+
+benchmark 프로필(SQLite 파일 + academic_records.sql 데이터, --uri로 변경 가능)로 앱을 만들고,
+엔드포인트마다 --concurrency개 스레드가 각자의 테스트 클라이언트로 요청을 나누어 보낸다.
+요청당 SQL 실행 수는 엔진의 before_cursor_execute 이벤트를 스레드별로 세어 구한다.
+조회 응답 캐시는 끄고 측정하며, --cache를 지정하면 GET 엔드포인트를 memory 캐시를 켠 앱으로 한 번 더 측정하여
+'<이름>:cached' 항목으로 따로 보고한다.
+쓰기 엔드포인트는 요청마다 다른 키(학기, 사용자/과목 ID)를 사용하고, 삭제/로그아웃처럼 대상이 필요한 요청은
+측정 전에 대상을 만든다 (준비 요청의 시간과 SQL은 측정에 포함하지 않음).
+--baseline을 지정하면 기준 결과와 비교하여 p95 지연 시간이나 처리량이 tolerance 비율 이상
+나빠진 엔드포인트가 있을 때 종료 코드 1을 반환한다.
+'''
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import event
+from app import create_app, db
+from app.config import BenchmarkConfig
+
+ADMIN = ('A001', 'admin')
+PROFESSOR = ('P001', 'professor')
+STUDENT = ('2020001', 'student')
+STUDENTS = ['2020001', '2020002', '2020003', '2019001', '2019002', '2021001', '2018001']
+
+# 실행마다 다른 사용자/과목 ID를 만들기 위한 접두사 (ID는 최대 10자: 종류 1자 + 실행 4자 + 요청 번호 5자)
+RUN = ''.join('0123456789abcdefghijklmnopqrstuvwxyz'[int(time.time()) // 36 ** i % 36] for i in range(4))
+
+# 요청 번호 (모든 엔드포인트와 스레드가 공유하여 쓰기 대상 키가 겹치지 않도록 함)
+_numbers = itertools.count()
+
+# 요청 번호 n으로 만드는 쓰기 대상
+def _semester(n):
+    return f'{3000 + n % 7000}-1'
+
+def _user_id(n):
+    return f'B{RUN}{n % 100000:05d}'
+
+def _subject_code(n):
+    return f'S{RUN}{n % 100000:05d}'
+
+def _subject_name(n):
+    return f'부하측정과목{RUN}{n}'
+
+def _user(n):
+    return {'id': _user_id(n), 'password': '1234', 'role': 'student', 'name': '부하측정',
+            'department': '컴퓨터공학과', 'admission_year': 2024}
+
+def _subject(n, credits=3):
+    return {'code': _subject_code(n), 'name': _subject_name(n), 'credits': credits, 'professor_id': 'P001'}
+
+# 측정 전 준비 (요청에 덧붙일 헤더/본문을 반환)
+def _create_user(client, headers, n):
+    client.post('/users/', json=_user(n), headers=headers)
+    return {}
+
+def _create_subject(client, headers, n):
+    client.post('/subjects/', json=_subject(n), headers=headers)
+    return {}
+
+def _fresh_login(client, headers, n):
+    tokens = client.post('/auth/login', json={'id': '2020001', 'password': '1234', 'role': 'student'}).get_json()
+    return {'headers': {'Authorization': f"Bearer {tokens['access_token']}"},
+            'json': {'refresh_token': tokens['refresh_token']}}
+
+def _refresh_token(client, headers, n):
+    tokens = client.post('/auth/login', json={'id': '2020001', 'password': '1234', 'role': 'student'}).get_json()
+    return {'headers': {'Authorization': f"Bearer {tokens['refresh_token']}"}}
+
+# path, body는 값 또는 요청 번호 n을 받는 함수, setup은 (클라이언트, 로그인 헤더, n)을 받아 요청 덮어쓰기 값을 반환
+Endpoint = namedtuple('Endpoint', ['name', 'user', 'method', 'path', 'body', 'setup'], defaults=(None, None))
+
+ENDPOINTS = [
+    Endpoint('auth_login', None, 'POST', '/auth/login', {'id': '2020001', 'password': '1234', 'role': 'student'}),
+    Endpoint('auth_refresh', None, 'POST', '/auth/refresh', setup=_refresh_token),
+    Endpoint('auth_logout', None, 'POST', '/auth/logout', setup=_fresh_login),
+    Endpoint('grades_student', STUDENT, 'GET', '/grades/student/2020001'),
+    Endpoint('grades_students', PROFESSOR, 'GET', '/grades/students?ids=2020001,2020002,2019001,2021001,2018001'),
+    Endpoint('grades_subject', ADMIN, 'GET', '/grades/subject/C프로그래밍'),
+    Endpoint('grades_semester', ADMIN, 'GET', '/grades/semester/2021-1'),
+    Endpoint('grades_semester_export', ADMIN, 'GET', '/grades/semester/2021-1/export?format=csv'),
+    Endpoint('grades_summary', STUDENT, 'GET', '/grades/summary/2020001'),
+    Endpoint('grades_statistics', PROFESSOR, 'GET', '/grades/statistics/subject/COMP101/semester/2020-1'),
+    Endpoint('grades_rank_subject', STUDENT, 'GET', '/grades/rank/subject/COMP101/semester/2020-1/student/2020001'),
+    Endpoint('grades_rank_student', STUDENT, 'GET', '/grades/rank/student/2020001'),
+    # 새 성적 입력 (요청마다 다른 학기)과 같은 성적 다시 입력 (기존 성적 수정)
+    Endpoint('grades_create', PROFESSOR, 'POST', '/grades/',
+             lambda n: {'student_id': '2020001', 'subject_code': 'COMP101', 'semester': _semester(n),
+                        'score': 4.0, 'grade': 'A'}),
+    Endpoint('grades_upsert', PROFESSOR, 'POST', '/grades/',
+             {'student_id': '2020001', 'subject_code': 'COMP101', 'semester': '2999-1', 'score': 3.5, 'grade': 'B+'}),
+    Endpoint('grades_bulk', PROFESSOR, 'POST', '/grades/bulk',
+             lambda n: [{'student_id': student_id, 'subject_code': 'COMP101', 'semester': _semester(n),
+                         'score': 3.0, 'grade': 'B'} for student_id in STUDENTS]),
+    Endpoint('grades_update', ADMIN, 'PUT', '/grades/student/2020001/semester/2020-1/subject/COMP101',
+             {'score': 4.0, 'grade': 'A'}),
+    # 정책은 COMP301에만 설정하여 다른 엔드포인트의 학점 계산에 영향을 주지 않음
+    Endpoint('policy_put', PROFESSOR, 'PUT', '/grades/policies/COMP301', {'method': 'relative'}),
+    Endpoint('policy_get', PROFESSOR, 'GET', '/grades/policies/COMP301'),
+    Endpoint('policy_apply', PROFESSOR, 'POST', '/grades/policies/COMP301/semester/2021-1/apply?dry_run=true'),
+    Endpoint('search_users', ADMIN, 'GET', '/search/?q=20&type=users'),
+    Endpoint('search_subjects', STUDENT, 'GET', '/search/?q=프로그래밍&type=subjects'),
+    Endpoint('subjects_list', ADMIN, 'GET', '/subjects/'),
+    Endpoint('subject_get', ADMIN, 'GET', '/subjects/C프로그래밍'),
+    Endpoint('subject_create', ADMIN, 'POST', '/subjects/', _subject),
+    Endpoint('subject_update', ADMIN, 'PUT', lambda n: f'/subjects/{_subject_name(n)}',
+             lambda n: _subject(n, credits=4), setup=_create_subject),
+    Endpoint('subject_delete', ADMIN, 'DELETE', lambda n: f'/subjects/{_subject_name(n)}', setup=_create_subject),
+    Endpoint('users_list', ADMIN, 'GET', '/users/'),
+    Endpoint('user_get', ADMIN, 'GET', '/users/2020001'),
+    Endpoint('user_create', ADMIN, 'POST', '/users/', _user),
+    Endpoint('user_update', ADMIN, 'PUT', lambda n: f'/users/{_user_id(n)}',
+             lambda n: dict(_user(n), department='전자공학과'), setup=_create_user),
+    Endpoint('user_delete', ADMIN, 'DELETE', lambda n: f'/users/{_user_id(n)}', setup=_create_user),
+]
+
+# 비교 대상 지표와 방향 (1: 클수록 나쁨, -1: 작을수록 나쁨)
+COMPARED_METRICS = {'p95_ms': 1, 'throughput_rps': -1}
+
+class ThreadSqlCounter:
+    '''스레드별 SQL 실행 수 (동시에 실행되는 요청의 쿼리가 섞이지 않도록 분리)'''
+    def __init__(self, engine):
+        self._local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args):
+        self._local.count = getattr(self._local, 'count', 0) + 1
+
+    def take(self):
+        count = getattr(self._local, 'count', 0)
+        self._local.count = 0
+        return count
+
+def percentile(sorted_values, q):
+    '''최근접 순위 방식 백분위수'''
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+def login(client, user):
+    user_id, role = user
+    response = client.post('/auth/login', json={'id': user_id, 'password': '1234', 'role': role})
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+def _resolve(value, n):
+    return value(n) if callable(value) else value
+
+def run_endpoint(app, counter, tokens, endpoint, requests, concurrency, warmup):
+    headers = tokens.get(endpoint.user, {})
+
+    def worker(count):
+        client = app.test_client()
+        samples = []
+        for _ in range(count):
+            n = next(_numbers)
+            options = {'headers': headers, 'json': _resolve(endpoint.body, n)}
+            if endpoint.setup:
+                options.update(endpoint.setup(client, headers, n))
+            counter.take()
+            start = time.perf_counter()
+            response = client.open(_resolve(endpoint.path, n), method=endpoint.method, **options)
+            response.get_data()
+            response.close()  # 스트리밍 응답의 앱 컨텍스트(DB 연결) 정리
+            samples.append(((time.perf_counter() - start) * 1000, counter.take(), response.status_code))
+        return samples
+
+    worker(warmup)
+    shares = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = [sample for result in executor.map(worker, shares) for sample in result]
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(sample[0] for sample in samples)
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for sample in samples if sample[2] >= 400),
+        'throughput_rps': round(len(samples) / elapsed, 1),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'max_ms': round(latencies[-1], 3),
+        'sql_per_request': round(sum(sample[1] for sample in samples) / len(samples), 2)
+    }
+
+def compare(result, baseline, tolerance):
+    '''기준보다 tolerance 비율 이상 나빠진 (엔드포인트, 지표, 기준값, 측정값) 목록'''
+    regressions = []
+    for name, metrics in result['endpoints'].items():
+        before = baseline['endpoints'].get(name)
+        if before is None:
+            continue
+        for metric, direction in COMPARED_METRICS.items():
+            if not before[metric]:
+                continue
+            change = (metrics[metric] - before[metric]) / before[metric] * direction
+            if change > tolerance:
+                regressions.append((name, metric, before[metric], metrics[metric]))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='API 엔드포인트 부하 측정')
+    parser.add_argument('--requests', type=int, default=200, help='엔드포인트별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 스레드 수')
+    parser.add_argument('--warmup', type=int, default=5, help='측정 전 엔드포인트별 준비 요청 수')
+    parser.add_argument('--endpoints', help='측정할 엔드포인트 이름 (쉼표로 구분, 기본 전체)')
+    parser.add_argument('--uri', help='데이터베이스 URI (기본 benchmark 프로필의 SQLite 파일)')
+    parser.add_argument('--cache', action='store_true', help='GET 엔드포인트를 조회 응답 캐시를 켜고 한 번 더 측정')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용하는 악화 비율 (기본 20%%)')
+    args = parser.parse_args()
+
+    overrides = {'RESPONSE_CACHE_BACKEND': 'none'}
+    if args.uri:
+        overrides['SQLALCHEMY_DATABASE_URI'] = args.uri
+    app = create_app(type('LoadBenchmarkConfig', (BenchmarkConfig,), overrides))
+
+    endpoints = ENDPOINTS
+    if args.endpoints:
+        names = set(args.endpoints.split(','))
+        endpoints = [endpoint for endpoint in ENDPOINTS if endpoint.name in names]
+
+    # (결과 이름, 앱, 엔드포인트) 목록: 캐시를 켠 측정은 GET만, 같은 DB를 쓰는 별도 앱으로 실행
+    runs = [(endpoint.name, app, endpoint) for endpoint in endpoints]
+    if args.cache:
+        cached_app = create_app(type('CachedLoadBenchmarkConfig', (BenchmarkConfig,),
+                                     dict(overrides, RESPONSE_CACHE_BACKEND='memory')))
+        runs += [(f'{endpoint.name}:cached', cached_app, endpoint) for endpoint in endpoints if endpoint.method == 'GET']
+
+    counters, tokens = {}, {}
+    users = {endpoint.user for endpoint in endpoints if endpoint.user}
+    for target in {id(run_app): run_app for _, run_app, _ in runs}.values():
+        with target.app_context():
+            counters[id(target)] = ThreadSqlCounter(db.engine)
+        client = target.test_client()
+        tokens[id(target)] = {user: login(client, user) for user in users}
+
+    result = {
+        'meta': {
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'database': app.config['SQLALCHEMY_DATABASE_URI'].split('://')[0],
+            'response_cache': 'memory (:cached)' if args.cache else 'none',
+            'python': platform.python_version(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'endpoints': {}
+    }
+
+    print(f"{'엔드포인트':<30}{'요청/초':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'SQL/요청':>10}{'오류':>6}")
+    for name, run_app, endpoint in runs:
+        metrics = run_endpoint(run_app, counters[id(run_app)], tokens[id(run_app)], endpoint,
+                               args.requests, args.concurrency, args.warmup)
+        result['endpoints'][name] = metrics
+        print(f"{name:<30}{metrics['throughput_rps']:>10.1f}{metrics['p50_ms']:>10.2f}{metrics['p95_ms']:>10.2f}"
+              f"{metrics['p99_ms']:>10.2f}{metrics['sql_per_request']:>10.2f}{metrics['errors']:>6}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for name, metric, before, after in regressions:
+            print(f"악화: {name} {metric} {before} -> {after}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
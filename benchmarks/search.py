@@ -0,0 +1,64 @@
+'''
+사용자 검색 인덱스 조회 시간 (타이핑 중 검색어 앞부분으로 반복 조회)
+
+    python benchmarks/search.py --users 100000 --queries 2000
+
+합성 사용자 users명으로 SearchIndex를 만든 뒤, 이름/학번/학과의 앞 1~4글자와 부분 문자열로 조회하여
+인덱스 생성 시간과 조회 지연 시간(p50/p95/p99)을 출력한다. DB와 HTTP 처리 시간은 포함하지 않는다.
+'''
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.search import SearchIndex
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+SYLLABLES = '민서지현수영준우진하은도윤채원예주연시성호동재경'
+DEPARTMENTS = ['컴퓨터공학과', '전자공학과', '경영학과', '나노신소재공학과', '기계공학과', '소프트웨어학과',
+               '물리천문학과', '데이터과학과', '화학과', '수학과']
+
+def make_users(count):
+    rng = random.Random(42)
+    for index in range(count):
+        user_id = f'{rng.randrange(2010, 2026)}{index:06d}'
+        name = rng.choice(SURNAMES) + rng.choice(SYLLABLES) + rng.choice(SYLLABLES)
+        department = rng.choice(DEPARTMENTS)
+        yield user_id, {'id': user_id, 'name': name, 'department': department}, (user_id, name, department)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    users = list(make_users(args.users))
+    started = time.perf_counter()
+    index = SearchIndex(users)
+    print(f'build: {len(index)} users, {time.perf_counter() - started:.2f}s')
+
+    rng = random.Random(7)
+    timings = []
+    for _ in range(args.queries):
+        text = rng.choice(rng.choice(users)[2])
+        if rng.random() < 0.7:
+            query = text[:rng.randint(1, 4)]
+        else:
+            start = rng.randrange(max(len(text) - 1, 1))
+            query = text[start:start + 2]
+        started = time.perf_counter()
+        index.search(query, args.limit)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    percentile = lambda p: timings[min(len(timings) - 1, int(len(timings) * p))]
+    print(f'search: mean {statistics.mean(timings):.3f}ms, p50 {percentile(0.5):.3f}ms, '
+          f'p95 {percentile(0.95):.3f}ms, p99 {percentile(0.99):.3f}ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+'''
+목록 응답 직렬화 비교 (행 dict + marshal + 표준 JSON 출력 vs 행 객체 + orjson)
+
+    python benchmarks/serialization.py --rows 50000 --repeat 5
+
+조회 결과와 같은 형태의 튜플 rows개를 만든 뒤, 두 경로가 JSON 바이트를 만들 때까지 걸린 시간을 비교한다.
+- marshal: 행마다 dict를 만들고 marshal(grade_model)을 거쳐 flask-restx 기본 JSON 출력(json.dumps)으로 인코딩
+- fast: 튜플을 GradeRow로 감싸고 API JSON 출력(app.serialization.dumps)으로 인코딩
+DB 조회 시간은 포함하지 않는다.
+'''
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask_restx import marshal
+from flask_restx.representations import dumps as restx_dumps
+from app.routes.grade import grade_model, GradeRow
+from app.serialization import dumps, orjson
+
+SCALE = [(4.5, 'A+'), (4.0, 'A'), (3.5, 'B+'), (3.0, 'B'), (2.5, 'C+'), (2.0, 'C'), (0.0, 'F')]
+
+def make_rows(count):
+    rng = random.Random(42)
+    rows = []
+    for index in range(count):
+        score, grade = rng.choice(SCALE)
+        rows.append((index + 1, f'S{rng.randrange(100000):08d}', f'G{rng.randrange(5000):06d}',
+                     f'자료구조{rng.randrange(5000):06d}', f'{rng.randrange(2016, 2026)}-{rng.randint(1, 2)}',
+                     score, grade))
+    return rows
+
+def marshal_path(rows):
+    grade_data = []
+    for grade_id, student_id, subject_code, subject_name, semester, score, grade in rows:
+        grade_data.append({
+            'id': grade_id,
+            'student_id': student_id,
+            'subject_code': subject_code,
+            'subject_name': subject_name,
+            'semester': semester,
+            'score': score,
+            'grade': grade
+        })
+    return (restx_dumps(marshal(grade_data, grade_model)) + '\n').encode('utf-8')
+
+def fast_path(rows):
+    return dumps([GradeRow(*row) for row in rows]) + b'\n'
+
+def measure(func, rows, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {'median_ms': round(statistics.median(timings), 2), 'min_ms': round(min(timings), 2)}
+
+def main():
+    parser = argparse.ArgumentParser(description='목록 응답 직렬화 비교')
+    parser.add_argument('--rows', type=int, default=50000, help='응답 행 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    if json.loads(marshal_path(rows[:100])) != json.loads(fast_path(rows[:100])):
+        sys.exit('두 경로의 결과가 다릅니다.')
+
+    result = {
+        'rows': args.rows,
+        'encoder': 'orjson' if orjson is not None else 'json',
+        'marshal': measure(marshal_path, rows, args.repeat),
+        'fast': measure(fast_path, rows, args.repeat)
+    }
+    result['speedup'] = round(result['marshal']['median_ms'] / result['fast']['median_ms'], 1)
+
+    print(f"{'경로':<10}{'중앙값(ms)':>12}{'최소(ms)':>12}")
+    for name in ('marshal', 'fast'):
+        print(f"{name:<10}{result[name]['median_ms']:>12.1f}{result[name]['min_ms']:>12.1f}")
+    print(f"{args.rows}행, {result['encoder']}: {result['speedup']}배")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+'''
+앱 시작 시간 측정 (패키지 import + create_app)
+
+    python benchmarks/startup.py --runs 10 --output startup.json
+    python benchmarks/startup.py --baseline startup.json --tolerance 0.2
+
+매 회 새 파이썬 프로세스에서 측정하여 import 캐시의 영향을 받지 않는 콜드 스타트 시간을 구한다.
+--baseline을 지정하면 기준 결과보다 tolerance 비율 이상 느려진 항목이 있을 때 종료 코드 1을 반환한다.
+'''
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 자식 프로세스에서 실행할 측정 코드
+CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+import app
+from app.config import ProductionConfig
+imported = time.perf_counter()
+if sys.argv[1]:
+    ProductionConfig.SQLALCHEMY_DATABASE_URI = sys.argv[1]
+app.create_app(ProductionConfig)
+created = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'numpy_loaded': 'numpy' in sys.modules
+}))
+'''
+
+def measure_once(uri):
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD, uri or ''],
+        cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def measure(runs, uri):
+    samples = [measure_once(uri) for _ in range(runs)]
+    result = {}
+    for name in ('import_ms', 'create_app_ms'):
+        values = [sample[name] for sample in samples]
+        result[name] = {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+    total = [sample['import_ms'] + sample['create_app_ms'] for sample in samples]
+    result['total_ms'] = {'median': statistics.median(total), 'min': min(total), 'max': max(total)}
+    result['numpy_loaded'] = any(sample['numpy_loaded'] for sample in samples)
+    return result
+
+def compare(result, baseline, tolerance):
+    '''기준보다 tolerance 비율 이상 느려진 항목 목록'''
+    regressions = []
+    for name in ('import_ms', 'create_app_ms', 'total_ms'):
+        before, after = baseline[name]['median'], result[name]['median']
+        if after > before * (1 + tolerance):
+            regressions.append(f"{name}: {before:.1f}ms -> {after:.1f}ms (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='앱 시작 시간 측정')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--uri', help='SQLALCHEMY_DATABASE_URI 대체 (시작 시 연결하지 않으므로 존재하지 않아도 됨)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용하는 느려짐 비율 (기본 20%%)')
+    args = parser.parse_args()
+
+    result = measure(args.runs, args.uri)
+    print(f"{'항목':<16}{'중앙값(ms)':>12}{'최소(ms)':>12}{'최대(ms)':>12}")
+    for name in ('import_ms', 'create_app_ms', 'total_ms'):
+        print(f"{name:<16}{result[name]['median']:>12.1f}{result[name]['min']:>12.1f}{result[name]['max']:>12.1f}")
+    if result['numpy_loaded']:
+        print("경고: 시작 시 numpy를 불러옵니다.")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"느려짐: {regression}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
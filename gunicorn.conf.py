@@ -0,0 +1,13 @@
+# gunicorn 설정 (gunicorn -c gunicorn.conf.py run:app)
+# METRICS_ENABLED=true이고 워커가 여러 개이면 PROMETHEUS_MULTIPROC_DIR에 빈 디렉토리를 지정해야
+# /metrics가 모든 워커의 지표를 합산한다. (서버 시작 전에 디렉토리를 비울 것)
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', 4))
+
+def child_exit(server, worker):
+    '''종료된 워커의 게이지 값을 합산 대상에서 제외'''
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
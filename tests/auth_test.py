@@ -5,14 +5,13 @@ import os, sys
 # 프로젝트 루트 디렉토리 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import create_app
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from helpers import ApiTestCase
 
 # 로그인 테스트
-class TestAuthAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
-    
+class TestAuthAPI(ApiTestCase):
     # Login 성공
     def test_login_success(self):
         login_data = {
@@ -43,11 +42,7 @@ class TestAuthAPI(unittest.TestCase):
         self.assertEqual(data['message'], '비밀번호가 올바르지 않습니다.')
 
 # 토큰 재발급 테스트
-class TestTokenRefreshAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
-
+class TestTokenRefreshAPI(ApiTestCase):
     # Token 재발급 성공
     def test_access_token_refresh_success(self):
         login_data = {
@@ -71,5 +66,57 @@ class TestTokenRefreshAPI(unittest.TestCase):
         response = self.app.post('/auth/refresh')
         self.assertEqual(response.status_code, 500)
 
+# 로그아웃 및 토큰 폐기 테스트
+class TestTokenRevokeAPI(ApiTestCase):
+    # 로그아웃 후 access token, refresh token 사용 불가
+    def test_logout_revokes_tokens(self):
+        login_data = {
+            'id': '2020001',
+            'password': '1234',
+            'role': 'student'
+        }
+        login_response = self.app.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        tokens = json.loads(login_response.get_data(as_text=True))
+        headers = {
+            'Authorization': f"Bearer {tokens['access_token']}"
+        }
+        self.assertEqual(self.app.get('/grades/student/2020001', headers=headers).status_code, 200)
+
+        response = self.app.post('/auth/logout', data=json.dumps({'refresh_token': tokens['refresh_token']}),
+                                 content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 200)
+
+        self.assertNotEqual(self.app.get('/grades/student/2020001', headers=headers).status_code, 200)
+        response = self.app.post('/auth/refresh', headers={'Authorization': f"Bearer {tokens['refresh_token']}"})
+        self.assertNotEqual(response.status_code, 200)
+
+    # 관리자만 사용자 토큰 전체 폐기 가능
+    def test_revoke_user_tokens(self):
+        login_data = {
+            'id': '2020002',
+            'password': '1234',
+            'role': 'student'
+        }
+        login_response = self.app.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        student_headers = {
+            'Authorization': f"Bearer {json.loads(login_response.get_data(as_text=True))['access_token']}"
+        }
+        response = self.app.post('/auth/revoke/2020002', headers=student_headers)
+        self.assertEqual(response.status_code, 403)
+
+        login_data = {
+            'id': 'A001',
+            'password': '1234',
+            'role': 'admin'
+        }
+        login_response = self.app.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        admin_headers = {
+            'Authorization': f"Bearer {json.loads(login_response.get_data(as_text=True))['access_token']}"
+        }
+        response = self.app.post('/auth/revoke/2020002', headers=admin_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(self.app.get('/grades/student/2020002', headers=student_headers).status_code, 200)
+        self.assertEqual(self.app.get('/grades/student/2020002', headers=admin_headers).status_code, 200)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,14 +5,17 @@ import os, sys
 # 프로젝트 루트 디렉토리 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import create_app
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
 
-# 학생별 성적 조회
-class TestGradeAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
+from app import db
+from app.models import StudentSemesterSummary
+from app.summary import apply_grade_change, subject_credits
+from app.query_counter import count_queries
+from helpers import ApiTestCase
 
+# 학생별 성적 조회
+class TestGradeAPI(ApiTestCase):
     # 학생별 전체 성적 조회 성공 테스트
     def test_get_student_grades_success(self):
         login_data = {
@@ -48,11 +51,7 @@ class TestGradeAPI(unittest.TestCase):
         self.assertEqual(data['message'], "데이터에 접근 권한이 없습니다.")
 
 # 과목별, 학기별 성적 조회
-class TestGradesByAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
-
+class TestGradesByAPI(ApiTestCase):
     # 과목별 성적 조회 성공 테스트
     def tests_get_subject_grades_success(self):
         login_data = {
@@ -118,14 +117,37 @@ class TestGradesByAPI(unittest.TestCase):
         response = self.app.get('/grades/semester/2025-1', headers=headers)
         self.assertEqual(response.status_code, 404)
 
-# 성적 입력 테스트
-class TestGradeCreateAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
+    # 학기별 성적 내보내기 (NDJSON, CSV)
+    def test_export_semester_grades(self):
+        login_data = {
+            'id': 'P001', 
+            'password': '1234', 
+            'role': 'professor'
+        }
+        login_response = self.app.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        access_token = json.loads(login_response.get_data(as_text=True))['access_token']
 
-    # 이미 입력된 성적으로 성적 입력 실패 테스트
-    def test_add_grade_failure1(self):
+        headers = {
+            'Authorization': f'Bearer {access_token}'
+        }
+        page = self.app.get('/grades/semester/2021-1', headers=headers).get_json()
+
+        response = self.app.get('/grades/semester/2021-1/export', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [grade['id'] for grade in page['items']])
+
+        response = self.app.get('/grades/semester/2021-1/export?format=csv', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertTrue(lines[0].startswith('id,student_id,student_name'))
+        self.assertEqual(len(lines) - 1, len(rows))
+
+# 성적 입력 테스트
+class TestGradeCreateAPI(ApiTestCase):
+    # 이미 입력된 성적을 다시 입력하면 점수와 학점을 수정 (upsert)
+    def test_add_grade_upsert(self):
         login_data = {
             'id': 'A001', 
             'password': '1234', 
@@ -145,7 +167,14 @@ class TestGradeCreateAPI(unittest.TestCase):
             'grade': 'B'
         }
         response = self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json', headers=headers)
-        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()['score'], 3.0)
+
+        grades = self.app.get('/grades/student/2020001', headers=headers).get_json()
+        matching = [grade for grade in grades if grade['subject_code'] == 'COMP101' and grade['semester'] == '2020-1']
+        self.assertEqual(len(matching), 1)
+        self.assertEqual((matching[0]['id'], matching[0]['score'], matching[0]['grade']),
+                         (response.get_json()['id'], 3.0, 'B'))
     
     # 권한 없음으로 인한 성적 입력 실패 테스트
     def test_add_grade_failure2(self):
@@ -172,11 +201,7 @@ class TestGradeCreateAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 403)
 
 # 성적 수정 테스트
-class TestGradeUpdateAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
-
+class TestGradeUpdateAPI(ApiTestCase):
     # 성적 수정 성공 테스트
     def test_update_grade_success(self):
         login_data = {
@@ -219,5 +244,278 @@ class TestGradeUpdateAPI(unittest.TestCase):
                                 data=json.dumps(grade_data), content_type='application/json', headers=headers)
         self.assertEqual(response.status_code, 403)
 
+# 성적 조회 API의 SQL 실행 횟수 제한 테스트 (행 수와 관계없이 일정해야 함)
+# ETag 계산을 위한 버전 조회 1회 포함
+class TestGradeQueryBudget(ApiTestCase):
+    STUDENT_BUDGET = 2
+    SUBJECT_BUDGET = 4
+    SEMESTER_BUDGET = 2
+    NOT_MODIFIED_BUDGET = 1
+    BATCH_BUDGET = 2
+
+    def app_config(self):
+        return {'BLOCKLIST_SYNC_INTERVAL': 3600}
+
+    def login(self, user_id, role):
+        headers = super().login(user_id, role)
+        # 토큰 폐기 목록의 주기적 동기화 쿼리는 측정에서 제외
+        self.app.get(f'/grades/summary/{user_id}', headers=headers)
+        return headers
+
+    # 학생별 성적 조회 쿼리 수
+    def test_student_grades_query_budget(self):
+        headers = self.login('2020001', 'student')
+        with count_queries(self.engine) as counter:
+            response = self.app.get('/grades/student/2020001', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(len(response.get_json()), 1)
+        self.assertLessEqual(counter.count, self.STUDENT_BUDGET, counter.statements)
+
+    # 과목별 성적 조회 쿼리 수
+    def test_subject_grades_query_budget(self):
+        headers = self.login('A001', 'admin')
+        with count_queries(self.engine) as counter:
+            response = self.app.get('/grades/subject/C프로그래밍', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(counter.count, self.SUBJECT_BUDGET, counter.statements)
+
+    # 학기별 성적 조회 쿼리 수 (관리자, 교수)
+    def test_semester_grades_query_budget(self):
+        for user_id, role in [('A001', 'admin'), ('P001', 'professor')]:
+            headers = self.login(user_id, role)
+            with count_queries(self.engine) as counter:
+                response = self.app.get('/grades/semester/2021-1', headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertGreater(len(response.get_json()['items']), 1)
+            self.assertLessEqual(counter.count, self.SEMESTER_BUDGET, counter.statements)
+
+    # 여러 학생 성적 일괄 조회 쿼리 수 (학생 수와 관계없이 일정)
+    def test_batch_student_grades_query_budget(self):
+        headers = self.login('P001', 'professor')
+        with count_queries(self.engine) as counter:
+            response = self.app.get('/grades/students?ids=2020001,2020002,2019001,2021001,2018001', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 5)
+        self.assertLessEqual(counter.count, self.BATCH_BUDGET, counter.statements)
+
+    # 변경이 없으면 성적 행을 조회하지 않고 304 반환
+    def test_not_modified_query_budget(self):
+        headers = self.login('2020001', 'student')
+        etag = self.app.get('/grades/student/2020001', headers=headers).headers['ETag']
+        with count_queries(self.engine) as counter:
+            response = self.app.get('/grades/student/2020001', headers={**headers, 'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertLessEqual(counter.count, self.NOT_MODIFIED_BUDGET, counter.statements)
+
+# 성적 일괄 입력 테스트
+class TestGradeBulkAPI(ApiTestCase):
+    # 일부 행만 입력되는 경우 행별 결과 확인
+    def test_bulk_add_grades_report(self):
+        headers = self.login('P001', 'professor')
+        grade_rows = [
+            {'student_id': '2020002', 'subject_code': 'COMP201', 'semester': '2025-2', 'score': 4.0, 'grade': 'A'},
+            {'student_id': '2020003', 'subject_code': 'COMP201', 'semester': '2025-2', 'score': 3.5, 'grade': 'B+'},
+            {'student_id': '2020001', 'subject_code': 'COMP101', 'semester': '2020-1', 'score': 3.0, 'grade': 'B'},
+            {'student_id': '2020001', 'subject_code': 'ELEC101', 'semester': '2025-2', 'score': 3.0, 'grade': 'B'},
+            {'student_id': '2020001', 'subject_code': 'COMP201', 'semester': '2025-2', 'score': 9.0, 'grade': 'A'}
+        ]
+        response = self.app.post('/grades/bulk', data=json.dumps(grade_rows), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 201)
+        data = json.loads(response.get_data(as_text=True))
+        self.assertEqual(data['created'], 2)
+        self.assertEqual(data['updated'], 1)
+        self.assertEqual(data['failed'], 2)
+        self.assertEqual([result['status'] for result in data['results']],
+                         ['created', 'created', 'updated', 'error', 'error'])
+
+        grades = self.app.get('/grades/subject/자료구조?limit=1000', headers=headers).get_json()['items']
+        self.assertIn(('2020002', '2025-2'), [(grade['student_id'], grade['semester']) for grade in grades])
+
+    # 이미 있는 성적과 겹치는 업로드는 점수와 학점을 수정하고, 요청 안의 중복 행은 거부
+    def test_bulk_add_grades_overlap(self):
+        headers = self.login('P001', 'professor')
+        grade_rows = [
+            {'student_id': '2020002', 'subject_code': 'COMP201', 'semester': '2025-2', 'score': 4.0, 'grade': 'A'},
+            {'student_id': '2020003', 'subject_code': 'COMP201', 'semester': '2025-2', 'score': 3.5, 'grade': 'B+'}
+        ]
+        response = self.app.post('/grades/bulk', data=json.dumps(grade_rows), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 201)
+
+        grade_rows[1] = {**grade_rows[1], 'score': 2.0, 'grade': 'C'}
+        grade_rows.append({**grade_rows[0], 'score': 1.0, 'grade': 'D'})
+        response = self.app.post('/grades/bulk', data=json.dumps(grade_rows), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([result['status'] for result in response.get_json()['results']], ['updated', 'updated', 'error'])
+
+        grades = self.app.get('/grades/subject/자료구조?limit=1000', headers=headers).get_json()['items']
+        saved = {grade['student_id']: (grade['score'], grade['grade']) for grade in grades if grade['semester'] == '2025-2'}
+        self.assertEqual(saved, {'2020002': (4.0, 'A'), '2020003': (2.0, 'C')})
+
+    # 이미 있는 성적을 덮어쓴 행은 created가 아닌 updated로 보고
+    def test_bulk_add_grades_updated(self):
+        headers = self.login('P001', 'professor')
+        grade_rows = [
+            {'student_id': '2020001', 'subject_code': 'COMP101', 'semester': '2020-1', 'score': 2.5, 'grade': 'C+'},
+            {'student_id': '2020003', 'subject_code': 'COMP101', 'semester': '2025-2', 'score': 3.0, 'grade': 'B'}
+        ]
+        response = self.app.post('/grades/bulk', data=json.dumps(grade_rows), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 201)
+        data = response.get_json()
+        self.assertEqual((data['created'], data['updated'], data['failed']), (1, 1, 0))
+        self.assertEqual([result['status'] for result in data['results']], ['updated', 'created'])
+
+        saved = [(grade['score'], grade['grade']) for grade in self.app.get('/grades/student/2020001', headers=headers).get_json()
+                 if grade['subject_code'] == 'COMP101' and grade['semester'] == '2020-1']
+        self.assertEqual(saved, [(2.5, 'C+')])
+
+    # CSV 업로드 및 학생 권한 차단
+    def test_bulk_add_grades_csv(self):
+        csv_body = 'student_id,subject_code,semester,score,grade\n2020003,COMP301,2025-2,4.5,A+\n'
+        response = self.app.post('/grades/bulk', data=csv_body, content_type='text/csv',
+                                 headers=self.login('2020001', 'student'))
+        self.assertEqual(response.status_code, 403)
+
+        response = self.app.post('/grades/bulk', data=csv_body, content_type='text/csv',
+                                 headers=self.login('A001', 'admin'))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(json.loads(response.get_data(as_text=True))['created'], 1)
+
+# 학생별 성적 요약 테스트
+class TestGradeSummaryAPI(ApiTestCase):
+    # 학생 본인 요약 조회 성공, 다른 학생 요약 조회 실패
+    def test_get_summary(self):
+        headers = self.login('2020002', 'student')
+        response = self.app.get('/grades/summary/2020002', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.get_data(as_text=True))
+        grades = self.app.get('/grades/student/2020002', headers=headers).get_json()
+        self.assertEqual({summary['semester'] for summary in data['semesters']},
+                         {grade['semester'] for grade in grades})
+        self.assertEqual(data['cumulative']['semester'], 'TOTAL')
+
+        response = self.app.get('/grades/summary/2020001', headers=headers)
+        self.assertEqual(response.status_code, 403)
+
+    # 성적 수정 시 요약이 같은 요청에서 갱신됨
+    def test_summary_updated_on_grade_change(self):
+        headers = self.login('A001', 'admin')
+        before = self.app.get('/grades/summary/2019002', headers=headers).get_json()['cumulative']
+
+        # 3학점 과목(MGMT201, 4.5)을 F(0.0)로 수정
+        grade_data = {
+            'score': 0.0,
+            'grade': 'F'
+        }
+        response = self.app.put('/grades/student/2019002/semester/2021-1/subject/MGMT201',
+                                data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 200)
+
+        after = self.app.get('/grades/summary/2019002', headers=headers).get_json()['cumulative']
+        self.assertEqual(after['credits_attempted'], before['credits_attempted'])
+        self.assertEqual(after['credits_earned'], before['credits_earned'] - 3)
+        self.assertLess(after['gpa'], before['gpa'])
+
+    # 처음 반영하는 학기는 요약 행을 입력하고, 이후 변경분은 기존 행에 더함
+    def test_summary_first_grade_upsert(self):
+        with self.flask_app.app_context():
+            apply_grade_change('2020001', '2031-1', 3, new=(4.0, 'A'))
+            apply_grade_change('2020001', '2031-1', subject_credits('COMP101'), new=(0.0, 'F'))
+            rows = {row.semester: (row.credits_attempted, row.credits_earned, row.grade_points)
+                    for row in StudentSemesterSummary.query.filter_by(student_id='2020001')}
+            db.session.rollback()
+        self.assertEqual(rows['2031-1'], (7, 3, 12.0))
+
+# 여러 학생 성적 일괄 조회 테스트
+class TestGradeBatchAPI(ApiTestCase):
+    # 요청한 학번 순서대로 학생별 성적 반환 (학생별 조회 결과와 같음)
+    def test_get_batch_grades(self):
+        headers = self.login('P001', 'professor')
+        response = self.app.get('/grades/students?ids=2020002,2020001,2020002,NOBODY', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual([student['student_id'] for student in data], ['2020002', '2020001', 'NOBODY'])
+        for student in data[:2]:
+            grades = self.app.get(f"/grades/student/{student['student_id']}", headers=headers).get_json()
+            self.assertEqual(sorted(grade['id'] for grade in student['grades']), sorted(grade['id'] for grade in grades))
+        self.assertEqual(data[2]['grades'], [])
+
+        response = self.app.get('/grades/students?ids=2020001&semester=2020-1', headers=headers)
+        self.assertEqual({grade['semester'] for grade in response.get_json()[0]['grades']}, {'2020-1'})
+
+    # 학생은 본인 학번만 조회 가능
+    def test_get_batch_grades_student(self):
+        headers = self.login('2020001', 'student')
+        self.assertEqual(self.app.get('/grades/students?ids=2020001', headers=headers).status_code, 200)
+        self.assertEqual(self.app.get('/grades/students?ids=2020001,2020002', headers=headers).status_code, 403)
+
+    # 학번 목록이 비었거나 최대 학생 수를 넘으면 실패
+    def test_get_batch_grades_invalid(self):
+        headers = self.login('A001', 'admin')
+        self.assertEqual(self.app.get('/grades/students?ids=,', headers=headers).status_code, 400)
+        ids = ','.join(str(index) for index in range(501))
+        self.assertEqual(self.app.get(f'/grades/students?ids={ids}', headers=headers).status_code, 400)
+
+# 과목별 성적 통계 테스트
+class TestGradeStatisticsAPI(ApiTestCase):
+    # 담당 교수의 통계 조회, 담당하지 않은 과목 조회 실패
+    def test_get_statistics(self):
+        headers = self.login('P001', 'professor')
+        response = self.app.get('/grades/statistics/subject/COMP101/semester/2022-1', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.get_data(as_text=True))
+        self.assertEqual(data['count'], 2)
+        self.assertAlmostEqual(data['mean'], 4.25)
+        self.assertEqual(sum(bin['count'] for bin in data['histogram']), 2)
+
+        response = self.app.get('/grades/statistics/subject/ELEC101/semester/2022-1', headers=headers)
+        self.assertEqual(response.status_code, 403)
+
+    # 성적 수정 후 캐시된 통계가 무효화됨
+    def test_statistics_invalidated_on_update(self):
+        headers = self.login('A001', 'admin')
+        url = '/grades/statistics/subject/COMP101/semester/2022-1'
+        self.assertAlmostEqual(self.app.get(url, headers=headers).get_json()['mean'], 4.25)
+
+        grade_data = {
+            'score': 0.0,
+            'grade': 'F'
+        }
+        self.app.put('/grades/student/2022001/semester/2022-1/subject/COMP101',
+                     data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.assertAlmostEqual(self.app.get(url, headers=headers).get_json()['mean'], 2.0)
+
+# 성적 조회 ETag/조건부 조회 테스트
+class TestGradeConditionalGet(ApiTestCase):
+    # 같은 ETag면 304, 성적 수정 후에는 새 ETag로 200
+    def test_etag_changes_on_grade_update(self):
+        headers = self.login('A001', 'admin')
+        url = '/grades/semester/2021-1'
+        response = self.app.get(url, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+
+        response = self.app.get(url, headers={**headers, 'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+
+        grade_data = {
+            'score': 1.0,
+            'grade': 'D'
+        }
+        response = self.app.put('/grades/student/2019002/semester/2021-1/subject/MGMT201',
+                                data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.app.get(url, headers={**headers, 'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    # ETag는 사용자별로 다름 (다른 사용자의 캐시된 응답 재사용 방지)
+    def test_etag_differs_by_user(self):
+        admin_etag = self.app.get('/grades/semester/2021-1', headers=self.login('A001', 'admin')).headers['ETag']
+        headers = self.login('P001', 'professor')
+        response = self.app.get('/grades/semester/2021-1', headers={**headers, 'If-None-Match': admin_etag})
+        self.assertEqual(response.status_code, 200)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
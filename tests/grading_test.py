@@ -0,0 +1,164 @@
+import unittest
+from flask import json
+from sqlalchemy import insert
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import db
+from app.models import User, Grade, StudentSemesterSummary
+from app.grading import compute_letters, normalize_rules, DEFAULT_RULES
+from app.summary import rebuild as rebuild_summary
+from app.query_counter import count_queries
+from helpers import ApiTestCase
+
+# 학점 계산 테스트
+class TestComputeLetters(unittest.TestCase):
+    # 점수 기준: 기준 이상이면 해당 학점, 모든 기준 미만이면 else 학점
+    def test_absolute(self):
+        rules = DEFAULT_RULES['absolute']
+        self.assertEqual(compute_letters([4.5, 4.2, 4.0, 3.99, 1.0, 0.5], 'absolute', rules),
+                         ['A+', 'A', 'A', 'B+', 'D', 'F'])
+
+    # 석차 비율: 높은 점수부터 비율대로, 동점자는 같은 학점
+    def test_relative(self):
+        rules = {'quotas': [['A', 0.2], ['B', 0.3]], 'else': 'C'}
+        scores = [4.5, 4.0, 3.5, 3.5, 3.0, 2.5, 2.0, 1.5, 1.0, 0.5]
+        self.assertEqual(compute_letters(scores, 'relative', rules),
+                         ['A', 'A', 'B', 'B', 'B', 'C', 'C', 'C', 'C', 'C'])
+        self.assertEqual(compute_letters([3.0, 3.0, 3.0], 'relative', rules), ['A', 'A', 'A'])
+
+    # 표준 점수 기준 (모든 점수가 같으면 z = 0)
+    def test_zscore(self):
+        rules = {'cutoffs': [[1.0, 'A'], [0.0, 'B'], [-1.0, 'C']], 'else': 'F'}
+        self.assertEqual(compute_letters([4.0, 3.0, 2.0, 1.0, 0.0], 'zscore', rules), ['A', 'B', 'B', 'C', 'F'])
+        self.assertEqual(compute_letters([3.0, 3.0], 'zscore', rules), ['B', 'B'])
+
+    # 잘못된 정책 기준
+    def test_invalid_rules(self):
+        for method, rules in [('curve', None),
+                              ('absolute', {'cutoffs': [[3.0, 'B'], [4.0, 'A']]}),
+                              ('absolute', {'cutoffs': [[4.0, 'Z']]}),
+                              ('relative', {'quotas': [['A', 0.7], ['B', 0.7]]}),
+                              ('zscore', {'cutoffs': 'A'})]:
+            with self.assertRaises(ValueError):
+                normalize_rules(method, rules)
+
+# 성적 산정 정책 API 테스트
+class TestGradingPolicyAPI(ApiTestCase):
+    # 석차 비율 정책 적용: 미리보기는 저장하지 않고, 적용 시 학점과 조회 결과가 바뀜
+    def test_apply_relative_policy(self):
+        headers = self.login('P001', 'professor')
+        policy = {'method': 'relative', 'rules': {'quotas': [['A+', 0.3]], 'else': 'F'}}
+        response = self.app.put('/grades/policies/COMP101', data=json.dumps(policy),
+                                content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.app.get('/grades/policies/COMP101', headers=headers).get_json()['method'], 'relative')
+
+        before = self.app.get('/grades/subject/C프로그래밍', headers=headers).get_json()['items']
+        url = '/grades/policies/COMP101/semester/2020-1/apply'
+        preview = self.app.post(f'{url}?dry_run=true', headers=headers).get_json()
+        self.assertTrue(preview['dry_run'])
+        self.assertGreater(preview['changed'], 0)
+        self.assertEqual(self.app.get('/grades/subject/C프로그래밍', headers=headers).get_json()['items'], before)
+
+        result = self.app.post(url, headers=headers).get_json()
+        self.assertEqual(result['changed'], preview['changed'])
+        self.assertEqual(sum(result['distribution'].values()), result['count'])
+        self.assertEqual(set(result['distribution']), {'A+', 'F'})
+
+        after = [grade for grade in self.app.get('/grades/subject/C프로그래밍', headers=headers).get_json()['items']
+                 if grade['semester'] == '2020-1']
+        self.assertEqual({grade['grade'] for grade in after}, {'A+', 'F'})
+        self.assertEqual([grade['score'] for grade in after],
+                         [grade['score'] for grade in before if grade['semester'] == '2020-1'])
+
+        # 다시 적용하면 바뀌는 성적 없음
+        self.assertEqual(self.app.post(url, headers=headers).get_json()['changed'], 0)
+
+        # 요약은 전체 재계산 결과와 같음
+        with self.flask_app.app_context():
+            summaries = {(row.student_id, row.semester): row.to_dict() for row in StudentSemesterSummary.query}
+            rebuild_summary()
+            rebuilt = {(row.student_id, row.semester): row.to_dict() for row in StudentSemesterSummary.query}
+            db.session.rollback()
+        self.assertEqual(summaries, rebuilt)
+
+    # 점수 기준 정책이 있으면 성적 입력/수정 시 학점을 점수로 계산
+    def test_absolute_policy_on_write(self):
+        headers = self.login('A001', 'admin')
+        policy = {'method': 'absolute'}
+        self.app.put('/grades/policies/ELEC101', data=json.dumps(policy), content_type='application/json', headers=headers)
+
+        grade_data = {'student_id': '2022001', 'subject_code': 'ELEC101', 'semester': '2024-1', 'score': 3.7, 'grade': 'A+'}
+        response = self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()['grade'], 'B+')
+
+        response = self.app.put('/grades/student/2022001/semester/2024-1/subject/ELEC101',
+                                data=json.dumps({'score': 4.1, 'grade': 'F'}), content_type='application/json', headers=headers)
+        self.assertEqual(response.get_json()['grade'], 'A')
+
+        # 일괄 입력도 같은 정책으로 학점을 계산 (정책이 없는 과목은 요청의 학점 그대로)
+        grade_rows = [
+            {'student_id': '2022001', 'subject_code': 'ELEC101', 'semester': '2025-1', 'score': 2.2, 'grade': 'A+'},
+            {'student_id': '2022002', 'subject_code': 'ELEC101', 'semester': '2025-1', 'score': 4.5, 'grade': 'F'},
+            {'student_id': '2022001', 'subject_code': 'COMP301', 'semester': '2025-1', 'score': 2.2, 'grade': 'A+'}
+        ]
+        response = self.app.post('/grades/bulk', data=json.dumps(grade_rows), content_type='application/json', headers=headers)
+        self.assertEqual(response.get_json()['created'], 3)
+        saved = {(grade['subject_code'], grade['score']): grade['grade']
+                 for grade in self.app.get('/grades/student/2022001', headers=headers).get_json()
+                 if grade['semester'] == '2025-1' and grade['subject_code'] in ('ELEC101', 'COMP301')}
+        self.assertEqual(saved, {('ELEC101', 2.2): 'C', ('COMP301', 2.2): 'A+'})
+        saved = [grade['grade'] for grade in self.app.get('/grades/student/2022002', headers=headers).get_json()
+                 if grade['semester'] == '2025-1' and grade['subject_code'] == 'ELEC101']
+        self.assertEqual(saved, ['A+'])
+
+    # 담당하지 않은 과목, 학생, 잘못된 정책
+    def test_policy_failure(self):
+        headers = self.login('P001', 'professor')
+        policy = {'method': 'absolute'}
+        response = self.app.put('/grades/policies/ELEC101', data=json.dumps(policy),
+                                content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 403)
+        response = self.app.put('/grades/policies/COMP101', data=json.dumps({'method': 'curve'}),
+                                content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 400)
+        response = self.app.post('/grades/policies/COMP101/semester/2020-1/apply', headers=headers)
+        self.assertEqual(response.status_code, 404)
+
+        headers = self.login('2020001', 'student')
+        self.assertEqual(self.app.get('/grades/policies/COMP101', headers=headers).status_code, 403)
+
+    # 수강생 수와 관계없이 일정한 쿼리 수로 적용 (학생별 UPDATE 없음)
+    def test_apply_query_budget(self):
+        with self.flask_app.app_context():
+            db.session.execute(insert(User), [
+                {'id': f'T{index:05d}', 'role': 'student', 'name': f'T{index:05d}', 'admission_year': 2020,
+                 'password_hash': '-'} for index in range(1500)
+            ])
+            db.session.execute(insert(Grade), [
+                {'student_id': f'T{index:05d}', 'subject_code': 'COMP201', 'semester': '2030-1',
+                 'score': (index % 10) * 0.5, 'grade': 'B'} for index in range(1500)
+            ])
+            rebuild_summary()
+            db.session.commit()
+            engine = db.engine
+
+        headers = self.login('P001', 'professor')
+        policy = {'method': 'zscore'}
+        self.app.put('/grades/policies/COMP201', data=json.dumps(policy), content_type='application/json', headers=headers)
+        with count_queries(engine) as counter:
+            response = self.app.post('/grades/policies/COMP201/semester/2030-1/apply', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['count'], 1500)
+        self.assertGreater(response.get_json()['changed'], 1000)
+        self.assertLessEqual(counter.count, 15, counter.statements)
+
+if __name__ == '__main__':
+    unittest.main()
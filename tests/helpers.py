@@ -0,0 +1,46 @@
+import unittest
+from flask import json
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app, db
+from app.config import config_by_name
+
+# 테스트 공통 도우미
+def login(client, user_id, role):
+    '''로그인 후 인증 헤더 반환 (테스트 계정의 비밀번호는 모두 1234)'''
+    login_data = {
+        'id': user_id,
+        'password': '1234',
+        'role': role
+    }
+    login_response = client.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+    access_token = json.loads(login_response.get_data(as_text=True))['access_token']
+    return {
+        'Authorization': f'Bearer {access_token}'
+    }
+
+class ApiTestCase(unittest.TestCase):
+    '''테스트마다 새 앱(self.flask_app)과 테스트 클라이언트(self.app)를 만드는 API 테스트 기본 클래스'''
+    def app_config(self):
+        '''APP_CONFIG 설정에서 바꿀 항목 (하위 클래스에서 재정의)'''
+        return {}
+
+    def setUp(self):
+        overrides = self.app_config()
+        config = None
+        if overrides:
+            config = type('TestConfig', (config_by_name[os.environ['APP_CONFIG']],), overrides)
+        self.flask_app = create_app(config)
+        self.app = self.flask_app.test_client()
+        self.app.testing = True
+        with self.flask_app.app_context():
+            self.engine = db.engine
+
+    def login(self, user_id, role):
+        return login(self.app, user_id, role)
@@ -0,0 +1,181 @@
+import unittest
+import hashlib
+from datetime import datetime, timedelta
+from flask import json
+from sqlalchemy import update, func, select
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import db
+from app.models import Grade, IdempotencyKey, StudentSemesterSummary, DataVersion
+from app.idempotency import prune, PENDING
+from app.summary import rebuild as rebuild_summary
+from app.versions import bump, current_versions, STUDENT, SEMESTER, VERSION_SHARDS
+from app.query_counter import count_queries
+from helpers import ApiTestCase
+
+# Idempotency-Key, 성적 upsert 테스트
+class TestIdempotency(ApiTestCase):
+    def post_grade(self, headers, grade_data, key=None):
+        if key is not None:
+            headers = {**headers, 'Idempotency-Key': key}
+        return self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json', headers=headers)
+
+    def grade_count(self):
+        with self.flask_app.app_context():
+            return db.session.scalar(select(func.count()).select_from(Grade))
+
+    # 같은 키의 재시도는 핸들러를 실행하지 않고 처음 응답을 반환
+    def test_replay(self):
+        headers = self.login('P001', 'professor')
+        grade_data = {'student_id': '2022001', 'subject_code': 'COMP301', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        first = self.post_grade(headers, grade_data, key='retry-1')
+        self.assertEqual(first.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', first.headers)
+        count = self.grade_count()
+
+        with count_queries(self.engine) as counter:
+            second = self.post_grade(headers, grade_data, key='retry-1')
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.get_json(), first.get_json())
+        self.assertEqual(second.headers['Idempotent-Replayed'], 'true')
+        self.assertEqual([statement for statement in counter.statements if not statement.startswith('SELECT')], [])
+        self.assertEqual(self.grade_count(), count)
+
+        # 같은 키로 다른 요청은 거부
+        response = self.post_grade(headers, {**grade_data, 'score': 3.0}, key='retry-1')
+        self.assertEqual(response.status_code, 422)
+
+        # 키는 사용자별로 구분
+        headers = self.login('A001', 'admin')
+        response = self.post_grade(headers, {**grade_data, 'score': 3.0}, key='retry-1')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', response.headers)
+        self.assertEqual(response.get_json()['id'], first.get_json()['id'])
+
+    # 실패 응답은 저장하지 않으며, 보관 시간이 지난 키는 다시 실행
+    def test_failures_and_expiry(self):
+        headers = self.login('P001', 'professor')
+        grade_data = {'student_id': '2022001', 'subject_code': 'ELEC101', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        self.assertEqual(self.post_grade(headers, grade_data, key='retry-2').status_code, 403)
+        self.assertEqual(self.post_grade(headers, grade_data, key='x' * 256).status_code, 400)
+
+        grade_data['subject_code'] = 'COMP301'
+        self.assertEqual(self.post_grade(headers, grade_data, key='retry-2').status_code, 201)
+        with self.flask_app.app_context():
+            db.session.execute(update(IdempotencyKey).values(expires_at=datetime.now() - timedelta(days=1)))
+            db.session.commit()
+        response = self.post_grade(headers, grade_data, key='retry-2')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', response.headers)
+
+        with self.flask_app.app_context():
+            db.session.execute(update(IdempotencyKey).values(expires_at=datetime.now() - timedelta(days=1)))
+            self.assertEqual(prune(), 1)
+            db.session.commit()
+
+    # 처리 중인 키의 재시도는 409, 응답 저장 전에 중단되어 처리 중 시간이 지난 키는 다시 실행
+    def test_pending_key(self):
+        headers = self.login('P001', 'professor')
+        grade_data = {'student_id': '2022001', 'subject_code': 'COMP301', 'semester': '2031-2', 'score': 4.0, 'grade': 'A'}
+        request_hash = hashlib.sha256(b'POST/grades/?\n' + json.dumps(grade_data).encode()).hexdigest()
+        with self.flask_app.app_context():
+            db.session.add(IdempotencyKey(key=hashlib.sha256(b'P001:retry-3').hexdigest(), request_hash=request_hash,
+                                          status_code=PENDING, response='', expires_at=datetime.now() + timedelta(minutes=1)))
+            db.session.commit()
+        count = self.grade_count()
+        self.assertEqual(self.post_grade(headers, grade_data, key='retry-3').status_code, 409)
+        self.assertEqual(self.post_grade(headers, {**grade_data, 'score': 3.0}, key='retry-3').status_code, 422)
+        self.assertEqual(self.grade_count(), count)
+
+        with self.flask_app.app_context():
+            db.session.execute(update(IdempotencyKey).values(expires_at=datetime.now() - timedelta(seconds=1)))
+            db.session.commit()
+        self.assertEqual(self.post_grade(headers, grade_data, key='retry-3').status_code, 201)
+        response = self.post_grade(headers, grade_data, key='retry-3')
+        self.assertEqual(response.headers['Idempotent-Replayed'], 'true')
+
+    # 일괄 입력도 같은 키의 재시도는 다시 실행하지 않고, 커밋 후 실패 응답을 반환한 키는 남기지 않음
+    def test_bulk_replay(self):
+        headers = {**self.login('P001', 'professor'), 'Idempotency-Key': 'bulk-1'}
+        rows = [{'student_id': '2022001', 'subject_code': 'COMP301', 'semester': '2032-1', 'score': 4.0, 'grade': 'A'}]
+        invalid = [{**rows[0], 'score': 9.0}]
+        response = self.app.post('/grades/bulk', data=json.dumps(invalid), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+        first = self.app.post('/grades/bulk', data=json.dumps(rows), content_type='application/json', headers=headers)
+        self.assertEqual(first.status_code, 201)
+        count = self.grade_count()
+        with count_queries(self.engine) as counter:
+            second = self.app.post('/grades/bulk', data=json.dumps(rows), content_type='application/json', headers=headers)
+        self.assertEqual(second.headers['Idempotent-Replayed'], 'true')
+        self.assertEqual(second.get_json(), first.get_json())
+        self.assertEqual([statement for statement in counter.statements if not statement.startswith('SELECT')], [])
+        self.assertEqual(self.grade_count(), count)
+
+    # 같은 성적을 여러 번 입력해도 한 행만 남고 요약은 전체 재계산 결과와 같음
+    def test_upsert_keeps_summary(self):
+        headers = self.login('A001', 'admin')
+        grade_data = {'student_id': '2020001', 'subject_code': 'COMP301', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        count = self.grade_count()
+        with count_queries(self.engine) as counter:
+            for score, grade in [(4.0, 'A'), (0.0, 'F'), (3.5, 'B+')]:
+                self.assertEqual(self.post_grade(headers, {**grade_data, 'score': score, 'grade': grade}).status_code, 201)
+        self.assertEqual(self.grade_count(), count + 1)
+        # 성적 ID와 이전 값은 upsert 한 문장의 결과로 받아 요약은 변경분만 반영 (요약 재계산, 성적 조회 없음)
+        statements = [' '.join(statement.split()) for statement in counter.statements]
+        self.assertFalse([statement for statement in statements if 'GROUP BY' in statement or
+                          statement.startswith(('DELETE FROM student_semester_summary', 'SELECT grades.', 'UPDATE grades'))],
+                         statements)
+        self.assertEqual(len([statement for statement in statements if statement.startswith('INSERT INTO grades')]), 3)
+
+        with self.flask_app.app_context():
+            summaries = {(row.student_id, row.semester): row.to_dict() for row in StudentSemesterSummary.query}
+            rebuild_summary()
+            rebuilt = {(row.student_id, row.semester): row.to_dict() for row in StudentSemesterSummary.query}
+            db.session.rollback()
+        self.assertEqual(summaries, rebuilt)
+        self.assertEqual(summaries[('2020001', '2031-1')]['gpa'], 3.5)
+
+    # 없는 학생, 컬럼 길이를 넘는 학기는 입력 전에 거부
+    def test_upsert_validation(self):
+        headers = self.login('A001', 'admin')
+        grade_data = {'student_id': '2020001', 'subject_code': 'COMP301', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        count = self.grade_count()
+        self.assertEqual(self.post_grade(headers, {**grade_data, 'student_id': '2099999'}).status_code, 404)
+        self.assertEqual(self.post_grade(headers, {**grade_data, 'student_id': 'P001'}).status_code, 404)
+        self.assertEqual(self.post_grade(headers, {**grade_data, 'subject_code': 'NONE101'}).status_code, 404)
+        self.assertEqual(self.post_grade(headers, {**grade_data, 'semester': '2031-1st'}).status_code, 400)
+        self.assertEqual(self.grade_count(), count)
+
+    # 버전 upsert: 처음 올리면 1, 이후 1씩 증가
+    def test_bump_upsert(self):
+        with self.flask_app.app_context():
+            bump((STUDENT, 'X001'), (STUDENT, 'X002'))
+            bump((STUDENT, 'X001'))
+            db.session.commit()
+            versions = dict(db.session.execute(
+                select(DataVersion.name, DataVersion.version).where(DataVersion.name.in_(['X001', 'X002']))
+            ).all())
+        self.assertEqual(versions, {'X001': 2, 'X002': 1})
+
+    # 학기/과목 버전은 여러 행에 나누어 올리며, 조회 버전은 모든 행의 합
+    def test_bump_sharded(self):
+        with self.flask_app.app_context():
+            for _ in range(40):
+                bump((SEMESTER, '2031-9'))
+            db.session.commit()
+            rows = db.session.scalar(select(func.count()).select_from(DataVersion).where(
+                DataVersion.scope == SEMESTER, DataVersion.name.like('2031-9%')
+            ))
+            self.assertEqual(current_versions([(STUDENT, 'NOBODY'), (SEMESTER, '2031-9')]), [0, 40])
+        self.assertGreater(rows, 1)
+        self.assertLessEqual(rows, VERSION_SHARDS)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import shutil
+import subprocess
+import tempfile
+from flask import json
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app
+from app.config import config_by_name
+
+try:
+    from prometheus_client.parser import text_string_to_metric_families
+except ImportError:
+    text_string_to_metric_families = None
+
+def metrics_config():
+    return type('MetricsTestConfig', (config_by_name[os.environ['APP_CONFIG']],), {'METRICS_ENABLED': True})
+
+# 지표 텍스트에서 이름과 라벨이 일치하는 값 (없으면 0)
+def sample_value(text, name, **labels):
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if sample.name == name and all(sample.labels.get(key) == value for key, value in labels.items()):
+                return sample.value
+    return 0.0
+
+# Prometheus 지표 테스트
+@unittest.skipIf(text_string_to_metric_families is None, 'prometheus_client가 설치되어 있지 않습니다.')
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app(metrics_config()).test_client()
+
+    def login(self, user_id, password, role):
+        data = {'id': user_id, 'password': password, 'role': role}
+        return self.client.post('/auth/login', data=json.dumps(data), content_type='application/json')
+
+    def scrape(self):
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        return response.get_data(as_text=True)
+
+    # 네임스페이스/리소스별 요청 수와 지연 시간, SQL 실행 수 기록
+    def test_request_and_db_metrics(self):
+        before = self.scrape()
+        access_token = json.loads(self.login('A001', '1234', 'admin').get_data(as_text=True))['access_token']
+        self.client.get('/grades/semester/2021-1', headers={'Authorization': f'Bearer {access_token}'})
+        self.client.get('/grades/semester/2021-1')  # 인증 헤더 없음 (500)
+        after = self.scrape()
+
+        labels = {'namespace': 'grades', 'resource': 'GradesBySemester', 'method': 'GET'}
+        for status in ('200', '500'):
+            self.assertEqual(sample_value(after, 'http_requests_total', status=status, **labels)
+                             - sample_value(before, 'http_requests_total', status=status, **labels), 1)
+        self.assertEqual(sample_value(after, 'http_request_duration_seconds_count', **labels)
+                         - sample_value(before, 'http_request_duration_seconds_count', **labels), 2)
+        self.assertGreater(sample_value(after, 'db_statements_total', engine='default'),
+                           sample_value(before, 'db_statements_total', engine='default'))
+        # /metrics 요청 자체는 기록하지 않음
+        self.assertEqual(sample_value(after, 'http_requests_total', resource='metrics'), 0)
+
+    # 로그인 결과별 횟수 기록
+    def test_login_counters(self):
+        before = self.scrape()
+        self.login('A001', '1234', 'admin')
+        self.login('A001', 'wrong', 'admin')
+        self.login('NOBODY', '1234', 'admin')
+        self.login('A001', '1234', 'student')
+        after = self.scrape()
+        for result in ('success', 'bad_password', 'unknown_user', 'role_mismatch'):
+            self.assertEqual(sample_value(after, 'auth_logins_total', result=result)
+                             - sample_value(before, 'auth_logins_total', result=result), 1)
+
+    # 지표를 켜지 않으면 /metrics 없음
+    def test_disabled_by_default(self):
+        client = create_app().test_client()
+        self.assertEqual(client.get('/metrics').status_code, 404)
+
+    # 다중 워커 모드: 프로세스별로 기록한 값을 /metrics에서 합산
+    def test_multiprocess_aggregation(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=directory, METRICS_ENABLED='true')
+        worker = (
+            "from app import create_app\n"
+            "client = create_app().test_client()\n"
+            "client.post('/auth/login', json={'id': 'A001', 'password': 'wrong', 'role': 'admin'})\n"
+            "print(client.get('/metrics').get_data(as_text=True))\n"
+        )
+        for _ in range(2):
+            output = subprocess.run([sys.executable, '-c', worker], cwd=ROOT, env=env, check=True,
+                                    capture_output=True, text=True).stdout
+        self.assertEqual(sample_value(output, 'auth_logins_total', result='bad_password'), 2)
+
+if __name__ == '__main__':
+    unittest.main()
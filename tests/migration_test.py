@@ -0,0 +1,59 @@
+import unittest
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, inspect, text
+from app.migrations import upgrade, current_version, load_migrations, MigrationError
+
+# 마이그레이션 테스트
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+
+    # 빈 데이터베이스에 모든 마이그레이션 적용
+    def test_upgrade_applies_all_versions(self):
+        applied = upgrade(self.engine)
+        self.assertEqual(applied, [migration.version for migration in load_migrations()])
+
+        with self.engine.connect() as conn:
+            self.assertEqual(current_version(conn), applied[-1])
+            indexes = {index['name']: index for index in inspect(conn).get_indexes('grades')}
+        self.assertIn('ix_grades_semester', indexes)
+        self.assertIn('ix_grades_subject_semester', indexes)
+        self.assertTrue(indexes['uq_grades_student_subject_semester']['unique'])
+        with self.engine.connect() as conn:
+            columns = {column['name'] for column in inspect(conn).get_columns('grades')}
+        self.assertTrue({'previous_score', 'previous_grade'} <= columns)
+
+    # 이미 적용된 마이그레이션은 다시 적용하지 않음
+    def test_upgrade_is_idempotent(self):
+        upgrade(self.engine, target=1)
+        self.assertEqual(upgrade(self.engine)[0], 2)
+        self.assertEqual(upgrade(self.engine), [])
+
+    # 중복 성적이 있으면 인덱스를 만들지 않고 중복 키를 알려주며 중단
+    def test_duplicate_grades_abort(self):
+        upgrade(self.engine, target=1)
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO users (id, role, name, admission_year, password_hash) VALUES ('2020001', 'student', '학생', 2020, '-')"))
+            conn.execute(text("INSERT INTO subjects (code, name, credits) VALUES ('COMP101', 'C프로그래밍', 3)"))
+            for score in (3.0, 4.0):
+                conn.execute(text("INSERT INTO grades (student_id, subject_code, semester, score, grade) "
+                                  "VALUES ('2020001', 'COMP101', '2020-1', :score, 'A')"), {'score': score})
+
+        with self.assertRaises(MigrationError) as context:
+            upgrade(self.engine)
+        self.assertIn('(2020001, COMP101, 2020-1): 2건', str(context.exception))
+        with self.engine.connect() as conn:
+            self.assertEqual(current_version(conn), 1)
+            self.assertEqual([index['name'] for index in inspect(conn).get_indexes('grades')
+                              if index['name'].startswith(('ix_', 'uq_'))], [])
+
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM grades WHERE score = 3.0"))
+        self.assertEqual(upgrade(self.engine)[0], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import shutil
+import tempfile
+from flask import json
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app
+from app.config import config_by_name
+
+# 요청별 성능 측정 테스트
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_client(self, **config):
+        base = config_by_name[os.environ['APP_CONFIG']]
+        config_class = type('ProfilingTestConfig', (base,), {'PROFILING_DIR': self.directory, **config})
+        client = create_app(config_class).test_client()
+        login_data = {
+            'id': 'A001',
+            'password': '1234',
+            'role': 'admin'
+        }
+        login_response = client.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        access_token = json.loads(login_response.get_data(as_text=True))['access_token']
+        return client, {'Authorization': f'Bearer {access_token}'}
+
+    # 측정 시 Server-Timing 헤더에 DB, 직렬화, 전체 시간 포함
+    def test_server_timing_header(self):
+        client, headers = self.make_client(PROFILING_ENABLED=True, PROFILING_SLOW_MS=60000)
+        response = client.get('/grades/semester/2021-1', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        timing = response.headers['Server-Timing']
+        for metric in ('db;dur=', 'serialize;dur=', 'app;dur=', 'total;dur='):
+            self.assertIn(metric, timing)
+        self.assertNotIn('db;dur=0.00;desc="0 queries"', timing)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    # 느린 요청은 cProfile 결과와 SQL을 저장하고, 최대 파일 수를 넘으면 오래된 것부터 삭제
+    def test_slow_request_capture(self):
+        client, headers = self.make_client(PROFILING_ENABLED=True, PROFILING_CAPTURE=True, PROFILING_CAPTURE_SAMPLE=1,
+                                           PROFILING_SLOW_MS=0, PROFILING_MAX_FILES=2)
+        for semester in ('2020-1', '2020-2', '2021-1'):
+            client.get(f'/grades/semester/{semester}', headers=headers)
+
+        captures = sorted(os.listdir(self.directory))
+        self.assertEqual(len([name for name in captures if name.endswith('.json')]), 2)
+        self.assertEqual(len([name for name in captures if name.endswith('.prof')]), 2)
+        with open(os.path.join(self.directory, captures[-2]), encoding='utf-8') as f:
+            capture = json.load(f)
+        self.assertEqual(capture['path'], '/grades/semester/2021-1?')
+        self.assertGreater(len(capture['statements']), 0)
+
+    # cProfile은 기본으로 실행하지 않고 느린 요청의 SQL만 저장
+    def test_capture_off_by_default(self):
+        client, headers = self.make_client(PROFILING_ENABLED=True, PROFILING_SLOW_MS=0)
+        client.get('/grades/semester/2021-1', headers=headers)
+        captures = os.listdir(self.directory)
+        self.assertGreater(len([name for name in captures if name.endswith('.json')]), 0)
+        self.assertEqual([name for name in captures if name.endswith('.prof')], [])
+
+    # 측정을 켜지 않으면 헤더 없음
+    def test_disabled_by_default(self):
+        client, headers = self.make_client()
+        response = client.get('/grades/semester/2021-1', headers=headers)
+        self.assertNotIn('Server-Timing', response.headers)
+
+if __name__ == '__main__':
+    unittest.main()
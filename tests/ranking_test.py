@@ -0,0 +1,130 @@
+import unittest
+from flask import json
+from sqlalchemy import insert
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import db
+from app.models import User, Grade
+from app.ranking import RankIndex
+from app.summary import rebuild as rebuild_summary
+from helpers import ApiTestCase
+
+# 순위 인덱스 테스트
+class TestRankIndex(unittest.TestCase):
+    # 동점자는 같은 순위, 값 변경/삭제 후에도 정렬 유지
+    def test_rank_and_update(self):
+        index = RankIndex({'a': 4.0, 'b': 3.5, 'c': 4.0, 'd': 1.0})
+        self.assertEqual(index.rank('a'), {'value': 4.0, 'rank': 1, 'total': 4, 'percentile': 75.0})
+        self.assertEqual(index.rank('c')['rank'], 1)
+        self.assertEqual(index.rank('b')['rank'], 3)
+        self.assertEqual(index.rank('d'), {'value': 1.0, 'rank': 4, 'total': 4, 'percentile': 0.0})
+        self.assertIsNone(index.rank('e'))
+
+        index.set('d', 4.5)
+        index.set('a', None)
+        index.set('e', 2.0)
+        self.assertEqual([index.rank(key)['rank'] for key in 'bcde'], [3, 2, 1, 4])
+        self.assertIsNone(index.rank('a'))
+
+# 순위 API 테스트 (창 함수 / 순위 인덱스)
+class TestRankAPI(ApiTestCase):
+    BACKEND = 'window'
+
+    def app_config(self):
+        return {'RANKING_BACKEND': self.BACKEND}
+
+    def setUp(self):
+        super().setUp()
+
+        # 같은 학과/입학년도 학생 20명, 일부 동점
+        with self.flask_app.app_context():
+            db.session.execute(insert(User), [
+                {'id': f'R{index:03d}', 'role': 'student', 'name': f'R{index:03d}', 'department': '순위학과',
+                 'admission_year': 2030, 'password_hash': '-'} for index in range(20)
+            ])
+            db.session.execute(insert(Grade), [
+                {'student_id': f'R{index:03d}', 'subject_code': 'COMP201', 'semester': '2030-1',
+                 'score': (index % 8) * 0.5, 'grade': 'B'} for index in range(20)
+            ])
+            rebuild_summary()
+            db.session.commit()
+
+    def expected(self, scores, student_id):
+        value = scores[student_id]
+        rank = 1 + sum(1 for other in scores.values() if other > value)
+        return {'value': value, 'rank': rank, 'total': len(scores),
+                'percentile': round(100 * (len(scores) - rank) / len(scores), 1)}
+
+    def subject_rank(self, student_id, headers):
+        return self.app.get(f'/grades/rank/subject/COMP201/semester/2030-1/student/{student_id}', headers=headers)
+
+    # 과목 점수 순위: 직접 계산한 결과와 같고, 성적 수정 후 다시 조회하면 반영됨
+    def test_subject_rank(self):
+        headers = self.login('P001', 'professor')
+        scores = {f'R{index:03d}': (index % 8) * 0.5 for index in range(20)}
+        for student_id in scores:
+            response = self.subject_rank(student_id, headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['rank'], self.expected(scores, student_id))
+
+        response = self.app.put('/grades/student/R000/semester/2030-1/subject/COMP201',
+                                data=json.dumps({'score': 4.5, 'grade': 'A+'}), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        scores['R000'] = 4.5
+        for student_id in ('R000', 'R007', 'R003'):
+            self.assertEqual(self.subject_rank(student_id, headers).get_json()['rank'], self.expected(scores, student_id))
+
+        self.assertEqual(self.subject_rank('2020001', headers).status_code, 404)
+
+    # 학과/입학년도 누적 평점 순위 (성적 수정 후 반영)
+    def test_student_rank(self):
+        headers = self.login('A001', 'admin')
+        scores = {f'R{index:03d}': (index % 8) * 0.5 for index in range(20)}
+        body = self.app.get('/grades/rank/student/R005', headers=headers).get_json()
+        self.assertEqual(body['department'], '순위학과')
+        self.assertEqual(body['department_rank'], self.expected(scores, 'R005'))
+        self.assertEqual(body['cohort_rank'], self.expected(scores, 'R005'))
+
+        self.app.put('/grades/student/R005/semester/2030-1/subject/COMP201',
+                     data=json.dumps({'score': 0.0, 'grade': 'F'}), content_type='application/json', headers=headers)
+        scores['R005'] = 0.0
+        body = self.app.get('/grades/rank/student/R005', headers=headers).get_json()
+        self.assertEqual(body['department_rank'], self.expected(scores, 'R005'))
+        self.assertEqual(body['cohort_rank'], self.expected(scores, 'R005'))
+
+    # 권한: 학생은 자신의 순위만, 교수는 담당 과목만
+    def test_permissions(self):
+        headers = self.login('2020001', 'student')
+        self.assertEqual(self.app.get('/grades/rank/student/2020002', headers=headers).status_code, 403)
+        self.assertEqual(self.app.get('/grades/rank/student/2020001', headers=headers).status_code, 200)
+        self.assertEqual(self.subject_rank('R001', headers).status_code, 403)
+
+        headers = self.login('P002', 'professor')
+        self.assertEqual(self.subject_rank('R001', headers).status_code, 403)
+        self.assertEqual(self.app.get('/grades/rank/student/P001', headers=headers).status_code, 404)
+
+class TestRankIndexAPI(TestRankAPI):
+    BACKEND = 'index'
+
+    # 순위 인덱스는 변경된 학생만 다시 읽어 갱신
+    def test_incremental_refresh(self):
+        headers = self.login('P001', 'professor')
+        self.subject_rank('R001', headers)
+        with self.flask_app.app_context():
+            index = self.flask_app.extensions['rank_indexes'][('course', 'COMP201', '2030-1')]
+
+        self.app.put('/grades/student/R001/semester/2030-1/subject/COMP201',
+                     data=json.dumps({'score': 4.5, 'grade': 'A+'}), content_type='application/json', headers=headers)
+        self.assertEqual(index.dirty, {'R001'})
+        self.assertEqual(self.subject_rank('R001', headers).get_json()['rank']['rank'], 1)
+        self.assertIs(self.flask_app.extensions['rank_indexes'][('course', 'COMP201', '2030-1')], index)
+        self.assertEqual(index.dirty, set())
+
+if __name__ == '__main__':
+    unittest.main()
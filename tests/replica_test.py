@@ -0,0 +1,96 @@
+import unittest
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from flask import json, g
+from flask_jwt_extended import decode_token
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.models import User, Subject, Grade, RevokedToken
+from app.token_blocklist import token_blocklist
+from app.migrations import upgrade
+from helpers import login
+
+# 읽기/쓰기 분리 테스트 (SQLite 파일 두 개를 primary, replica로 사용)
+class TestReadReplicaRouting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        primary = os.path.join(self.directory, 'primary.db')
+        replica = os.path.join(self.directory, 'replica.db')
+
+        config_class = type('ReplicaTestConfig', (TestingConfig,), {
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{primary}',
+            'SQLALCHEMY_BINDS': {'replica': f'sqlite:///{replica}'},
+            'FIXTURE_SQL_PATH': None
+        })
+        self.flask_app = create_app(config_class)
+        with self.flask_app.app_context():
+            upgrade(db.engine)
+            for user_id, role in [('A001', 'admin'), ('P001', 'professor'), ('2020001', 'student')]:
+                user = User(id=user_id, role=role, name=user_id, admission_year=2020)
+                user.set_password('1234')
+                db.session.add(user)
+            db.session.add(Subject(code='COMP101', name='C프로그래밍', credits=4, professor_id='P001'))
+            db.session.add(Grade(student_id='2020001', subject_code='COMP101', semester='2020-1', score=4.0, grade='A'))
+            db.session.commit()
+            db.engines['replica'].dispose()
+
+        # 복제가 끝난 시점의 replica
+        shutil.copy(primary, replica)
+
+    def tearDown(self):
+        with self.flask_app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+        shutil.rmtree(self.directory)
+
+    # 쓰기는 primary, 다른 사용자의 조회는 replica, 쓴 사용자의 조회는 primary
+    def test_read_your_writes(self):
+        admin = self.flask_app.test_client()
+        professor = self.flask_app.test_client()
+        admin_headers = login(admin, 'A001', 'admin')
+        professor_headers = login(professor, 'P001', 'professor')
+
+        grade_data = {
+            'score': 2.0,
+            'grade': 'C'
+        }
+        response = admin.put('/grades/student/2020001/semester/2020-1/subject/COMP101',
+                             data=json.dumps(grade_data), content_type='application/json', headers=admin_headers)
+        self.assertEqual(response.status_code, 200)
+
+        response = admin.get('/grades/student/2020001', headers=admin_headers)
+        self.assertEqual(response.get_json()[0]['grade'], 'C')
+
+        # replica에는 아직 반영되지 않음
+        response = professor.get('/grades/student/2020001', headers=professor_headers)
+        self.assertEqual(response.get_json()[0]['grade'], 'A')
+
+    # 다른 워커가 primary에 기록한 토큰 폐기는 복제본에 반영되기 전이라도 동기화 때 반영
+    def test_blocklist_sync_reads_primary(self):
+        client = self.flask_app.test_client()
+        headers = login(client, 'A001', 'admin')
+        self.assertEqual(client.get('/grades/student/2020001', headers=headers).status_code, 200)
+
+        with self.flask_app.app_context():
+            payload = decode_token(headers['Authorization'].split()[1])
+            db.session.add(RevokedToken(jti=payload['jti'], expires_at=datetime.now() + timedelta(hours=1),
+                                        revoked_at=datetime.now()))
+            db.session.commit()
+
+        # 복제본에서 읽도록 결정된 조회 요청 안에서도 동기화는 primary에서 읽음
+        with self.flask_app.test_request_context('/grades/student/2020001', method='GET'):
+            g.db_use_replica = True
+            token_blocklist().sync()
+            self.assertIn(payload['jti'], token_blocklist()._jtis)
+
+if __name__ == '__main__':
+    unittest.main()
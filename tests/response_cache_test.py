@@ -0,0 +1,126 @@
+import unittest
+import time
+from flask import json
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from sqlalchemy import update
+from app import db
+from app.models import Subject
+from app.response_cache import MemoryCacheBackend, RedisCacheBackend
+from app.versions import bump, SUBJECT, SUBJECTS_CATALOG
+from helpers import ApiTestCase
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+# 메모리 캐시 백엔드 테스트
+class TestMemoryCacheBackend(unittest.TestCase):
+    # 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목 제거
+    def test_lru_eviction(self):
+        cache = MemoryCacheBackend(max_entries=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    # TTL이 지나면 미스
+    def test_ttl(self):
+        cache = MemoryCacheBackend(ttl=0)
+        cache.set('a', 1)
+        time.sleep(0.01)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    # 태그가 같은 항목만 무효화
+    def test_invalidate_by_tag(self):
+        cache = MemoryCacheBackend()
+        cache.set('student', 1, tags=[('student', '2020001'), ('catalog', 'subjects')])
+        cache.set('users', 2, tags=[('catalog', 'users')])
+        cache.invalidate([('catalog', 'subjects')])
+        self.assertIsNone(cache.get('student'))
+        self.assertEqual(cache.get('users'), 2)
+
+    # 저장된 응답의 ETag가 현재 ETag와 다르면 미스
+    def test_stale_etag(self):
+        cache = MemoryCacheBackend()
+        cache.set('a', [{}, 200, {'ETag': '"v1"'}])
+        self.assertIsNotNone(cache.get('a', 'v1'))
+        self.assertIsNone(cache.get('a', 'v2'))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['misses'], 2)
+
+# Redis 캐시 백엔드 테스트 (fakeredis 사용)
+@unittest.skipIf(fakeredis is None, 'fakeredis가 설치되어 있지 않습니다.')
+class TestRedisCacheBackend(unittest.TestCase):
+    def setUp(self):
+        self.cache = RedisCacheBackend(fakeredis.FakeRedis(), ttl=60)
+
+    def test_get_set_invalidate(self):
+        self.cache.set('a', [{'name': '홍길동'}, 200, {}], tags=[('student', '2020001')])
+        self.cache.set('b', [[], 200, {}], tags=[('semester', '2021-1')])
+        self.assertEqual(self.cache.get('a'), [{'name': '홍길동'}, 200, {}])
+
+        self.cache.invalidate([('student', '2020001')])
+        self.assertIsNone(self.cache.get('a'))
+        self.assertIsNotNone(self.cache.get('b'))
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['invalidations']), (2, 1, 1))
+
+# 조회 응답 캐시 API 테스트
+class TestResponseCacheAPI(ApiTestCase):
+    # 같은 조회는 캐시에서 응답하고, 과목 수정 후에는 새 데이터를 응답
+    def test_cache_hit_and_invalidation(self):
+        headers = self.login('A001', 'admin')
+        first = self.app.get('/subjects/C프로그래밍', headers=headers)
+        second = self.app.get('/subjects/C프로그래밍', headers=headers)
+        self.assertEqual(first.get_json(), second.get_json())
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+        stats = self.app.get('/system/cache', headers=headers).get_json()
+        self.assertEqual(stats['hits'], 1)
+
+        subject = dict(first.get_json(), credits=first.get_json()['credits'] + 1)
+        response = self.app.put('/subjects/C프로그래밍', data=json.dumps(subject),
+                                content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 200)
+
+        third = self.app.get('/subjects/C프로그래밍', headers=headers)
+        self.assertEqual(third.get_json()['credits'], subject['credits'])
+        self.assertNotEqual(third.headers['ETag'], first.headers['ETag'])
+        self.assertGreaterEqual(self.app.get('/system/cache', headers=headers).get_json()['invalidations'], 1)
+
+    # 다른 워커의 쓰기로 무효화가 빠진 항목도 버전이 바뀌었으면 사용하지 않음
+    def test_stale_entry_not_served(self):
+        headers = self.login('A001', 'admin')
+        first = self.app.get('/subjects/C프로그래밍', headers=headers)
+        with self.flask_app.app_context():
+            db.session.execute(update(Subject).where(Subject.code == 'COMP101').values(credits=5))
+            bump(SUBJECTS_CATALOG, (SUBJECT, 'COMP101'))
+            db.session.info.pop('changed_markers')
+            db.session.commit()
+
+        # 이전 ETag로 조건부 조회해도 304가 아니라 새 응답
+        second = self.app.get('/subjects/C프로그래밍', headers={**headers, 'If-None-Match': first.headers['ETag']})
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second.headers['ETag'], first.headers['ETag'])
+        stats = self.app.get('/system/cache', headers=headers).get_json()
+        self.assertEqual((stats['hits'], stats['invalidations']), (0, 0))
+
+    # 학생별 캐시는 다른 학생과 공유하지 않음
+    def test_cache_scoped_by_identity(self):
+        self.app.get('/grades/student/2020001', headers=self.login('2020001', 'student'))
+        response = self.app.get('/grades/student/2020001', headers=self.login('2020002', 'student'))
+        self.assertEqual(response.status_code, 403)
+
+if __name__ == '__main__':
+    unittest.main()
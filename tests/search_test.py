@@ -0,0 +1,124 @@
+import unittest
+from flask import json
+from sqlalchemy import insert
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app, db
+from app.config import config_by_name
+from app.models import User
+from app.search import SearchIndex
+from app.versions import bump, USERS_CATALOG
+from app.query_counter import count_queries
+from helpers import ApiTestCase
+
+# 검색 인덱스 테스트
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex([
+            ('2020001', '김학생', ('2020001', '김학생', '컴퓨터공학과')),
+            ('2020002', '이학생', ('2020002', '이학생', '전자공학과')),
+            ('P001', '김교수', ('P001', '김교수', '컴퓨터공학과'))
+        ])
+
+    # 앞부분 일치를 먼저, 부분 일치(한글 음절 2-gram)를 다음에 반환
+    def test_prefix_and_contains(self):
+        self.assertEqual(self.index.search('김', 10), ['김교수', '김학생'])
+        self.assertEqual(self.index.search('p0', 10), ['김교수'])
+        self.assertEqual(self.index.search('공학과', 10), ['김학생', '이학생', '김교수'])
+        self.assertEqual(self.index.search('전자', 10), ['이학생'])
+        self.assertEqual(self.index.search('학생', 10), ['김학생', '이학생'])
+        self.assertEqual(self.index.search('컴퓨터', 1), ['김학생'])
+        self.assertEqual(self.index.search('없는', 10), [])
+        self.assertEqual(self.index.search('  ', 10), [])
+
+    # 항목 추가/수정/삭제 후 결과 반영
+    def test_update(self):
+        self.index.add('2020003', '박학생', ('2020003', '박학생', '전자공학과'))
+        self.index.add('2020002', '이학생', ('2020002', '이학생', '경영학과'))
+        self.index.remove('P001')
+        self.assertEqual(self.index.search('전자', 10), ['박학생'])
+        self.assertEqual(self.index.search('김', 10), ['김학생'])
+        self.assertEqual(len(self.index), 3)
+
+# 검색 API 테스트
+class TestSearchAPI(ApiTestCase):
+    def search(self, headers, **params):
+        return self.app.get('/search/', query_string=params, headers=headers)
+
+    # 과목 코드 앞부분, 과목명 부분 일치
+    def test_search_subjects(self):
+        headers = self.login('2020001', 'student')
+        body = self.search(headers, q='comp3').get_json()
+        self.assertEqual([subject['code'] for subject in body['subjects']], ['COMP301', 'COMP302'])
+        self.assertEqual(body['users'], [])
+
+        body = self.search(headers, q='프로그래밍').get_json()
+        self.assertEqual(body['subjects'][0], {'code': 'COMP101', 'name': 'C프로그래밍', 'credits': 4, 'professor_id': 'P001'})
+
+    # 사용자 검색은 관리자만
+    def test_search_users(self):
+        headers = self.login('A001', 'admin')
+        body = self.search(headers, q='김학생', type='users').get_json()
+        self.assertEqual([user['id'] for user in body['users']], ['2020001'])
+        self.assertEqual(len(self.search(headers, q='학생', limit=2).get_json()['users']), 2)
+        self.assertEqual(self.search(headers, q='학생', limit=0).status_code, 400)
+
+        headers = self.login('P001', 'professor')
+        self.assertEqual(self.search(headers, q='김', type='users').status_code, 403)
+
+    # 같은 워커의 사용자/과목 쓰기는 인덱스를 다시 만들지 않고 해당 항목만 갱신
+    def test_incremental_update(self):
+        headers = self.login('A001', 'admin')
+        self.search(headers, q='김')
+        with self.flask_app.app_context():
+            self.engine = db.engine
+        indexes = dict(self.flask_app.extensions['search_indexes'])
+
+        user_data = {'id': '2030001', 'password': '1234', 'role': 'student', 'name': '홍길동',
+                     'department': '데이터과학과', 'admission_year': 2030}
+        self.assertEqual(self.app.post('/users/', data=json.dumps(user_data), content_type='application/json', headers=headers).status_code, 201)
+        subject_data = {'code': 'DATA101', 'name': '데이터마이닝', 'credits': 3, 'professor_id': 'P001'}
+        self.app.put('/subjects/웹기반시스템', data=json.dumps(subject_data), content_type='application/json', headers=headers)
+
+        with count_queries(self.engine) as counter:
+            body = self.search(headers, q='데이터').get_json()
+        self.assertEqual([user['id'] for user in body['users']], ['2030001'])
+        self.assertEqual([subject['code'] for subject in body['subjects']], ['DATA101', 'COMP202'])
+        self.assertEqual(counter.count, 0, counter.statements)
+        self.assertEqual(self.search(headers, q='웹기반').get_json()['subjects'], [])
+        self.assertEqual(dict(self.flask_app.extensions['search_indexes']), indexes)
+
+        self.app.delete('/users/2030001', headers=headers)
+        self.assertEqual(self.search(headers, q='홍길동').get_json()['users'], [])
+
+    # 다른 워커의 변경은 버전 확인 주기마다 백그라운드에서 다시 만들어 반영
+    def test_sync_other_workers(self):
+        config = type('SearchConfig', (config_by_name[os.environ['APP_CONFIG']],), {'SEARCH_SYNC_INTERVAL': 0})
+        self.flask_app = create_app(config)
+        self.app = self.flask_app.test_client()
+        headers = self.login('A001', 'admin')
+        self.assertEqual(self.search(headers, q='홍길동').get_json()['users'], [])
+
+        # 다른 워커의 쓰기: DB와 버전만 바뀌고 이 워커의 인덱스는 갱신되지 않음
+        with self.flask_app.app_context():
+            db.session.execute(insert(User).values(id='2030002', role='student', name='홍길동',
+                                                   department='데이터과학과', admission_year=2030, password_hash='-'))
+            bump(USERS_CATALOG)
+            db.session.info.pop('changed_markers')
+            db.session.commit()
+        # 요청은 기존 인덱스로 응답하고, 백그라운드에서 다시 만든 인덱스로 교체
+        self.assertEqual(self.search(headers, q='홍길동').get_json()['users'], [])
+        thread, _ = self.flask_app.extensions['search_rebuilds'].get('users', (None, None))
+        if thread is not None:
+            thread.join()
+        self.assertEqual([user['id'] for user in self.search(headers, q='홍길동').get_json()['users']], ['2030002'])
+        self.assertEqual(self.flask_app.extensions['search_rebuilds'], {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app, db
+from app.models import User, Subject, Grade, StudentSemesterSummary
+from app.seed import generate_rows, generate
+
+SMALL = {'students': 40, 'professors': 3, 'subjects': 15, 'grades': 400, 'semesters': 6}
+
+# 합성 데이터 생성 테스트
+class TestSeedGenerate(unittest.TestCase):
+    # 같은 seed면 같은 데이터, 다른 seed면 다른 데이터
+    def test_deterministic(self):
+        first = list(generate_rows(seed=1, **SMALL))
+        self.assertEqual(first, list(generate_rows(seed=1, **SMALL)))
+        self.assertNotEqual(first, list(generate_rows(seed=2, **SMALL)))
+
+    # (학생, 과목, 학기)가 겹치지 않고, 입학 이후 학기에만 수강
+    def test_grades_unique_and_after_admission(self):
+        rows = list(generate_rows(seed=1, **SMALL))
+        admission = {row['id']: row['admission_year'] for model, row in rows if model is User}
+        grades = [row for model, row in rows if model is Grade]
+        keys = {(row['student_id'], row['subject_code'], row['semester']) for row in grades}
+        self.assertEqual(len(keys), len(grades))
+        self.assertTrue(all(int(row['semester'][:4]) >= admission[row['student_id']] for row in grades))
+
+    # 학생이 같은 과목을 두 번 수강하지 않고, 학기당 수강 과목 수는 입학 시기와 관계없이 비슷함
+    def test_courses_per_semester(self):
+        options = dict(SMALL, students=300, subjects=200, grades=9000, semesters=8)
+        rows = list(generate_rows(seed=1, **options))
+        admission = {row['id']: row['admission_year'] for model, row in rows if model is User}
+        grades = [row for model, row in rows if model is Grade]
+        taken = [(row['student_id'], row['subject_code']) for row in grades]
+        self.assertEqual(len(set(taken)), len(taken))
+
+        counts = {}
+        for row in grades:
+            counts[row['student_id']] = counts.get(row['student_id'], 0) + 1
+        per_semester = {}
+        for student_id, year in admission.items():
+            if student_id.startswith('S'):
+                semesters = (2016 + options['semesters'] // 2 - year) * 2
+                per_semester.setdefault(semesters, []).append(counts.get(student_id, 0) / semesters)
+        averages = [sum(values) / len(values) for values in per_semester.values()]
+        self.assertLess(max(averages) / min(averages), 1.3)
+
+    # 배치 입력 후 성적 요약까지 생성
+    def test_generate_loads_rows(self):
+        app = create_app()
+        with app.app_context():
+            grade_count = Grade.query.count()
+            counts = generate(batch_size=100, seed=1, **SMALL)
+            self.assertEqual(counts['users'], SMALL['students'] + SMALL['professors'])
+            self.assertEqual(counts['subjects'], SMALL['subjects'])
+            self.assertEqual(Grade.query.count(), grade_count + counts['grades'])
+            self.assertEqual(Subject.query.filter(Subject.code.like('G%')).count(), SMALL['subjects'])
+            self.assertGreater(StudentSemesterSummary.query.filter(
+                StudentSemesterSummary.student_id.like('S%')).count(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
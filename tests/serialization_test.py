@@ -0,0 +1,39 @@
+import unittest
+import json
+from unittest import mock
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from flask_restx import marshal
+from app import serialization
+from app.serialization import dumps
+from app.routes.grade import grade_model, GradeRow
+
+ROWS = [
+    (1, '2020001', 'COMP101', 'C프로그래밍', '2020-1', 4.0, 'A'),
+    (2, '2020002', 'ELEC101', '과목 이름 없음', '2020-2', None, 'F')
+]
+
+# 빠른 직렬화 경로 테스트
+class TestSerialization(unittest.TestCase):
+    # 행 객체는 모델 필드 순서를 따르고, 인코딩 결과는 marshal 결과와 같음
+    def test_matches_marshal(self):
+        self.assertEqual([field.name for field in GradeRow.__dataclass_fields__.values()], list(grade_model.keys()))
+        expected = marshal([dict(zip(grade_model.keys(), row)) for row in ROWS], grade_model)
+        self.assertEqual(json.loads(dumps([GradeRow(*row) for row in ROWS])), json.loads(json.dumps(expected)))
+
+    # orjson이 없으면 표준 json으로 같은 결과
+    def test_fallback_without_orjson(self):
+        data = {'items': [GradeRow(*row) for row in ROWS], 'next': None}
+        with mock.patch.object(serialization, 'orjson', None):
+            fallback = dumps(data)
+        self.assertEqual(json.loads(fallback), json.loads(dumps(data)))
+        self.assertIn('C프로그래밍'.encode('utf-8'), fallback)
+
+if __name__ == '__main__':
+    unittest.main()
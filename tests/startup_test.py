@@ -0,0 +1,43 @@
+import unittest
+import subprocess
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import create_app, db
+from app.config import ProductionConfig
+
+# 연결할 수 없는 데이터베이스 (연결을 시도하면 실패)
+class UnreachableDatabaseConfig(ProductionConfig):
+    SQLALCHEMY_DATABASE_URI = 'sqlite:////nonexistent-directory/academic_records.db'
+
+# 앱 시작 테스트
+class TestStartup(unittest.TestCase):
+    # 앱 생성 시 DB에 연결하지 않음 (연결했다면 create_app에서 오류 발생)
+    def test_create_app_without_database_connection(self):
+        app = create_app(UnreachableDatabaseConfig)
+        with app.app_context():
+            self.assertEqual(db.engine.pool.checkedin(), 0)
+            self.assertEqual(db.engine.pool.checkedout(), 0)
+
+    # 통계 계산에만 사용하는 NumPy는 앱 생성 시 불러오지 않음 (다른 테스트의 영향이 없도록 새 프로세스에서 확인)
+    def test_create_app_does_not_import_numpy(self):
+        code = (
+            "import sys\n"
+            "from app import create_app\n"
+            "from app.config import ProductionConfig\n"
+            f"ProductionConfig.SQLALCHEMY_DATABASE_URI = {UnreachableDatabaseConfig.SQLALCHEMY_DATABASE_URI!r}\n"
+            "create_app(ProductionConfig)\n"
+            "print('numpy' in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+if __name__ == '__main__':
+    unittest.main()
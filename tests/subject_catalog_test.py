@@ -0,0 +1,126 @@
+import unittest
+from flask import json
+from sqlalchemy import update
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from app import db
+from app.models import Subject, StudentSemesterSummary
+from app.versions import bump, SUBJECTS_CATALOG
+from app.summary import rebuild as rebuild_summary
+from app.query_counter import count_queries
+from helpers import ApiTestCase
+
+# 과목 카탈로그 캐시 테스트
+class TestSubjectCatalog(ApiTestCase):
+    SYNC_INTERVAL = 3600
+
+    def app_config(self):
+        return {'SUBJECT_CATALOG_SYNC_INTERVAL': self.SYNC_INTERVAL}
+
+    def subject_queries(self, counter):
+        # 요약 UPDATE의 학점 서브쿼리는 같은 SQL 문 안에서 실행되므로 제외
+        return [statement for statement in counter.statements
+                if statement.startswith('SELECT') and 'FROM subjects' in statement]
+
+    # 카탈로그를 읽은 뒤에는 조회의 과목 이름/코드 확인에 과목 조회가 없고, 쓰기의 권한 확인은 기본 키 조회 1회
+    def test_no_subject_lookups(self):
+        headers = self.login('P001', 'professor')
+        self.assertEqual(self.app.get('/grades/subject/C프로그래밍', headers=headers).status_code, 200)
+
+        grade_data = {'student_id': '2022001', 'subject_code': 'COMP301', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        with count_queries(self.engine) as counter:
+            self.assertEqual(self.app.get('/grades/subject/자료구조', headers=headers).status_code, 200)
+        self.assertEqual(self.subject_queries(counter), [])
+
+        with count_queries(self.engine) as counter:
+            self.assertEqual(self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json',
+                                           headers=headers).status_code, 201)
+            self.assertEqual(self.app.put('/grades/student/2022001/semester/2031-1/subject/COMP301',
+                                          data=json.dumps({'score': 3.5, 'grade': 'B+'}), content_type='application/json',
+                                          headers=headers).status_code, 200)
+        queries = self.subject_queries(counter)
+        self.assertEqual(len(queries), 2)
+        self.assertTrue(all(query.rstrip().endswith('WHERE subjects.code = ?') for query in queries), queries)
+
+    # 카탈로그가 오래되었어도 쓰기 권한은 현재 담당 교수로 확인하고, 카탈로그에 없는 과목은 DB에서 찾음
+    def test_stale_catalog_writes(self):
+        headers = self.login('P001', 'professor')
+        self.assertEqual(self.app.get('/grades/subject/C프로그래밍', headers=headers).status_code, 200)
+        with self.flask_app.app_context():
+            db.session.execute(update(Subject).where(Subject.code == 'COMP101').values(professor_id='P002'))
+            db.session.add(Subject(code='NEW101', name='신규과목', credits=3, professor_id='P001'))
+            db.session.commit()
+
+        grade_data = {'student_id': '2022001', 'subject_code': 'COMP101', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        response = self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 403)
+        response = self.app.put('/grades/student/2020001/semester/2020-1/subject/COMP101',
+                                data=json.dumps({'score': 4.5, 'grade': 'A+'}), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.app.get('/grades/policies/COMP101', headers=headers).status_code, 403)
+
+        response = self.app.post('/grades/', data=json.dumps({**grade_data, 'subject_code': 'NEW101'}),
+                                 content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.app.get('/grades/subject/신규과목', headers=headers).status_code, 200)
+
+    # 같은 워커의 과목 수정은 커밋 후 바로 반영
+    def test_local_change(self):
+        headers = self.login('A001', 'admin')
+        self.assertEqual(self.app.get('/subjects/C프로그래밍', headers=headers).get_json()['credits'], 4)
+        subject_data = {'code': 'COMP101', 'name': 'C언어', 'credits': 3, 'professor_id': 'P002'}
+        self.app.put('/subjects/C프로그래밍', data=json.dumps(subject_data), content_type='application/json', headers=headers)
+
+        self.assertEqual(self.app.get('/subjects/C프로그래밍', headers=headers).status_code, 404)
+        self.assertEqual(self.app.get('/subjects/C언어', headers=headers).get_json(), subject_data)
+        self.assertEqual(self.app.get('/grades/subject/C언어', headers=headers).status_code, 200)
+
+        headers = self.login('P001', 'professor')
+        self.assertEqual(self.app.get('/grades/subject/C언어', headers=headers).status_code, 403)
+
+    # 다른 워커가 학점을 바꿔 카탈로그가 오래되었어도 요약에는 현재 학점을 사용
+    def test_summary_uses_current_credits(self):
+        headers = self.login('A001', 'admin')
+        self.app.get('/grades/subject/웹기반시스템', headers=headers)
+        with self.flask_app.app_context():
+            db.session.execute(update(Subject).where(Subject.code == 'COMP301').values(credits=5))
+            rebuild_summary()
+            db.session.commit()
+
+        grade_data = {'student_id': '2022001', 'subject_code': 'COMP301', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.app.put('/grades/student/2022001/semester/2031-1/subject/COMP301',
+                     data=json.dumps({'score': 0.0, 'grade': 'F'}), content_type='application/json', headers=headers)
+
+        with self.flask_app.app_context():
+            summaries = {(row.student_id, row.semester): row.to_dict() for row in StudentSemesterSummary.query}
+            rebuild_summary()
+            rebuilt = {(row.student_id, row.semester): row.to_dict() for row in StudentSemesterSummary.query}
+            db.session.rollback()
+        self.assertEqual(summaries, rebuilt)
+        self.assertEqual(summaries[('2022001', '2031-1')]['credits_attempted'], 5)
+
+class TestSubjectCatalogSync(TestSubjectCatalog):
+    SYNC_INTERVAL = 0
+
+    # 다른 워커의 과목 변경은 버전 확인 때 반영
+    def test_other_worker_change(self):
+        headers = self.login('P001', 'professor')
+        self.assertEqual(self.app.get('/grades/subject/C프로그래밍', headers=headers).status_code, 200)
+        with self.flask_app.app_context():
+            db.session.execute(update(Subject).where(Subject.code == 'COMP101').values(professor_id='P002'))
+            bump(SUBJECTS_CATALOG)
+            db.session.info.pop('changed_markers')
+            db.session.commit()
+        grade_data = {'student_id': '2022001', 'subject_code': 'COMP101', 'semester': '2031-1', 'score': 4.0, 'grade': 'A'}
+        response = self.app.post('/grades/', data=json.dumps(grade_data), content_type='application/json', headers=headers)
+        self.assertEqual(response.status_code, 403)
+
+if __name__ == '__main__':
+    unittest.main()
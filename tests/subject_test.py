@@ -5,14 +5,13 @@ import os, sys
 # 프로젝트 루트 디렉토리 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import create_app
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
 
-# 관리자 권한 필요
-class TestSubejctAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
+from helpers import ApiTestCase
 
+# 관리자 권한 필요
+class TestSubejctAPI(ApiTestCase):
     # 모든 과목 조회 
     def test_get_all_subjects(self):
         login_data = {
@@ -95,6 +94,30 @@ class TestSubejctAPI(unittest.TestCase):
         }
         response = self.app.get('/subjects/wrongSubjectName', headers=headers)
         self.assertEqual(response.status_code, 404)
-        
+
+    # 서버 최대 페이지 크기를 넘는 limit 요청
+    def test_get_subjects_max_page_size(self):
+        login_data = {
+            'id': 'A001',
+            'password': '1234',
+            'role': 'admin'
+        }
+        login_response = self.app.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        access_token = json.loads(login_response.get_data(as_text=True))['access_token']
+
+        headers = {
+            'Authorization': f'Bearer {access_token}'
+        }
+        self.flask_app.config['MAX_PAGE_SIZE'] = 3
+        response = self.app.get('/subjects/?limit=100', headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.get_data(as_text=True))
+        self.assertEqual(len(data['items']), 3)
+        self.assertEqual(data['next'], data['items'][-1]['code'])
+
+        response = self.app.get(f"/subjects/?limit=100&after={data['next']}", headers=headers)
+        next_page = json.loads(response.get_data(as_text=True))
+        self.assertGreater(next_page['items'][0]['code'], data['next'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,30 @@
+import unittest
+from flask import json
+import os, sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
+
+from helpers import ApiTestCase
+
+# 관리자 권한 필요
+class TestPoolStatusAPI(ApiTestCase):
+    # 커넥션 풀 상태 조회 성공
+    def test_get_pool_status(self):
+        response = self.app.get('/system/pool', headers=self.login('A001', 'admin'))
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.get_data(as_text=True))
+        self.assertEqual(data['pid'], os.getpid())
+        self.assertGreater(data['checkouts'], 0)
+        self.assertIn('wait_max_ms', data)
+
+    # 커넥션 풀 상태 조회 실패 (권한 부족)
+    def test_get_pool_status_failure(self):
+        response = self.app.get('/system/pool', headers=self.login('2020001', 'student'))
+        self.assertEqual(response.status_code, 403)
+
+if __name__ == '__main__':
+    unittest.main()
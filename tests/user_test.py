@@ -5,14 +5,13 @@ import os, sys
 # 프로젝트 루트 디렉토리 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import create_app
+# MySQL 없이 내장 SQLite로 실행 (APP_CONFIG=production으로 MySQL에서 실행 가능)
+os.environ.setdefault('APP_CONFIG', 'testing')
 
-# 관리자 권한 필요
-class TestUserAPI(unittest.TestCase):
-    def setUp(self):
-        self.app = create_app().test_client()
-        self.app.testing = True
+from helpers import ApiTestCase
 
+# 관리자 권한 필요
+class TestUserAPI(ApiTestCase):
     # 모든 사용자 조회
     def test_all_get_users(self):
         login_data = {
@@ -83,5 +82,31 @@ class TestUserAPI(unittest.TestCase):
         response = self.app.get('/user/1234567', headers=headers)
         self.assertEqual(response.status_code, 404)
 
+    # 커서 기반 페이지네이션으로 모든 사용자 조회
+    def test_get_users_paginated(self):
+        login_data = {
+            'id': 'A001',
+            'password': '1234',
+            'role': 'admin'
+        }
+        login_response = self.app.post('/auth/login', data=json.dumps(login_data), content_type='application/json')
+        access_token = json.loads(login_response.get_data(as_text=True))['access_token']
+
+        headers = {
+            'Authorization': f'Bearer {access_token}'
+        }
+        user_ids = []
+        url = '/users/?limit=5'
+        while url:
+            response = self.app.get(url, headers=headers)
+            self.assertEqual(response.status_code, 200)
+            data = json.loads(response.get_data(as_text=True))
+            self.assertLessEqual(len(data['items']), 5)
+            user_ids.extend(user['id'] for user in data['items'])
+            url = f"/users/?limit=5&after={data['next']}" if data['next'] else None
+
+        self.assertIn('2020001', user_ids)
+        self.assertEqual(user_ids, sorted(set(user_ids)))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file